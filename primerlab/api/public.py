@@ -799,29 +799,32 @@ def score_genotyping_primer_api(
         - warnings: List of warnings
         - recommendations: List of suggestions
     """
-    from primerlab.core.genotyping.allele_scoring import score_allele_discrimination
-    from primerlab.core.genotyping.snp_position import analyze_snp_context
+    from primerlab.core.genotyping import primer_view
+    from primerlab.core.genotyping.allele_scoring import score_allele_discrimination_view
+    from primerlab.core.genotyping.snp_position import analyze_snp_context_view
     from primerlab.core.genotyping.discrimination_tm import (
-        calculate_discrimination_tm,
+        calculate_discrimination_tm_view,
         estimate_allele_specificity,
     )
 
+    # Normalize the primer once for all three analyses
+    primer = primer_view(primer_sequence)
+
     # Score allele discrimination
-    scoring_result = score_allele_discrimination(
-        primer_sequence=primer_sequence,
+    scoring_result = score_allele_discrimination_view(
+        primer,
         snp_position=snp_position,
         ref_allele=ref_allele,
         alt_allele=alt_allele,
     )
 
     # Analyze SNP position
-    primer_len = len(primer_sequence)
-    snp_index = primer_len - 1 - snp_position  # Convert from 3' to 5' index
-    position_result = analyze_snp_context(primer_sequence, snp_index)
+    snp_index = primer.length - 1 - snp_position  # Convert from 3' to 5' index
+    position_result = analyze_snp_context_view(primer, snp_index)
 
     # Calculate Tm discrimination
-    tm_matched, tm_mismatched, delta_tm = calculate_discrimination_tm(
-        primer_sequence=primer_sequence,
+    tm_matched, tm_mismatched, delta_tm = calculate_discrimination_tm_view(
+        primer,
         snp_position=snp_index,
         ref_allele=ref_allele,
         alt_allele=alt_allele,
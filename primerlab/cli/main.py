@@ -2136,13 +2136,13 @@ def main():
         logger = setup_logger(level=logging.INFO)
 
         try:
-            from primerlab.core.database import PrimerDatabase, format_history_table
+            from primerlab.core.database import PrimerDatabase, format_history_table, format_created_at
             import json
 
             db = PrimerDatabase()
 
             if args.history_command == "list":
-                designs = db.search(
+                designs = db.iter_search(
                     gene=args.gene,
                     workflow=args.workflow,
                     limit=args.limit
@@ -2155,7 +2155,7 @@ def main():
                     print(f"\n{'='*60}")
                     print(f"Design #{design['id']} - {design['gene_name']}")
                     print(f"{'='*60}")
-                    print(f"  Created: {design['created_at']}")
+                    print(f"  Created: {format_created_at(design['created_at'])}")
                     print(f"  Workflow: {design['workflow'].upper()}")
                     print(f"\n  Forward Primer:")
                     print(f"    Sequence: {design['fwd_sequence']}")
@@ -2196,8 +2196,7 @@ def main():
 
             else:
                 # No subcommand - show recent
-                designs = db.get_recent(10)
-                print(format_history_table(designs))
+                print(format_history_table(db.iter_recent(10)))
 
             db.close()
             sys.exit(0)
@@ -7,6 +7,9 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# Default and preset configs live in primerlab/config/<name>_default.yaml
+_CONFIG_DIR: Path = Path(__file__).resolve().parent.parent / "config"
+
 def load_yaml(path: str) -> Dict[str, Any]:
     """
     Loads a YAML file safely with enhanced error messages.
@@ -165,8 +168,7 @@ def load_and_merge_config(workflow: str, user_config_path: Optional[str] = None,
     4. Validate.
     """
     # 1. Load Default Config
-    # Assuming default configs are in primerlab/config/<workflow>_default.yaml
-    base_path = Path(__file__).parent.parent / "config" / f"{workflow}_default.yaml"
+    base_path = _CONFIG_DIR / f"{workflow}_default.yaml"
 
     if not base_path.exists():
         raise ConfigError(f"Default config for workflow '{workflow}' not found at {base_path}", "ERR_CONFIG_006")
@@ -207,7 +209,7 @@ def _process_enhancements(config: Dict[str, Any]) -> Dict[str, Any]:
         logger.info(f"Applying preset: {preset}")
 
         # Try to load preset from file first
-        preset_file = Path(__file__).parent.parent / "config" / f"{preset}_default.yaml"
+        preset_file = _CONFIG_DIR / f"{preset}_default.yaml"
 
         if preset_file.exists():
             preset_config = load_yaml(str(preset_file))
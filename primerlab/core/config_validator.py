@@ -6,10 +6,56 @@ Includes Phase 3 parameter validation (max_poly_x, max_ns, included_region,
 forced positions, must_match constraints, qc_method, weights).
 """
 
-from typing import Dict, Any, List, Tuple, Optional
-from dataclasses import dataclass
+import hashlib
+import json
+import threading
+from typing import Dict, Any, Iterator, List, Tuple, Optional
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+# orjson is optional: C-level encoder for to_json()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Allowed values, as ordered tuples for messages and frozensets for lookup
+_GC_CLAMPS = (0, 1, 2, 3)
+_VALID_FORMATS = ("markdown", "json", "csv", "xlsx")
+_VALID_MODES = ("auto", "blast", "biopython")
+_TM_METHODS = ("santalucia", "breslauer")
+_SALT_CORRECTIONS = ("santalucia", "schildkraut", "owczarzy")
+_QC_METHODS = ("threshold", "any")
+
+# Typical concentration ranges for the thermodynamics section
+_THERMO_RANGES = {
+    "salt_monovalent": (0, 1000),
+    "salt_divalent": (0, 100),
+    "dntp_conc": (0, 10),
+    "dna_conc": (0, 10000)
+}
+
+_FORCED_POS_KEYS = (
+    "force_left_start", "force_left_end",
+    "force_right_start", "force_right_end"
+)
+_MATCH_KEYS = ("must_match_five_prime", "must_match_three_prime")
+_VALID_IUPAC = frozenset("NACGTRYSWKMBDHVnacgtrysWkmbdhv")
+_VALID_WEIGHT_KEYS = frozenset((
+    "tm_gt", "tm_lt", "size_gt", "size_lt",
+    "gc_percent_gt", "gc_percent_lt", "end_stability"
+))
+
+# Bounded cache of validate_config() results keyed by config hash
+VALIDATION_CACHE_SIZE = 128
+_CACHE: Dict[str, "ValidationResult"] = {}
+# Serializes eviction so concurrent callers cannot evict the same key
+_CACHE_LOCK = threading.Lock()
+
+# One reusable ConfigValidator per thread (see _get_validator)
+_TLS = threading.local()
+
 
 @dataclass
 class ValidationError:
@@ -42,6 +88,12 @@ class ValidationResult:
             "warnings": [w.to_dict() for w in self.warnings]
         }
 
+    def to_json(self) -> str:
+        """Export to a JSON string, using orjson when it is installed."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict()).decode()
+        return json.dumps(self.to_dict())
+
 
 class ConfigValidator:
     """
@@ -58,12 +110,12 @@ class ConfigValidator:
 
     # Valid values for enum fields
     VALID_VALUES = {
-        "primers.gc_clamp": [0, 1, 2, 3],
-        "output.format": ["markdown", "json", "csv", "xlsx"],
-        "offtarget.mode": ["auto", "blast", "biopython"],
-        "thermodynamics.tm_method": ["santalucia", "breslauer"],
-        "thermodynamics.salt_corrections": ["santalucia", "schildkraut", "owczarzy"],
-        "qc_method": ["threshold", "any"],
+        "primers.gc_clamp": frozenset(_GC_CLAMPS),
+        "output.format": frozenset(_VALID_FORMATS),
+        "offtarget.mode": frozenset(_VALID_MODES),
+        "thermodynamics.tm_method": frozenset(_TM_METHODS),
+        "thermodynamics.salt_corrections": frozenset(_SALT_CORRECTIONS),
+        "qc_method": frozenset(_QC_METHODS),
     }
 
     # Type validators (used for thermodynamics section)
@@ -151,7 +203,7 @@ class ConfigValidator:
 
         # Validate mode
         if "mode" in offtarget:
-            if offtarget["mode"] not in ["auto", "blast", "biopython"]:
+            if offtarget["mode"] not in _VALID_MODES:
                 self.errors.append(ValidationError(
                     path="offtarget.mode",
                     message=f"Invalid mode: {offtarget['mode']}",
@@ -182,8 +234,7 @@ class ConfigValidator:
         if "product_size" in primers:
             ps = primers["product_size"]
             if isinstance(ps, dict):
-                required = ["min", "max"]
-                for key in required:
+                for key in ("min", "max"):
                     if key not in ps:
                         self.warnings.append(ValidationError(
                             path=f"primers.product_size.{key}",
@@ -203,14 +254,7 @@ class ConfigValidator:
     def _validate_thermodynamics(self, thermo: Dict[str, Any]):
         """Validate thermodynamics configuration."""
         # Check numeric types and values
-        numeric_fields = {
-            "salt_monovalent": (0, 1000),
-            "salt_divalent": (0, 100),
-            "dntp_conc": (0, 10),
-            "dna_conc": (0, 10000)
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
+        for field, (min_val, max_val) in _THERMO_RANGES.items():
             if field in thermo:
                 val = thermo[field]
                 if not isinstance(val, (int, float)):
@@ -232,7 +276,7 @@ class ConfigValidator:
                 self.errors.append(ValidationError(
                     path="parameters.thermodynamics.tm_method",
                     message=f"Invalid tm_method: {thermo['tm_method']}",
-                    suggestion=f"Use one of: {', '.join(self.VALID_VALUES['thermodynamics.tm_method'])}"
+                    suggestion=f"Use one of: {', '.join(_TM_METHODS)}"
                 ))
                 
         if "salt_corrections" in thermo:
@@ -240,7 +284,7 @@ class ConfigValidator:
                 self.errors.append(ValidationError(
                     path="parameters.thermodynamics.salt_corrections",
                     message=f"Invalid salt_corrections: {thermo['salt_corrections']}",
-                    suggestion=f"Use one of: {', '.join(self.VALID_VALUES['thermodynamics.salt_corrections'])}"
+                    suggestion=f"Use one of: {', '.join(_SALT_CORRECTIONS)}"
                 ))
 
     def _validate_phase3_params(self, params: Dict[str, Any]):
@@ -312,11 +356,7 @@ class ConfigValidator:
                         ))
 
         # --- Task 3.6: Forced Positions ---
-        forced_pos_keys = [
-            "force_left_start", "force_left_end",
-            "force_right_start", "force_right_end"
-        ]
-        for key in forced_pos_keys:
+        for key in _FORCED_POS_KEYS:
             if key in params:
                 val = params[key]
                 if not isinstance(val, int) or isinstance(val, bool) or val < 0:
@@ -327,9 +367,7 @@ class ConfigValidator:
                     ))
 
         # --- Task 3.7: Must-Match Constraints ---
-        match_keys = ["must_match_five_prime", "must_match_three_prime"]
-        valid_iupac = set("NACGTRYSWKMBDHVnacgtrysWkmbdhv")
-        for key in match_keys:
+        for key in _MATCH_KEYS:
             if key in params:
                 val = params[key]
                 if not isinstance(val, str):
@@ -338,8 +376,8 @@ class ConfigValidator:
                         message=f"{key} must be a string pattern (e.g. 'NNNNG')",
                         suggestion="Use IUPAC codes: N=any, R=A/G, Y=C/T, etc."
                     ))
-                elif not all(c in valid_iupac for c in val):
-                    invalid_chars = [c for c in val if c not in valid_iupac]
+                elif not all(c in _VALID_IUPAC for c in val):
+                    invalid_chars = [c for c in val if c not in _VALID_IUPAC]
                     self.errors.append(ValidationError(
                         path=f"parameters.{key}",
                         message=f"{key} contains invalid characters: {invalid_chars}",
@@ -356,16 +394,12 @@ class ConfigValidator:
                     suggestion="Example: weights: { tm_gt: 1.0, tm_lt: 1.0 }"
                 ))
             else:
-                valid_weight_keys = {
-                    "tm_gt", "tm_lt", "size_gt", "size_lt",
-                    "gc_percent_gt", "gc_percent_lt", "end_stability"
-                }
                 for wk, wv in weights.items():
-                    if wk not in valid_weight_keys:
+                    if wk not in _VALID_WEIGHT_KEYS:
                         self.warnings.append(ValidationError(
                             path=f"parameters.weights.{wk}",
                             message=f"Unknown weight key: '{wk}'",
-                            suggestion=f"Valid keys: {', '.join(sorted(valid_weight_keys))}"
+                            suggestion=f"Valid keys: {', '.join(sorted(_VALID_WEIGHT_KEYS))}"
                         ))
                     elif not isinstance(wv, (int, float)) or isinstance(wv, bool):
                         self.errors.append(ValidationError(
@@ -381,13 +415,49 @@ class ConfigValidator:
                 self.errors.append(ValidationError(
                     path="parameters.qc_method",
                     message=f"Invalid qc_method: '{params['qc_method']}'",
-                    suggestion=f"Use one of: {', '.join(self.VALID_VALUES['qc_method'])}"
+                    suggestion=f"Use one of: {', '.join(_QC_METHODS)}"
                 ))
 
 
+def _get_validator() -> ConfigValidator:
+    """
+    Return this thread's ConfigValidator, creating it on first use.
+
+    validate() starts each call with fresh error/warning lists, so one
+    instance can be reused; it is not shared between threads.
+    """
+    validator = getattr(_TLS, "validator", None)
+    if validator is None:
+        validator = _TLS.validator = ConfigValidator()
+    return validator
+
+
+def _config_cache_key(config: Dict[str, Any]) -> str:
+    """
+    Hash a config for the validation cache.
+
+    The off-target database mtime is folded into the key so that creating
+    or touching the database invalidates the cached "not found" warning.
+    """
+    payload = json.dumps(config, sort_keys=True, default=str)
+    offtarget = config.get("offtarget")
+    db = offtarget.get("database") if isinstance(offtarget, dict) else None
+    if db:
+        try:
+            payload += f"|{Path(db).stat().st_mtime}"
+        except (OSError, TypeError, ValueError):
+            payload += "|missing"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
 def validate_config(config: Dict[str, Any]) -> ValidationResult:
     """
     Convenience function to validate config.
+
+    Results are cached by config content, so re-validating an identical
+    config (dry-runs, watch mode) skips validation. Each call returns its
+    own copy of the result. Configs that cannot be hashed (e.g. mixed
+    int/str keys) are validated without the cache.
     
     Args:
         config: Configuration dictionary
@@ -395,34 +465,78 @@ def validate_config(config: Dict[str, Any]) -> ValidationResult:
     Returns:
         ValidationResult
     """
-    validator = ConfigValidator()
-    return validator.validate(config)
+    try:
+        key = _config_cache_key(config)
+    except (TypeError, ValueError):
+        return _get_validator().validate(config)
 
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return _copy_result(cached)
 
-def format_validation_errors(result: ValidationResult) -> str:
+    result = _get_validator().validate(config)
+
+    entry = _copy_result(result)
+    with _CACHE_LOCK:
+        if len(_CACHE) >= VALIDATION_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _CACHE[next(iter(_CACHE))]
+        _CACHE[key] = entry
+    return result
+
+
+def _copy_result(result: ValidationResult) -> ValidationResult:
+    """Copy a ValidationResult so the cached one cannot be changed by callers."""
+    return ValidationResult(
+        valid=result.valid,
+        errors=[replace(e) for e in result.errors],
+        warnings=[replace(w) for w in result.warnings]
+    )
+
+
+def clear_validation_cache():
+    """Clear the validate_config() result cache."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+
+def iter_validation_lines(result: ValidationResult) -> Iterator[str]:
     """
-    Format validation errors for display.
+    Yield the display lines for validation errors and warnings.
+
+    Lines are produced lazily; write them directly (e.g. with
+    sys.stdout.writelines) when the joined string is not needed.
     
     Args:
         result: ValidationResult
         
-    Returns:
-        Formatted error string
+    Yields:
+        One formatted line at a time
     """
-    lines = []
-
     if result.errors:
-        lines.append("❌ Configuration Errors:")
+        yield "❌ Configuration Errors:"
         for err in result.errors:
-            lines.append(f"   • {err.path}: {err.message}")
+            yield f"   • {err.path}: {err.message}"
             if err.suggestion:
-                lines.append(f"     💡 {err.suggestion}")
+                yield f"     💡 {err.suggestion}"
 
     if result.warnings:
-        lines.append("\n⚠️  Warnings:")
+        yield "\n⚠️  Warnings:"
         for warn in result.warnings:
-            lines.append(f"   • {warn.path}: {warn.message}")
+            yield f"   • {warn.path}: {warn.message}"
             if warn.suggestion:
-                lines.append(f"     💡 {warn.suggestion}")
+                yield f"     💡 {warn.suggestion}"
+
 
-    return "\n".join(lines)
+def format_validation_errors(result: ValidationResult) -> str:
+    """
+    Format validation errors for display.
+    
+    Args:
+        result: ValidationResult
+        
+    Returns:
+        Formatted error string
+    """
+    return "\n".join(iter_validation_lines(result))
@@ -10,18 +10,180 @@ Features:
 - Export history to CSV
 """
 
-import sqlite3
+import os
+import hashlib
 import json
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from primerlab.core.logger import get_logger
 
+if TYPE_CHECKING:
+    import sqlite3
+
 logger = get_logger()
 
+# orjson is optional: faster encoding, stored as the same TEXT as json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Default database path
 DEFAULT_DB_PATH = Path.home() / ".primerlab" / "primer_history.db"
 
+# Re-run PRAGMA integrity_check at least this often (seconds)
+INTEGRITY_CHECK_INTERVAL = 24 * 60 * 60
+
+# Shared default for missing result sections; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+# Number of timestamped backups kept next to the database
+MAX_BACKUPS = 5
+
+# Applied after journal_mode=WAL on every connection
+CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-20000",
+)
+
+# WHERE fragments for search(), in parameter order
+SEARCH_CONDITIONS = {
+    "gene": "gene_name LIKE ?",
+    "sequence": "(fwd_sequence = ? OR rev_sequence = ?)",
+    "workflow": "workflow = ?",
+    "min_quality": "quality_score >= ?",
+}
+
+# Bump when DESIGNS_TABLE_SQL changes; see PrimerDatabase._migrate_schema
+SCHEMA_VERSION = 2
+
+# Configs are stored once and referenced from designs by content hash
+CONFIGS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS configs (
+        hash TEXT PRIMARY KEY,
+        payload TEXT NOT NULL
+    )
+"""
+
+DESIGNS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        created_at REAL NOT NULL,
+        gene_name TEXT,
+        workflow TEXT NOT NULL,
+
+        -- Forward primer
+        fwd_sequence TEXT,
+        fwd_tm REAL,
+        fwd_gc REAL,
+        fwd_length INTEGER,
+
+        -- Reverse primer
+        rev_sequence TEXT,
+        rev_tm REAL,
+        rev_gc REAL,
+        rev_length INTEGER,
+
+        -- Probe (qPCR)
+        probe_sequence TEXT,
+        probe_tm REAL,
+
+        -- Amplicon
+        amplicon_length INTEGER,
+        amplicon_gc REAL,
+
+        -- Quality
+        quality_score REAL,
+        quality_category TEXT,
+
+        -- Serialized data (config_hash references configs.hash)
+        config_hash TEXT,
+        result_json TEXT,
+
+        -- Metadata
+        notes TEXT
+    )
+"""
+
+DESIGN_COLUMNS = (
+    "created_at", "gene_name", "workflow",
+    "fwd_sequence", "fwd_tm", "fwd_gc", "fwd_length",
+    "rev_sequence", "rev_tm", "rev_gc", "rev_length",
+    "probe_sequence", "probe_tm",
+    "amplicon_length", "amplicon_gc",
+    "quality_score", "quality_category",
+    "config_hash", "result_json", "notes",
+)
+
+INSERT_CONFIG_SQL = "INSERT OR IGNORE INTO configs (hash, payload) VALUES (?, ?)"
+
+INSERT_DESIGN_SQL = """
+    INSERT INTO designs (
+        created_at, gene_name, workflow,
+        fwd_sequence, fwd_tm, fwd_gc, fwd_length,
+        rev_sequence, rev_tm, rev_gc, rev_length,
+        probe_sequence, probe_tm,
+        amplicon_length, amplicon_gc,
+        quality_score, quality_category,
+        config_hash, result_json, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _dump_json(obj: Any) -> str:
+    """Serialize a config/result payload for storage as TEXT."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+
+def _payload_hash(payload: Union[str, bytes]) -> str:
+    """Content hash of a serialized config payload."""
+    if isinstance(payload, str):
+        payload = payload.encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _config_hash(payload: Any) -> Optional[str]:
+    """Content hash of a stored config payload, or None for NULL."""
+    if payload is None:
+        return None
+    return _payload_hash(payload)
+
+
+def _design_dict(row: Any) -> Dict[str, Any]:
+    """
+    Convert a designs row to a plain dict for the listing API.
+
+    created_at is stored as unix time but returned as a local-time ISO
+    string, as it was before the column became REAL.
+    """
+    from datetime import datetime
+
+    design = dict(row)
+    created_at = design.get("created_at")
+    if isinstance(created_at, (int, float)):
+        design["created_at"] = datetime.fromtimestamp(created_at).isoformat()
+    # Payloads written as BLOB by earlier orjson builds
+    for key in ("config_json", "result_json"):
+        if isinstance(design.get(key), bytes):
+            design[key] = design[key].decode()
+    return design
+
+
+def _load_json(payload: Any) -> Any:
+    """Deserialize a stored payload (TEXT, or BLOB from earlier orjson builds)."""
+
+    if payload is None:
+        return None
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class PrimerDatabase:
     """
@@ -42,18 +204,28 @@ class PrimerDatabase:
         Args:
             db_path: Path to SQLite database file (default: ~/.primerlab/primer_history.db)
         """
+        import sqlite3
+
         self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # search() SQL keyed by the set of active filters; identical SQL text
+        # lets sqlite3's statement cache reuse the prepared plan
+        self._search_stmt_cache: Dict[frozenset, str] = {}
+
         # Try to connect with corruption handling
         try:
             self.conn = sqlite3.connect(str(self.db_path))
             self.conn.row_factory = sqlite3.Row
+            self._configure_connection()
 
-            # Check integrity
-            if not self._check_integrity():
-                logger.warning("Database integrity check failed, attempting repair...")
-                self._repair_database()
+            # Check integrity (skipped when the file is unchanged since the last pass)
+            if self._integrity_check_due():
+                if self._check_integrity():
+                    self._record_integrity_check()
+                else:
+                    logger.warning("Database integrity check failed, attempting repair...")
+                    self._repair_database()
 
             self._init_schema()
 
@@ -64,12 +236,82 @@ class PrimerDatabase:
             # Retry connection
             self.conn = sqlite3.connect(str(self.db_path))
             self.conn.row_factory = sqlite3.Row
+            self._configure_connection()
             self._init_schema()
 
+    def _configure_connection(self):
+        """
+        Apply performance PRAGMAs to a fresh connection.
+
+        WAL needs one fsync per commit instead of two and lets readers run
+        alongside a writer; it is skipped if the filesystem refuses it
+        (e.g. read-only or network mounts).
+        """
+        import sqlite3
+
+        try:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as e:
+            logger.debug(f"WAL journal mode unavailable: {e}")
+
+        for pragma in CONNECTION_PRAGMAS:
+            self.conn.execute(f"PRAGMA {pragma}")
+
+    @property
+    def _integrity_cache_path(self) -> Path:
+        """Sidecar file holding the stats of the last successful check."""
+        return self.db_path.with_suffix(".integrity.json")
+
+    def _integrity_check_due(self) -> bool:
+        """
+        Decide whether PRAGMA integrity_check must run on this open.
+
+        The check scans the whole file, so it is skipped when the database
+        size/mtime match the last successful check and that check is less
+        than a day old. Set PRIMERLAB_DB_CHECK to force it.
+        """
+        if os.environ.get("PRIMERLAB_DB_CHECK"):
+            return True
+        try:
+            stat = self.db_path.stat()
+            with open(self._integrity_cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return not (
+                cached.get("mtime") == stat.st_mtime
+                and cached.get("size") == stat.st_size
+                and time.time() - cached.get("checked_at", 0) < INTEGRITY_CHECK_INTERVAL
+            )
+        except (OSError, ValueError, AttributeError):
+            return True
+
+    def _record_integrity_check(self):
+        """Remember the database stats after a successful integrity check."""
+        try:
+            stat = self.db_path.stat()
+            with open(self._integrity_cache_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "mtime": stat.st_mtime,
+                    "size": stat.st_size,
+                    "checked_at": time.time(),
+                }, f)
+        except OSError as e:
+            logger.debug(f"Could not write integrity cache: {e}")
+
     def _check_integrity(self) -> bool:
-        """Check database integrity using PRAGMA integrity_check."""
+        """
+        Check database integrity.
+
+        Runs PRAGMA quick_check, which skips the index cross-checks, and
+        only confirms with the full PRAGMA integrity_check when it reports
+        a problem. Set PRIMERLAB_FULL_CHECK to always run the full check.
+        """
         try:
             cursor = self.conn.cursor()
+            if not os.environ.get("PRIMERLAB_FULL_CHECK"):
+                cursor.execute("PRAGMA quick_check")
+                if cursor.fetchone()[0] == "ok":
+                    return True
+                logger.debug("quick_check reported problems, running full integrity_check")
             cursor.execute("PRAGMA integrity_check")
             result = cursor.fetchone()
             return result[0] == "ok"
@@ -113,63 +355,40 @@ class PrimerDatabase:
     def _create_backup(self):
         """Create a timestamped backup of the database."""
         if self.db_path.exists():
+            import shutil
+            import sqlite3
+            from datetime import datetime
+
+            # Fold the WAL into the main file so the copy is complete
+            try:
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = self.db_path.with_suffix(f'.backup_{timestamp}.db')
-            import shutil
             shutil.copy2(str(self.db_path), str(backup_path))
             logger.debug(f"Database backup created: {backup_path}")
 
-            # Keep only last 5 backups
-            backups = sorted(self.db_path.parent.glob("primer_history.backup_*.db"))
-            if len(backups) > 5:
-                for old_backup in backups[:-5]:
-                    old_backup.unlink()
-                    logger.debug(f"Removed old backup: {old_backup}")
-
+            # Keep only the newest MAX_BACKUPS (one stat per entry)
+            prefix = f"{self.db_path.stem}.backup_"
+            with os.scandir(self.db_path.parent) as it:
+                backups = [
+                    (entry.stat().st_mtime, entry.name, entry.path)
+                    for entry in it
+                    if entry.name.startswith(prefix) and entry.name.endswith(".db")
+                ]
+            backups.sort(reverse=True)
+            for _, _, old_backup in backups[MAX_BACKUPS:]:
+                os.unlink(old_backup)
+                logger.debug(f"Removed old backup: {old_backup}")
 
     def _init_schema(self):
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
 
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS designs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                created_at TEXT NOT NULL,
-                gene_name TEXT,
-                workflow TEXT NOT NULL,
-                
-                -- Forward primer
-                fwd_sequence TEXT,
-                fwd_tm REAL,
-                fwd_gc REAL,
-                fwd_length INTEGER,
-                
-                -- Reverse primer
-                rev_sequence TEXT,
-                rev_tm REAL,
-                rev_gc REAL,
-                rev_length INTEGER,
-                
-                -- Probe (qPCR)
-                probe_sequence TEXT,
-                probe_tm REAL,
-                
-                -- Amplicon
-                amplicon_length INTEGER,
-                amplicon_gc REAL,
-                
-                -- Quality
-                quality_score REAL,
-                quality_category TEXT,
-                
-                -- Serialized data
-                config_json TEXT,
-                result_json TEXT,
-                
-                -- Metadata
-                notes TEXT
-            )
-        """)
+        cursor.execute(CONFIGS_TABLE_SQL)
+        cursor.execute(DESIGNS_TABLE_SQL.format(table="designs"))
+        self._migrate_schema(cursor)
 
         # Index for common searches
         cursor.execute("""
@@ -182,95 +401,213 @@ class PrimerDatabase:
             CREATE INDEX IF NOT EXISTS idx_created_at ON designs(created_at)
         """)
 
+        # Composite indexes so filtered, newest-first queries walk the index
+        # in order instead of sorting
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_gene_created ON designs(gene_name, created_at DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_workflow_quality_created
+            ON designs(workflow, quality_score, created_at DESC)
+        """)
+
         self.conn.commit()
         logger.debug(f"Database initialized: {self.db_path}")
 
-    def save_design(
-        self, 
-        result: Dict[str, Any], 
+    def _migrate_schema(self, cursor: "sqlite3.Cursor"):
+        """
+        Bring an existing database up to SCHEMA_VERSION.
+
+        Version 1 stores created_at as REAL unix time instead of ISO text;
+        legacy ISO timestamps were written in local time and are converted
+        accordingly. Version 2 moves config payloads into the configs table
+        and keeps only their hash in designs.
+        """
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        columns = {row[1]: row[2] for row in cursor.execute("PRAGMA table_info(designs)")}
+        legacy_time = columns.get("created_at", "").upper() == "TEXT"
+        legacy_config = "config_json" in columns
+
+        if legacy_time or legacy_config:
+            logger.info("Migrating primer history database schema...")
+            created_expr = "created_at"
+            if legacy_time:
+                created_expr = "(julianday(created_at, 'utc') - 2440587.5) * 86400.0"
+            config_expr = "config_hash"
+            if legacy_config:
+                self.conn.create_function("config_hash", 1, _config_hash, deterministic=True)
+                cursor.execute("""
+                    INSERT OR IGNORE INTO configs (hash, payload)
+                    SELECT config_hash(config_json), config_json
+                    FROM designs WHERE config_json IS NOT NULL
+                """)
+                config_expr = "config_hash(config_json)"
+
+            cursor.execute("DROP TABLE IF EXISTS designs_migrated")
+            cursor.execute(DESIGNS_TABLE_SQL.format(table="designs_migrated"))
+            cursor.execute(f"""
+                INSERT INTO designs_migrated
+                SELECT id, {created_expr}, {", ".join(DESIGN_COLUMNS[1:-3])},
+                       {config_expr}, result_json, notes
+                FROM designs
+            """)
+            # The rebuilt table would restart AUTOINCREMENT at max(id);
+            # carry the old counter over so deleted ids are never reused
+            seq = cursor.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'designs'"
+            ).fetchone()
+            cursor.execute("DROP TABLE designs")
+            cursor.execute("ALTER TABLE designs_migrated RENAME TO designs")
+            if seq:
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'designs'")
+                cursor.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) VALUES ('designs', ?)", seq
+                )
+
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def _design_row(
+        self,
+        result: Dict[str, Any],
         config: Optional[Dict[str, Any]] = None,
         gene_name: Optional[str] = None,
         notes: Optional[str] = None
-    ) -> int:
+    ) -> Tuple[tuple, Optional[Tuple[str, Any]]]:
         """
-        Save a primer design to the database.
-        
-        Args:
-            result: WorkflowResult as dict
-            config: Configuration used for design
-            gene_name: Optional gene name (extracted from result if not provided)
-            notes: Optional notes about the design
-            
+        Build the INSERT parameters for one design.
+
         Returns:
-            ID of the saved record
+            (designs row, (config hash, payload) or None)
         """
-        primers = result.get("primers", {})
-        amplicons = result.get("amplicons", [])
-        qc = result.get("qc", {})
-        metadata = result.get("metadata", {})
+        _get = result.get
+        primers = _get("primers") or _EMPTY
+        amplicons = _get("amplicons") or ()
+        qc = _get("qc") or _EMPTY
+        metadata = _get("metadata") or _EMPTY
 
         # Extract gene name
         if not gene_name:
             gene_name = metadata.get("sequence_name") or metadata.get("gene_name") or "unknown"
 
         # Forward primer
-        fwd = primers.get("forward", {})
+        fwd = primers.get("forward") or _EMPTY
         fwd_seq = fwd.get("sequence", "")
-        fwd_tm = fwd.get("tm", 0)
-        fwd_gc = fwd.get("gc", 0)
         fwd_len = fwd.get("length", len(fwd_seq) if fwd_seq else 0)
 
         # Reverse primer
-        rev = primers.get("reverse", {})
+        rev = primers.get("reverse") or _EMPTY
         rev_seq = rev.get("sequence", "")
-        rev_tm = rev.get("tm", 0)
-        rev_gc = rev.get("gc", 0)
         rev_len = rev.get("length", len(rev_seq) if rev_seq else 0)
 
         # Probe
-        probe = primers.get("probe", {})
+        probe = primers.get("probe") or _EMPTY
         probe_seq = probe.get("sequence", "")
-        probe_tm = probe.get("tm", 0)
 
         # Amplicon
-        amp = amplicons[0] if amplicons else {}
-        amp_len = amp.get("length", 0)
-        amp_gc = amp.get("gc", 0)
+        amp = amplicons[0] if amplicons else _EMPTY
 
-        # Quality
-        quality_score = qc.get("quality_score", 0)
-        quality_category = qc.get("quality_category", "N/A")
+        config_entry = None
+        if config:
+            payload = _dump_json(config)
+            config_entry = (_payload_hash(payload), payload)
 
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO designs (
-                created_at, gene_name, workflow,
-                fwd_sequence, fwd_tm, fwd_gc, fwd_length,
-                rev_sequence, rev_tm, rev_gc, rev_length,
-                probe_sequence, probe_tm,
-                amplicon_length, amplicon_gc,
-                quality_score, quality_category,
-                config_json, result_json, notes
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            datetime.now().isoformat(),
+        row = (
+            time.time(),
             gene_name,
-            result.get("workflow", "pcr"),
-            fwd_seq, fwd_tm, fwd_gc, fwd_len,
-            rev_seq, rev_tm, rev_gc, rev_len,
-            probe_seq if probe_seq else None, probe_tm if probe_seq else None,
-            amp_len, amp_gc,
-            quality_score, quality_category,
-            json.dumps(config) if config else None,
-            json.dumps(result),
+            _get("workflow", "pcr"),
+            fwd_seq, fwd.get("tm", 0), fwd.get("gc", 0), fwd_len,
+            rev_seq, rev.get("tm", 0), rev.get("gc", 0), rev_len,
+            probe_seq if probe_seq else None, probe.get("tm", 0) if probe_seq else None,
+            amp.get("length", 0), amp.get("gc", 0),
+            qc.get("quality_score", 0), qc.get("quality_category", "N/A"),
+            config_entry[0] if config_entry else None,
+            _dump_json(result),
             notes
-        ))
+        )
+        return row, config_entry
+
+    def save_design(
+        self, 
+        result: Dict[str, Any], 
+        config: Optional[Dict[str, Any]] = None,
+        gene_name: Optional[str] = None,
+        notes: Optional[str] = None
+    ) -> int:
+        """
+        Save a primer design to the database.
+        
+        Args:
+            result: WorkflowResult as dict
+            config: Configuration used for design
+            gene_name: Optional gene name (extracted from result if not provided)
+            notes: Optional notes about the design
+            
+        Returns:
+            ID of the saved record
+        """
+        row, config_entry = self._design_row(result, config, gene_name, notes)
+
+        cursor = self.conn.cursor()
+        if config_entry:
+            cursor.execute(INSERT_CONFIG_SQL, config_entry)
+        cursor.execute(INSERT_DESIGN_SQL, row)
 
         self.conn.commit()
         record_id = cursor.lastrowid or 0
-        logger.info(f"Saved design to database: ID={record_id}, gene={gene_name}")
+        logger.info(f"Saved design to database: ID={record_id}, gene={row[1]}")
         return record_id
 
+    def save_designs(
+        self,
+        items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[str], Optional[str]]]
+    ) -> List[int]:
+        """
+        Save many primer designs in a single transaction.
+
+        One commit (and one fsync) covers all rows, instead of one per
+        design as with repeated save_design() calls.
+
+        Args:
+            items: (result, config, gene_name, notes) tuples, as for save_design
+
+        Returns:
+            IDs of the saved records, in input order
+        """
+        import sqlite3
+
+        rows = []
+        configs: Dict[str, Any] = {}
+        for item in items:
+            row, config_entry = self._design_row(*item)
+            rows.append(row)
+            if config_entry:
+                configs[config_entry[0]] = config_entry[1]
+        if not rows:
+            return []
+
+        cursor = self.conn.cursor()
+        if not self.conn.in_transaction:
+            cursor.execute("BEGIN")
+        try:
+            cursor.executemany(INSERT_CONFIG_SQL, configs.items())
+            cursor.executemany(INSERT_DESIGN_SQL, rows)
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+        # AUTOINCREMENT ids are contiguous within one transaction
+        first_id = last_id - len(rows) + 1
+        logger.info(f"Saved {len(rows)} designs to database: IDs={first_id}-{last_id}")
+        return list(range(first_id, last_id + 1))
+
     def search(
         self,
         gene: Optional[str] = None,
@@ -281,6 +618,22 @@ class PrimerDatabase:
     ) -> List[Dict[str, Any]]:
         """
         Search primer history.
+
+        Materialized form of iter_search(); see it for the arguments.
+        Rows are returned as plain dicts with created_at as an ISO string.
+        """
+        return [_design_dict(row) for row in self.iter_search(gene, sequence, workflow, min_quality, limit)]
+
+    def iter_search(
+        self,
+        gene: Optional[str] = None,
+        sequence: Optional[str] = None,
+        workflow: Optional[str] = None,
+        min_quality: Optional[float] = None,
+        limit: int = 50
+    ) -> Iterator["sqlite3.Row"]:
+        """
+        Search primer history, yielding rows as they are read.
         
         Args:
             gene: Filter by gene name (partial match)
@@ -289,50 +642,68 @@ class PrimerDatabase:
             min_quality: Minimum quality score
             limit: Max results to return
             
-        Returns:
-            List of matching design records
+        Yields:
+            Matching design rows (sqlite3.Row, keyed by column, with
+            created_at as unix time)
         """
-        conditions: List[str] = []
-        params: List[Any] = []
+        filters = (
+            ("gene", gene),
+            ("sequence", sequence),
+            ("workflow", workflow),
+            ("min_quality", min_quality),
+        )
+        key = frozenset(name for name, value in filters if value)
 
+        params: List[Any] = []
         if gene:
-            conditions.append("gene_name LIKE ?")
             params.append(f"%{gene}%")
-
         if sequence:
-            conditions.append("(fwd_sequence = ? OR rev_sequence = ?)")
             params.extend([sequence.upper(), sequence.upper()])
-
         if workflow:
-            conditions.append("workflow = ?")
             params.append(workflow.lower())
-
         if min_quality:
-            conditions.append("quality_score >= ?")
             params.append(min_quality)
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        params.append(limit)
+
+        sql = self._search_stmt_cache.get(key)
+        if sql is None:
+            conditions = [
+                SEARCH_CONDITIONS[name] for name, _ in filters if name in key
+            ]
+            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            sql = f"""
+                SELECT designs.*, configs.payload AS config_json
+                FROM designs LEFT JOIN configs ON configs.hash = designs.config_hash
+                WHERE {where_clause}
+
+                ORDER BY created_at DESC
+                LIMIT ?
+            """
+            self._search_stmt_cache[key] = sql
 
         cursor = self.conn.cursor()
-        cursor.execute(f"""
-            SELECT * FROM designs
-            WHERE {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, params + [limit])
-
-        results = []
-        for row in cursor.fetchall():
-            results.append(dict(row))
-
-        return results
+        cursor.execute(sql, params)
+        yield from cursor
 
     def get_by_id(self, record_id: int) -> Optional[Dict[str, Any]]:
-        """Get a specific design by ID."""
+        """
+        Get a specific design by ID.
+
+        config_json and result_json are returned decoded.
+        """
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM designs WHERE id = ?", (record_id,))
+        cursor.execute("""
+            SELECT designs.*, configs.payload AS config_json
+            FROM designs LEFT JOIN configs ON configs.hash = designs.config_hash
+            WHERE designs.id = ?
+        """, (record_id,))
         row = cursor.fetchone()
-        return dict(row) if row else None
+        if not row:
+            return None
+        design = _design_dict(row)
+        design["config_json"] = _load_json(design["config_json"])
+        design["result_json"] = _load_json(design["result_json"])
+        return design
 
     def delete(self, record_id: int) -> bool:
         """Delete a design by ID."""
@@ -346,6 +717,12 @@ class PrimerDatabase:
 
     def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most recent designs."""
+        return [_design_dict(row) for row in self.iter_recent(limit)]
+
+
+
+    def iter_recent(self, limit: int = 10) -> Iterator["sqlite3.Row"]:
+        """Yield most recent designs as they are read."""
         cursor = self.conn.cursor()
         cursor.execute("""
             SELECT id, created_at, gene_name, workflow, quality_score, quality_category,
@@ -354,8 +731,7 @@ class PrimerDatabase:
             ORDER BY created_at DESC
             LIMIT ?
         """, (limit,))
-
-        return [dict(row) for row in cursor.fetchall()]
+        yield from cursor
 
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
@@ -385,8 +761,11 @@ class PrimerDatabase:
         import csv
 
         cursor = self.conn.cursor()
+        # Stream rows straight into the writer, fetching in batches
+        cursor.arraysize = 1000
         cursor.execute("""
-            SELECT id, created_at, gene_name, workflow,
+            SELECT id, strftime('%Y-%m-%dT%H:%M:%S', created_at, 'unixepoch', 'localtime'),
+                   gene_name, workflow,
                    fwd_sequence, fwd_tm, fwd_gc,
                    rev_sequence, rev_tm, rev_gc,
                    probe_sequence, amplicon_length, amplicon_gc,
@@ -396,7 +775,7 @@ class PrimerDatabase:
         """)
 
         path = Path(output_path)
-        with open(path, 'w', newline='') as f:
+        with open(path, 'w', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "ID", "Date", "Gene", "Workflow",
@@ -406,39 +785,69 @@ class PrimerDatabase:
                 "Quality Score", "Quality Category"
             ])
 
-            for row in cursor.fetchall():
-                writer.writerow(row)
+            writer.writerows(cursor)
 
-        logger.info(f"Exported {cursor.rowcount} designs to: {path}")
+        logger.info(f"Exported design history to: {path}")
         return str(path)
 
     def close(self):
-        """Close database connection."""
+        """
+        Close database connection.
+
+        PRAGMA optimize runs first so SQLite refreshes the planner
+        statistics for tables whose contents changed while open.
+        """
+        import sqlite3
+
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.debug(f"PRAGMA optimize skipped: {e}")
         self.conn.close()
 
 
-def format_history_table(designs: List[Dict[str, Any]]) -> str:
-    """Format designs as CLI table."""
-    if not designs:
-        return "No designs found."
+def format_created_at(value: Any, fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
+    """
+    Format a stored created_at value for display.
+
+    Accepts unix time (current schema) or a legacy ISO string.
+    """
+    from datetime import datetime
 
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).strftime(fmt)
+    if not value:
+        return ""
+    try:
+        return datetime.fromisoformat(value).strftime(fmt)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def format_history_table(designs: Iterable[Any]) -> str:
+    """Format designs (dicts or sqlite3.Row, any iterable) as CLI table."""
     lines = []
     lines.append("")
     lines.append("=" * 90)
     lines.append(f"{'ID':<6} {'Date':<12} {'Gene':<15} {'Type':<6} {'Fwd Primer':<20} {'QS':>6}")
     lines.append("-" * 90)
 
+    count = 0
     for d in designs:
-        date_str = d.get("created_at", "")[:10]
-        gene = (d.get("gene_name") or "?")[:15]
-        workflow = (d.get("workflow") or "?")[:6]
-        fwd_seq = (d.get("fwd_sequence") or "?")[:20]
-        qs = d.get("quality_score") or 0
+        count += 1
+        date_str = format_created_at(d["created_at"], "%Y-%m-%d")
+        gene = (d["gene_name"] or "?")[:15]
+        workflow = (d["workflow"] or "?")[:6]
+        fwd_seq = (d["fwd_sequence"] or "?")[:20]
+        qs = d["quality_score"] or 0
 
         lines.append(f"{d['id']:<6} {date_str:<12} {gene:<15} {workflow:<6} {fwd_seq:<20} {qs:>6.1f}")
 
+    if not count:
+        return "No designs found."
+
     lines.append("=" * 90)
-    lines.append(f"Total: {len(designs)} designs")
+    lines.append(f"Total: {count} designs")
     lines.append("")
 
     return "\n".join(lines)
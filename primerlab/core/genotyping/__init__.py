@@ -5,29 +5,54 @@ Provides allele discrimination scoring for SNP genotyping assays,
 including allele-specific PCR primer validation.
 """
 
+from ._canonical import PrimerView, primer_view
 from .allele_scoring import (
     score_allele_discrimination,
+    score_allele_discrimination_view,
+    score_batch,
     AlleleScoringResult,
 )
 from .snp_position import (
     validate_snp_position,
     analyze_snp_context,
+    analyze_snp_context_view,
     SnpPositionResult,
 )
 from .discrimination_tm import (
     calculate_discrimination_tm,
+    calculate_discrimination_tm_view,
+    discrimination_tm_batch,
     estimate_allele_specificity,
 )
+from . import allele_scoring as _allele_scoring
+from . import discrimination_tm as _discrimination_tm
+
+
+def clear_caches() -> None:
+    """Clear memoized genotyping scores and Tm results."""
+    _allele_scoring.clear_caches()
+    _discrimination_tm.clear_caches()
+
 
 __all__ = [
+    # Shared primer view
+    "PrimerView",
+    "primer_view",
     # Allele scoring
     "score_allele_discrimination",
+    "score_allele_discrimination_view",
+    "score_batch",
     "AlleleScoringResult",
     # SNP position
     "validate_snp_position",
     "analyze_snp_context",
+    "analyze_snp_context_view",
     "SnpPositionResult",
     # Discrimination Tm
     "calculate_discrimination_tm",
+    "calculate_discrimination_tm_view",
+    "discrimination_tm_batch",
     "estimate_allele_specificity",
+    # Caches
+    "clear_caches",
 ]
@@ -0,0 +1,52 @@
+"""
+Canonical primer representation for the genotyping modules.
+
+Public entry points take plain strings and canonicalize them once into a
+PrimerView, so helpers can skip repeated ``str.upper()`` and encode passes.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+# Base encoding for table lookups: A/C/G/T -> 0..3, anything else -> 4
+BASE_CODES = {ord(b): i for i, b in enumerate("ACGT")}
+ENCODE = bytes(BASE_CODES.get(c, 4) for c in range(256))
+# Same encoding pre-multiplied by 5, the row stride of 5x5 dinucleotide tables
+ENCODE_ROW = bytes(BASE_CODES.get(c, 4) * 5 for c in range(256))
+
+
+def pair_table(values: Dict[Tuple[str, str], float], default: float) -> Tuple[float, ...]:
+    """Flatten a (ref, alt) -> value mapping into a 5x5 table for pair_index()."""
+    return tuple(values.get((r, a), default) for r in "ACGTN" for a in "ACGTN")
+
+
+def pair_index(ref: str, alt: str) -> int:
+    """
+    Index of a single-base (ref, alt) pair in a pair_table(), or -1 for
+    multi-base or non-ASCII alleles. Bases other than A/C/G/T share the
+    default row/column.
+    """
+    if len(ref) == 1 and len(alt) == 1 and ref.isascii() and alt.isascii():
+        return ENCODE_ROW[ord(ref)] + ENCODE[ord(alt)]
+    return -1
+
+
+@dataclass(frozen=True)
+class PrimerView:
+    """
+    Uppercase primer sequence with its ASCII bytes and length.
+
+    Build one with primer_view() per candidate and pass it to the
+    ``*_view`` genotyping functions to skip re-normalizing the sequence.
+    """
+
+    seq: str
+    data: bytes
+    length: int
+
+
+def primer_view(sequence: str) -> PrimerView:
+    """Uppercase and encode a primer sequence once."""
+    seq = sequence.upper()
+    return PrimerView(seq, seq.encode("ascii", "replace"), len(seq))
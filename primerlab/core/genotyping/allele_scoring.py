@@ -8,7 +8,14 @@ Scores primers for SNP genotyping based on:
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple
+from functools import lru_cache
+from typing import Optional, List, Dict, Sequence, Tuple
+
+from ._canonical import PrimerView, pair_index, pair_table, primer_view
+
+
+# Maximum number of memoized scoring results
+SCORE_CACHE_SIZE = 65536
 
 
 # Mismatch type scoring
@@ -29,6 +36,7 @@ MISMATCH_SCORES = {
     ("G", "T"): 0.95,
     ("T", "G"): 0.95,
 }
+_MISMATCH_SCORE_LUT = pair_table(MISMATCH_SCORES, 0.5)
 
 # Position weight (distance from 3' end)
 # 0 = 3' terminal, 1 = 3'-1, etc.
@@ -39,6 +47,17 @@ POSITION_WEIGHTS = {
     3: 0.2,   # 3'-3 position - poor
 }
 
+# POSITION_WEIGHTS plus the distal fall-off, precomputed per position
+POSITION_WEIGHT_LUT = tuple(
+    POSITION_WEIGHTS.get(i, max(0.05, 0.2 - (i - 3) * 0.05)) for i in range(64)
+)
+
+# Letter grade per whole score 0-100; int() truncation keeps the >= cut-offs
+_GRADE_LUT = "".join(
+    "A" if s >= 90 else "B" if s >= 80 else "C" if s >= 70 else "D" if s >= 60 else "F"
+    for s in range(101)
+)
+
 
 @dataclass
 class AlleleScoringResult:
@@ -79,31 +98,23 @@ class AlleleScoringResult:
 
 def _get_position_weight(pos_from_3prime: int) -> float:
     """Get position weight for SNP distance from 3' end."""
-    if pos_from_3prime in POSITION_WEIGHTS:
-        return POSITION_WEIGHTS[pos_from_3prime]
+    if 0 <= pos_from_3prime < len(POSITION_WEIGHT_LUT):
+        return POSITION_WEIGHT_LUT[pos_from_3prime]
     # Positions beyond 3 have minimal discrimination
     return max(0.05, 0.2 - (pos_from_3prime - 3) * 0.05)
 
 
 def _get_mismatch_score(ref: str, alt: str) -> float:
-    """Get mismatch type score."""
-    ref = ref.upper()
-    alt = alt.upper()
-    return MISMATCH_SCORES.get((ref, alt), 0.5)
+    """Get mismatch type score. Expects uppercase alleles."""
+    pair = pair_index(ref, alt)
+    return _MISMATCH_SCORE_LUT[pair] if pair >= 0 else 0.5
 
 
 def _score_to_grade(score: float) -> str:
     """Convert score to letter grade."""
-    if score >= 90:
-        return "A"
-    elif score >= 80:
-        return "B"
-    elif score >= 70:
-        return "C"
-    elif score >= 60:
-        return "D"
-    else:
-        return "F"
+    if not score >= 0:  # negative or NaN
+        return _GRADE_LUT[0]
+    return _GRADE_LUT[int(min(score, 100))]
 
 
 def score_allele_discrimination(
@@ -126,15 +137,64 @@ def score_allele_discrimination(
     Returns:
         AlleleScoringResult with discrimination assessment
     """
-    primer_sequence = primer_sequence.upper()
+    return score_allele_discrimination_view(
+        primer_view(primer_sequence), snp_position, ref_allele, alt_allele, min_score_threshold
+    )
+
+
+def score_allele_discrimination_view(
+    primer: PrimerView,
+    snp_position: int,
+    ref_allele: str,
+    alt_allele: str,
+    min_score_threshold: float = 60.0,
+) -> AlleleScoringResult:
+    """score_allele_discrimination for a prebuilt PrimerView."""
     ref_allele = ref_allele.upper()
     alt_allele = alt_allele.upper()
 
+    (
+        snp_position, position_score, mismatch_score, combined_score,
+        grade, is_discriminating, warnings, recommendations,
+    ) = _score_core(
+        primer.length, snp_position, ref_allele, alt_allele, min_score_threshold
+    )
+
+    return AlleleScoringResult(
+        primer_sequence=primer.seq,
+        snp_position=snp_position,
+        ref_allele=ref_allele,
+        alt_allele=alt_allele,
+        position_score=position_score,
+        mismatch_score=mismatch_score,
+        combined_score=combined_score,
+        grade=grade,
+        is_discriminating=is_discriminating,
+        warnings=list(warnings),
+        recommendations=list(recommendations),
+    )
+
+
+@lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _score_core(
+    primer_length: int,
+    snp_position: int,
+    ref_allele: str,
+    alt_allele: str,
+    min_score_threshold: float,
+) -> tuple:
+    """
+    Compute the scoring fields for score_allele_discrimination.
+
+    Scores depend only on primer length, SNP position and alleles, so
+    results are shared across primers with the same layout. Expects
+    uppercase alleles; warnings/recommendations are returned as tuples.
+    """
     warnings = []
     recommendations = []
 
     # Validate inputs
-    if snp_position < 0 or snp_position >= len(primer_sequence):
+    if snp_position < 0 or snp_position >= primer_length:
         warnings.append(f"SNP position {snp_position} out of range")
         snp_position = 0  # Default to 3' end
 
@@ -169,16 +229,51 @@ def score_allele_discrimination(
     if not is_discriminating:
         recommendations.append("Consider alternative primer design with SNP at 3' terminal position")
 
-    return AlleleScoringResult(
-        primer_sequence=primer_sequence,
-        snp_position=snp_position,
-        ref_allele=ref_allele,
-        alt_allele=alt_allele,
-        position_score=position_score,
-        mismatch_score=mismatch_score,
-        combined_score=combined_score,
-        grade=grade,
-        is_discriminating=is_discriminating,
-        warnings=warnings,
-        recommendations=recommendations,
+    return (
+        snp_position, position_score, mismatch_score, combined_score,
+        grade, is_discriminating, tuple(warnings), tuple(recommendations),
     )
+
+
+def score_batch(
+    primer_sequences: Sequence[str],
+    snp_positions: Sequence[int],
+    ref_alleles: Sequence[str],
+    alt_alleles: Sequence[str],
+    min_score_threshold: float = 60.0,
+) -> List[Tuple[float, float, float]]:
+    """
+    Score many allele-specific primer candidates in one call.
+
+    Same scoring as score_allele_discrimination, without building a
+    result object per candidate.
+
+    Args:
+        primer_sequences: Primer sequences (5'→3')
+        snp_positions: SNP positions from 3' end, one per primer
+        ref_alleles: Reference alleles, one per primer
+        alt_alleles: Alternative alleles, one per primer
+        min_score_threshold: Passed through to the shared scoring core
+
+    Returns:
+        (combined_score, position_score, mismatch_score) per candidate,
+        in input order
+
+    Raises:
+        ValueError: If the input sequences differ in length
+    """
+    core = _score_core
+    scores = []
+    for primer, pos, ref, alt in zip(
+        primer_sequences, snp_positions, ref_alleles, alt_alleles, strict=True
+    ):
+        _, position_score, mismatch_score, combined_score = core(
+            len(primer), pos, ref.upper(), alt.upper(), min_score_threshold
+        )[:4]
+        scores.append((combined_score, position_score, mismatch_score))
+    return scores
+
+
+def clear_caches() -> None:
+    """Clear memoized scoring results."""
+    _score_core.cache_clear()
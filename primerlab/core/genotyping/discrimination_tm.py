@@ -5,8 +5,15 @@ Calculates Tm difference between matched and mismatched primers
 to assess allele-specific discrimination potential.
 """
 
-from typing import Tuple, Dict, Optional
+from functools import lru_cache
+from operator import add
+from typing import Tuple, Dict, List, Optional, Sequence
 
+from ._canonical import ENCODE, ENCODE_ROW, PrimerView, pair_index, pair_table, primer_view
+
+
+# Maximum number of memoized Tm results per function
+TM_CACHE_SIZE = 65536
 
 # Nearest-neighbor parameters (kcal/mol) for DNA/DNA
 # Simplified from SantaLucia 1998
@@ -21,6 +28,47 @@ NN_PARAMS = {
     "GG": -1.84, "CC": -1.84,
 }
 
+# NN_PARAMS flattened to a 5x5 table indexed by row*5 + col; unknown
+# bases contribute 0
+NN_TABLE = tuple(NN_PARAMS.get(b1 + b2, 0.0) for b1 in "ACGTN" for b2 in "ACGTN")
+
+# Wallace rule weight per ASCII base: A/T -> 2, G/C -> 4, other -> 0
+_WALLACE_WEIGHTS = bytes(
+    2 if c in b"AT" else 4 if c in b"GC" else 0 for c in range(256)
+)
+
+# Rough conversions from the NN sum to enthalpy (kcal/mol) and
+# entropy (cal/mol·K)
+NN_H_SCALE = 8
+NN_S_SCALE = 22
+
+
+def _nn_sum(data: bytes) -> float:
+    """Sum of NN_TABLE entries over the dinucleotides of an ASCII sequence."""
+    return sum(map(
+        NN_TABLE.__getitem__,
+        map(add, data[:-1].translate(ENCODE_ROW), data[1:].translate(ENCODE)),
+    ))
+
+
+def _nn_substitution_delta(data: bytes, pos: int, new_base: int) -> float:
+    """
+    Change in _nn_sum(data) when the base at pos is replaced by new_base.
+
+    Only the two dinucleotides touching pos change, so this is O(1)
+    regardless of primer length.
+    """
+    old, new = ENCODE[data[pos]], ENCODE[new_base]
+    delta = 0.0
+    if pos > 0:
+        left = ENCODE_ROW[data[pos - 1]]
+        delta += NN_TABLE[left + new] - NN_TABLE[left + old]
+    if pos + 1 < len(data):
+        right = ENCODE[data[pos + 1]]
+        delta += NN_TABLE[new * 5 + right] - NN_TABLE[old * 5 + right]
+    return delta
+
+
 # Mismatch destabilization (kcal/mol) - approximate
 # Higher value = more destabilizing = better discrimination
 MISMATCH_PENALTY = {
@@ -39,8 +87,14 @@ MISMATCH_PENALTY = {
     ("G", "T"): 1.0,
     ("T", "G"): 1.0,
 }
+_MISMATCH_PENALTY_LUT = pair_table(MISMATCH_PENALTY, 0.7)
+
+# Mismatch penalty multiplier by distance from the 3' end (0 = terminal,
+# max effect); positions further in use 1.0
+POSITION_FACTORS = (3.0, 2.0, 1.5)
 
 
+@lru_cache(maxsize=TM_CACHE_SIZE)
 def _calculate_basic_tm(sequence: str, na_concentration: float = 50.0) -> float:
     """
     Calculate Tm using simplified nearest-neighbor method.
@@ -52,25 +106,22 @@ def _calculate_basic_tm(sequence: str, na_concentration: float = 50.0) -> float:
     Returns:
         Tm in degrees Celsius
     """
-    sequence = sequence.upper()
+    return _basic_tm(primer_view(sequence), na_concentration)
 
-    if len(sequence) < 2:
-        return 0.0
 
-    # Sum NN parameters
-    delta_h = 0.0
-    delta_s = 0.0
+def _basic_tm(primer: PrimerView, na_concentration: float) -> float:
+    """_calculate_basic_tm for an already canonicalized primer."""
+    return _tm_from_nn(_nn_sum(primer.data), primer.seq, na_concentration)
 
-    # Approximate enthalpy/entropy
-    for i in range(len(sequence) - 1):
-        dinuc = sequence[i:i+2]
-        if dinuc in NN_PARAMS:
-            delta_h += NN_PARAMS[dinuc] * 8  # Rough conversion to kcal/mol
-            delta_s += NN_PARAMS[dinuc] * 22  # Rough conversion to cal/mol·K
 
-    # Initiation
-    delta_h += -0.2
-    delta_s += -5.7
+def _tm_from_nn(nn: float, sequence: str, na_concentration: float) -> float:
+    """Tm from a precomputed NN sum; sequence is used for the fallback."""
+    if len(sequence) < 2:
+        return 0.0
+
+    # Approximate enthalpy/entropy, plus initiation
+    delta_h = nn * NN_H_SCALE - 0.2
+    delta_s = nn * NN_S_SCALE - 5.7
 
     # Salt correction
     salt_corr = 16.6 * (0.434 * (na_concentration / 1000) ** 0.5)
@@ -82,16 +133,14 @@ def _calculate_basic_tm(sequence: str, na_concentration: float = 50.0) -> float:
     tm = (delta_h * 1000) / (delta_s + 1.987 * 2.303 * (-4.26)) + salt_corr
 
     # Fallback to simple formula if result unreasonable
-    gc_count = sequence.count("G") + sequence.count("C")
-    at_count = sequence.count("A") + sequence.count("T")
-
     if tm < 30 or tm > 100:
-        # Use Wallace rule as fallback
-        tm = 2 * at_count + 4 * gc_count
+        # Wallace rule (2*AT + 4*GC) in one pass over per-base weights
+        tm = sum(sequence.encode("ascii", "replace").translate(_WALLACE_WEIGHTS))
 
     return tm
 
 
+@lru_cache(maxsize=TM_CACHE_SIZE)
 def calculate_discrimination_tm(
     primer_sequence: str,
     snp_position: int,
@@ -111,34 +160,113 @@ def calculate_discrimination_tm(
         
     Returns:
         Tuple of (Tm_matched, Tm_mismatched, delta_Tm)
+
+    Results are memoized; see clear_caches().
     """
-    primer_sequence = primer_sequence.upper()
-    ref_allele = ref_allele.upper()
-    alt_allele = alt_allele.upper()
+    return calculate_discrimination_tm_view(
+        primer_view(primer_sequence), snp_position, ref_allele, alt_allele, na_concentration
+    )
 
+
+def calculate_discrimination_tm_view(
+    primer: PrimerView,
+    snp_position: int,
+    ref_allele: str,
+    alt_allele: str,
+    na_concentration: float = 50.0,
+) -> Tuple[float, float, float]:
+    """calculate_discrimination_tm for a prebuilt PrimerView."""
     # Calculate Tm for matched primer
-    tm_matched = _calculate_basic_tm(primer_sequence, na_concentration)
+    nn_matched = _nn_sum(primer.data)
+    tm_matched = _tm_from_nn(nn_matched, primer.seq, na_concentration)
+
+    return _discrimination_tm(
+        primer, nn_matched, tm_matched, snp_position,
+        ref_allele.upper(), alt_allele.upper(), na_concentration,
+    )
+
 
-    # Create mismatched primer
-    primer_list = list(primer_sequence)
-    if 0 <= snp_position < len(primer_list):
-        primer_list[snp_position] = alt_allele
-    mismatched_primer = "".join(primer_list)
+def discrimination_tm_batch(
+    primer_sequences: Sequence[str],
+    snp_positions: Sequence[int],
+    ref_alleles: Sequence[str],
+    alt_alleles: Sequence[str],
+    na_concentration: float = 50.0,
+) -> List[Tuple[float, float, float]]:
+    """
+    Calculate discrimination Tm for many (primer, SNP, allele) rows.
+
+    The matched-primer Tm is computed once per distinct primer and each
+    row only applies the single-base update, so sweeping one primer
+    over many allele pairs costs O(1) per extra row.
+
+    Args:
+        primer_sequences: Primer sequences with ref allele at the SNP
+        snp_positions: SNP positions from 5' end (0-indexed), one per row
+        ref_alleles: Reference alleles, one per row
+        alt_alleles: Alternative alleles, one per row
+        na_concentration: Na+ concentration in mM
+
+    Returns:
+        (Tm_matched, Tm_mismatched, delta_Tm) per row, in input order
+
+    Raises:
+        ValueError: If the input sequences differ in length
+    """
+    matched: Dict[str, Tuple[PrimerView, float, float]] = {}
+    results = []
+    for sequence, snp_position, ref_allele, alt_allele in zip(
+        primer_sequences, snp_positions, ref_alleles, alt_alleles, strict=True
+    ):
+        entry = matched.get(sequence)
+        if entry is None:
+            primer = primer_view(sequence)
+            nn = _nn_sum(primer.data)
+            entry = matched[sequence] = (primer, nn, _tm_from_nn(nn, primer.seq, na_concentration))
+        results.append(_discrimination_tm(
+            *entry, snp_position, ref_allele.upper(), alt_allele.upper(), na_concentration
+        ))
+    return results
+
+
+def _discrimination_tm(
+    primer: PrimerView,
+    nn_matched: float,
+    tm_matched: float,
+    snp_position: int,
+    ref_allele: str,
+    alt_allele: str,
+    na_concentration: float,
+) -> Tuple[float, float, float]:
+    """Mismatched Tm and delta from the matched primer's NN sum and Tm."""
+    primer_sequence = primer.seq
+
+    # Create mismatched primer; a single-base swap only changes the two
+    # dinucleotides around it, so update the NN sum instead of rescanning
+    if 0 <= snp_position < len(primer_sequence):
+        end = snp_position + 1
+        mismatched_primer = primer_sequence[:snp_position] + alt_allele + primer_sequence[end:]
+        alt_data = alt_allele.encode("ascii", "replace")
+        if len(alt_data) == 1:
+            nn_mismatched = nn_matched + _nn_substitution_delta(
+                primer.data, snp_position, alt_data[0]
+            )
+        else:
+            nn_mismatched = _nn_sum(primer.data[:snp_position] + alt_data + primer.data[end:])
+    else:
+        mismatched_primer, nn_mismatched = primer_sequence, nn_matched
 
     # Calculate base Tm for mismatched
-    tm_mismatched_base = _calculate_basic_tm(mismatched_primer, na_concentration)
+    tm_mismatched_base = _tm_from_nn(nn_mismatched, mismatched_primer, na_concentration)
 
     # Apply mismatch penalty based on position and type
-    penalty = MISMATCH_PENALTY.get((ref_allele, alt_allele), 0.7)
+    pair = pair_index(ref_allele, alt_allele)
+    penalty = _MISMATCH_PENALTY_LUT[pair] if pair >= 0 else 0.7
 
     # Position effect: 3' mismatches are more destabilizing
     distance_from_3prime = len(primer_sequence) - 1 - snp_position
-    if distance_from_3prime == 0:
-        position_factor = 3.0  # 3' terminal - max effect
-    elif distance_from_3prime == 1:
-        position_factor = 2.0
-    elif distance_from_3prime == 2:
-        position_factor = 1.5
+    if 0 <= distance_from_3prime < len(POSITION_FACTORS):
+        position_factor = POSITION_FACTORS[distance_from_3prime]
     else:
         position_factor = 1.0
 
@@ -150,6 +278,12 @@ def calculate_discrimination_tm(
     return (round(tm_matched, 1), round(tm_mismatched, 1), round(delta_tm, 1))
 
 
+def clear_caches() -> None:
+    """Clear memoized Tm results."""
+    _calculate_basic_tm.cache_clear()
+    calculate_discrimination_tm.cache_clear()
+
+
 def estimate_allele_specificity(
     delta_tm: float,
     annealing_temp: Optional[float] = None,
@@ -6,8 +6,31 @@ for allele-specific PCR suitability.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List, Dict, Tuple
 
+from ._canonical import PrimerView, primer_view
+
+
+# Poly-run warning by SNP base. The context window is at most 5 bases
+# centred on the SNP, so any run of 4 must include the SNP base itself.
+_POLY_RUN_WARNINGS = {
+    "G": "Poly-G/C run near SNP may cause secondary structure",
+    "C": "Poly-G/C run near SNP may cause secondary structure",
+    "A": "Poly-A/T run near SNP may reduce specificity",
+    "T": "Poly-A/T run near SNP may reduce specificity",
+}
+
+
+@lru_cache(maxsize=256)
+def _distance_warning(snp_from_3prime: int) -> Optional[str]:
+    """Warning text for an SNP this many bases from the 3' end, if any."""
+    if snp_from_3prime > 4:
+        return f"SNP is {snp_from_3prime} bases from 3' end - poor discrimination"
+    if snp_from_3prime > 2:
+        return f"SNP at position -{snp_from_3prime} from 3' - marginal discrimination"
+    return None
+
 
 @dataclass
 class SnpPositionResult:
@@ -84,8 +107,13 @@ def analyze_snp_context(
     Returns:
         SnpPositionResult with detailed analysis
     """
-    primer_sequence = primer_sequence.upper()
-    primer_len = len(primer_sequence)
+    return analyze_snp_context_view(primer_view(primer_sequence), snp_index)
+
+
+def analyze_snp_context_view(primer: PrimerView, snp_index: int) -> SnpPositionResult:
+    """analyze_snp_context for a prebuilt PrimerView."""
+    primer_sequence = primer.seq
+    primer_len = primer.length
 
     warnings = []
 
@@ -119,17 +147,14 @@ def analyze_snp_context(
     is_valid = snp_from_3prime <= 4  # Within 4 bases
 
     # Generate warnings
-    if snp_from_3prime > 4:
-        warnings.append(f"SNP is {snp_from_3prime} bases from 3' end - poor discrimination")
-    elif snp_from_3prime > 2:
-        warnings.append(f"SNP at position -{snp_from_3prime} from 3' - marginal discrimination")
+    distance_warning = _distance_warning(snp_from_3prime)
+    if distance_warning:
+        warnings.append(distance_warning)
 
     # Check for problematic flanking sequences
-    context = flanking_5 + snp_base + flanking_3
-    if "GGGG" in context or "CCCC" in context:
-        warnings.append("Poly-G/C run near SNP may cause secondary structure")
-    if "AAAA" in context or "TTTT" in context:
-        warnings.append("Poly-A/T run near SNP may reduce specificity")
+    run_warning = _POLY_RUN_WARNINGS.get(snp_base)
+    if run_warning and snp_base * 4 in primer_sequence[max(0, snp_index - 2):snp_index + 3]:
+        warnings.append(run_warning)
 
     return SnpPositionResult(
         primer_sequence=primer_sequence,
@@ -5,10 +5,206 @@ Generates standalone HTML reports with embedded CSS.
 No external dependencies required for viewing.
 """
 
+import io
+from html import escape
+from string import Template
 from typing import Dict, Any, Optional
 from primerlab.core.models import WorkflowResult
 
 
+# Tm/GC windows highlighted as good in the primers table
+TM_GOOD_RANGE = (58.0, 62.0)
+GC_GOOD_RANGE = (40.0, 60.0)
+
+# Cell class indexed by the in-range check
+_CELL_CLASS = ("warn", "good")
+
+# Embedded stylesheet; kept out of the page template so it is stored as-is
+_STYLE = '''    <style>
+        * {
+            box-sizing: border-box;
+            margin: 0;
+            padding: 0;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 20px;
+        }
+        .header h1 {
+            font-size: 2em;
+            margin-bottom: 10px;
+        }
+        .header .meta {
+            opacity: 0.9;
+            font-size: 0.9em;
+        }
+        .quality-score {
+            background: white;
+            padding: 20px;
+            border-radius: 10px;
+            border-left: 5px solid;
+            margin-bottom: 20px;
+            display: flex;
+            align-items: center;
+            gap: 20px;
+        }
+        .score-value {
+            font-size: 2.5em;
+            font-weight: bold;
+        }
+        .score-category {
+            font-size: 1.2em;
+            color: #666;
+        }
+        .card {
+            background: white;
+            padding: 20px;
+            border-radius: 10px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h2, h3 {
+            color: #333;
+            margin-bottom: 15px;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #eee;
+        }
+        th {
+            background: #f8f9fa;
+            font-weight: 600;
+        }
+        .sequence code {
+            background: #f1f3f4;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-family: 'Courier New', monospace;
+            font-size: 0.9em;
+        }
+        .good {
+            color: #28a745;
+            font-weight: 600;
+        }
+        .warn {
+            color: #ffc107;
+            font-weight: 600;
+        }
+        .rationale, .qc-summary, .amplicon-info {
+            background: white;
+            padding: 20px;
+            border-radius: 10px;
+            margin-bottom: 20px;
+        }
+        ul {
+            margin-left: 20px;
+        }
+        li {
+            margin: 5px 0;
+        }
+        .footer {
+            text-align: center;
+            color: #999;
+            font-size: 0.8em;
+            margin-top: 30px;
+        }
+        .copy-btn {
+            background: #667eea;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 5px;
+            cursor: pointer;
+            font-size: 0.9em;
+        }
+        .copy-btn:hover {
+            background: #5a6fd6;
+        }
+    </style>
+'''
+
+# Static page skeleton; only the $-placeholders vary between reports
+_PAGE = Template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>PrimerLab Report - $workflow</title>
+''' + _STYLE + '''</head>
+<body>
+    <div class="header">
+        <h1>🧬 PrimerLab Report: $workflow</h1>
+        <div class="meta">
+            <p>Generated: $timestamp</p>
+            <p>Version: $version</p>
+        </div>
+    </div>
+    
+    $quality
+    
+    <div class="card">
+        <h2>Best Primer Set</h2>
+        $primers
+    </div>
+    
+    $amplicon
+    
+    $qc
+    
+    $rationale
+    
+    <div class="footer">
+        <p>Generated by PrimerLab v$version</p>
+    </div>
+    
+    <script>
+        // Copy to clipboard functionality
+        function copySequence(seq) {
+            navigator.clipboard.writeText(seq).then(() => {
+                alert('Sequence copied to clipboard!');
+            });
+        }
+    </script>
+</body>
+</html>''')
+
+_PRIMERS_TABLE_HEAD = '''
+        <table class="primers-table">
+            <thead>
+                <tr>
+                    <th>Name</th>
+                    <th>Sequence</th>
+                    <th>Length</th>
+                    <th>Tm</th>
+                    <th>GC%</th>
+                    <th>Hairpin ΔG</th>
+                </tr>
+            </thead>
+            <tbody>
+'''
+
+_PRIMERS_TABLE_TAIL = '''            </tbody>
+        </table>
+        '''
+
+
 def generate_html_report(result: WorkflowResult) -> str:
     """
     Generate a standalone HTML report.
@@ -51,40 +247,27 @@ def generate_html_report(result: WorkflowResult) -> str:
     # Primers table
     primers_html = ""
     if result.primers:
-        rows = []
-        for name, primer in result.primers.items():
-            tm_class = "good" if 58 <= primer.tm <= 62 else "warn"
-            gc_class = "good" if 40 <= primer.gc <= 60 else "warn"
+        buf = io.StringIO()
+        w = buf.write
+        w(_PRIMERS_TABLE_HEAD)
+        tm_lo, tm_hi = TM_GOOD_RANGE
+        gc_lo, gc_hi = GC_GOOD_RANGE
+        for primer in result.primers.values():
+            tm_class = _CELL_CLASS[tm_lo <= primer.tm <= tm_hi]
+            gc_class = _CELL_CLASS[gc_lo <= primer.gc <= gc_hi]
 
             hairpin_val = f"{primer.hairpin_dg:.2f}" if primer.hairpin_dg else "N/A"
-            rows.append(f'''
-                <tr>
-                    <td><strong>{primer.id}</strong></td>
-                    <td class="sequence"><code>{primer.sequence}</code></td>
+            w(f'''                <tr>
+                    <td><strong>{escape(primer.id)}</strong></td>
+                    <td class="sequence"><code>{escape(primer.sequence)}</code></td>
                     <td>{primer.length}</td>
                     <td class="{tm_class}">{primer.tm:.1f}°C</td>
                     <td class="{gc_class}">{primer.gc:.1f}%</td>
                     <td>{hairpin_val}</td>
                 </tr>
-            ''')
-
-        primers_html = f'''
-        <table class="primers-table">
-            <thead>
-                <tr>
-                    <th>Name</th>
-                    <th>Sequence</th>
-                    <th>Length</th>
-                    <th>Tm</th>
-                    <th>GC%</th>
-                    <th>Hairpin ΔG</th>
-                </tr>
-            </thead>
-            <tbody>
-                {''.join(rows)}
-            </tbody>
-        </table>
-        '''
+''')
+        w(_PRIMERS_TABLE_TAIL)
+        primers_html = buf.getvalue()
 
     # QC Summary
     qc_html = ""
@@ -117,11 +300,13 @@ def generate_html_report(result: WorkflowResult) -> str:
     rationale_html = ""
     if hasattr(result, 'rationale') and result.rationale:
         r = result.rationale
-        selection_reasons = "".join([f"<li>{reason}</li>" for reason in r.get("selection_reasons", [])])
-        rejection_items = "".join([
-            f"<li>{item['count']} failed: {item['reason']}</li>" 
+        selection_reasons = "".join(
+            f"<li>{escape(str(reason))}</li>" for reason in r.get("selection_reasons", [])
+        )
+        rejection_items = "".join(
+            f"<li>{item['count']} failed: {escape(str(item['reason']))}</li>"
             for item in r.get("rejection_summary", [])[:5]
-        ])
+        )
 
         rationale_html = f'''
         <div class="rationale">
@@ -149,167 +334,13 @@ def generate_html_report(result: WorkflowResult) -> str:
         </div>
         '''
 
-    # Build complete HTML
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PrimerLab Report - {workflow}</title>
-    <style>
-        * {{
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-        }}
-        .header h1 {{
-            font-size: 2em;
-            margin-bottom: 10px;
-        }}
-        .header .meta {{
-            opacity: 0.9;
-            font-size: 0.9em;
-        }}
-        .quality-score {{
-            background: white;
-            padding: 20px;
-            border-radius: 10px;
-            border-left: 5px solid;
-            margin-bottom: 20px;
-            display: flex;
-            align-items: center;
-            gap: 20px;
-        }}
-        .score-value {{
-            font-size: 2.5em;
-            font-weight: bold;
-        }}
-        .score-category {{
-            font-size: 1.2em;
-            color: #666;
-        }}
-        .card {{
-            background: white;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h2, h3 {{
-            color: #333;
-            margin-bottom: 15px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #eee;
-        }}
-        th {{
-            background: #f8f9fa;
-            font-weight: 600;
-        }}
-        .sequence code {{
-            background: #f1f3f4;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-        }}
-        .good {{
-            color: #28a745;
-            font-weight: 600;
-        }}
-        .warn {{
-            color: #ffc107;
-            font-weight: 600;
-        }}
-        .rationale, .qc-summary, .amplicon-info {{
-            background: white;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-        }}
-        ul {{
-            margin-left: 20px;
-        }}
-        li {{
-            margin: 5px 0;
-        }}
-        .footer {{
-            text-align: center;
-            color: #999;
-            font-size: 0.8em;
-            margin-top: 30px;
-        }}
-        .copy-btn {{
-            background: #667eea;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 0.9em;
-        }}
-        .copy-btn:hover {{
-            background: #5a6fd6;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🧬 PrimerLab Report: {workflow}</h1>
-        <div class="meta">
-            <p>Generated: {timestamp}</p>
-            <p>Version: {version}</p>
-        </div>
-    </div>
-    
-    {quality_html}
-    
-    <div class="card">
-        <h2>Best Primer Set</h2>
-        {primers_html}
-    </div>
-    
-    {amplicon_html}
-    
-    {qc_html}
-    
-    {rationale_html}
-    
-    <div class="footer">
-        <p>Generated by PrimerLab v{version}</p>
-    </div>
-    
-    <script>
-        // Copy to clipboard functionality
-        function copySequence(seq) {{
-            navigator.clipboard.writeText(seq).then(() => {{
-                alert('Sequence copied to clipboard!');
-            }});
-        }}
-    </script>
-</body>
-</html>'''
-
-    return html
+    return _PAGE.substitute(
+        workflow=workflow,
+        timestamp=timestamp,
+        version=version,
+        quality=quality_html,
+        primers=primers_html,
+        amplicon=amplicon_html,
+        qc=qc_html,
+        rationale=rationale_html,
+    )
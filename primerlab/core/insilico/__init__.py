@@ -4,13 +4,14 @@ In-silico PCR Simulation Module (v0.3.4)
 Virtual PCR simulation for amplicon prediction and primer validation.
 """
 
-from primerlab.core.insilico.engine import InsilicoPCR, run_insilico_pcr
+from primerlab.core.insilico.engine import InsilicoPCR, run_insilico_pcr, run_insilico_pcr_batch
 from primerlab.core.insilico.binding import (
     BindingSite,
     analyze_binding,
     calculate_corrected_tm,      # v0.3.4
     check_three_prime_stability, # v0.3.4
     calculate_three_prime_dg,
+    clear_caches,
 )
 from primerlab.core.insilico.report import (
     generate_markdown_report,
@@ -21,11 +22,13 @@ from primerlab.core.insilico.report import (
 __all__ = [
     "InsilicoPCR",
     "run_insilico_pcr",
+    "run_insilico_pcr_batch",
     "BindingSite",
     "analyze_binding",
     "calculate_corrected_tm",       # v0.3.4
     "check_three_prime_stability",  # v0.3.4
     "calculate_three_prime_dg",
+    "clear_caches",
     "generate_markdown_report",
     "generate_amplicon_fasta",
     "format_console_alignment",
@@ -7,21 +7,84 @@ Advanced binding site analysis including:
 - Binding Tm calculation
 """
 
+import re
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 
 from primerlab.core.logger import get_logger
-from primerlab.core.sequence import reverse_complement, bases_match
+from primerlab.core.sequence import (
+    IUPAC_MASK,
+    iupac_masks,
+    match_flags,
+    reverse_complement,
+)
 
 logger = get_logger()
 
+# Maximum number of memoized 3' ΔG results
+DG_CACHE_SIZE = 4096
 
-@dataclass
+# Template offsets screened per tile; bounds the screen's bitmaps on long templates
+SCREEN_TILE = 1 << 20
+
+# Base pair ΔG values (kcal/mol) - simplified
+NN_DG = {
+    'AA': -1.0, 'TT': -1.0,
+    'AT': -0.9, 'TA': -0.6,
+    'CA': -1.3, 'TG': -1.3,
+    'GT': -1.4, 'AC': -1.4,
+    'CT': -1.5, 'AG': -1.5,
+    'GA': -1.4, 'TC': -1.4,
+    'CG': -2.1,
+    'GC': -2.4,
+    'GG': -1.5, 'CC': -1.5,
+}
+
+# ASCII -> 2-bit base code (A=0, C=1, G=2, T=3); anything else is 4
+_NN_CODE = bytes(
+    'ACGT'.index(chr(c)) if chr(c) in 'ACGT' else 4 for c in range(256)
+)
+
+# NN_DG flattened by code pair (5 * first + second); -1.0 for non-ACGT steps
+_NN_DG_LUT = tuple(
+    NN_DG.get(b1 + b2, -1.0) for b1 in 'ACGTN' for b2 in 'ACGTN'
+)
+
+# Match flag -> alignment character ('|' for any nonzero flag, 'x' for 0)
+_ALIGN_TABLE = b'x' + b'|' * 255
+
+# Per primer base mask: template mask -> b'1' if the bases mismatch, else b'0'
+_MISS_TABLES = tuple(b''.join(b'0' if t & m else b'1' for t in range(256)) for m in range(16))
+
+
+@lru_cache(maxsize=1024)
+def _rc_upper(seq: str) -> str:
+    """Upper-case reverse complement, memoized since primers recur across calls."""
+    return reverse_complement(seq).upper()
+
+
+def _encode_pair(primer: str, target: str) -> Optional[Tuple[bytes, bytes]]:
+    """
+    IUPAC masks for a primer and its target, or None to use match_flags().
+
+    Mask AND is only exact when the primer is pure IUPAC; the target may
+    hold any ASCII characters (they map to 0 and never match).
+    """
+    primer_masks = iupac_masks(primer)
+    if primer_masks is None or not target.isascii():
+        return None
+    return primer_masks, target.encode('ascii').translate(IUPAC_MASK)
+
+
+@dataclass(slots=True)
 class BindingSite:
     """
     Detailed binding site analysis.
     
     Extends basic binding info with thermodynamic analysis.
+    Slotted, since a template scan can produce thousands of sites.
     """
     position: int                   # 0-indexed on template
     strand: str                     # '+' or '-'
@@ -46,7 +109,7 @@ class BindingSite:
 
     # Validation
     is_valid: bool                  # Meets all requirements
-    validation_notes: List[str]     # Why valid/invalid
+    validation_notes: Tuple[str, ...]  # Why valid/invalid
 
     # Visualization
     alignment_str: str              # Visual alignment
@@ -67,11 +130,12 @@ class BindingSite:
             "binding_tm": self.binding_tm,
             "binding_dg": self.binding_dg,
             "is_valid": self.is_valid,
-            "validation_notes": self.validation_notes,
+            "validation_notes": list(self.validation_notes),
             "alignment_str": self.alignment_str
         }
 
 
+@lru_cache(maxsize=DG_CACHE_SIZE)
 def calculate_three_prime_dg(
     primer_3prime: str,
     target_3prime: str,
@@ -94,38 +158,20 @@ def calculate_three_prime_dg(
     """
     # Simplified ΔG calculation using nearest-neighbor
     # Real implementation would use ViennaRNA or full NN tables
-
-    # Base pair ΔG values (kcal/mol) - simplified
-    nn_dg = {
-        'AA': -1.0, 'TT': -1.0,
-        'AT': -0.9, 'TA': -0.6,
-        'CA': -1.3, 'TG': -1.3,
-        'GT': -1.4, 'AC': -1.4,
-        'CT': -1.5, 'AG': -1.5,
-        'GA': -1.4, 'TC': -1.4,
-        'CG': -2.1,
-        'GC': -2.4,
-        'GG': -1.5, 'CC': -1.5,
-    }
-
     total_dg = 0.0
     mismatches = 0
 
-    for i in range(len(primer_3prime) - 1):
-        p1, p2 = primer_3prime[i:i+2].upper()
-        t1, t2 = target_3prime[i:i+2].upper()
+    primer = primer_3prime.upper()
+    matched = match_flags(primer, target_3prime)
+    codes = primer.encode('ascii', 'replace').translate(_NN_CODE)
 
+    for i in range(len(primer) - 1):
         # Check for match (IUPAC aware)
-        if bases_match(p1, t1) and bases_match(p2, t2):
-            dinuc = p1 + p2
-            total_dg += nn_dg.get(dinuc, -1.0)
+        if matched[i] and matched[i + 1]:
+            total_dg += _NN_DG_LUT[codes[i] * 5 + codes[i + 1]]
         else:
-            # Mismatch penalty (IUPAC aware)
-            # Penalize more if it's a true mismatch even after IUPAC resolution
-            if not bases_match(p1, t1) or not bases_match(p2, t2):
-                total_dg += 1.5  # Higher penalty for true mismatch
-            else:
-                total_dg += 0.5  # Slight penalty for degeneracy
+            # True mismatch even after IUPAC resolution
+            total_dg += 1.5
             mismatches += 1
 
     # Salt correction (simplified)
@@ -202,6 +248,12 @@ def check_three_prime_stability(
         return ("ok", None)
 
 
+def clear_caches() -> None:
+    """Clear memoized 3' ΔG and reverse-complement results."""
+    calculate_three_prime_dg.cache_clear()
+    _rc_upper.cache_clear()
+
+
 # Note: check_gc_clamp already exists in primerlab.core.sequence_qc
 # Use that for GC clamp checking to avoid duplication
 
@@ -211,7 +263,8 @@ def analyze_binding(
     target_seq: str,
     position: int,
     strand: str,
-    params: Optional[Dict[str, Any]] = None
+    params: Optional[Dict[str, Any]] = None,
+    matched: Optional[bytes] = None
 ) -> BindingSite:
     """
     Perform detailed binding site analysis.
@@ -222,6 +275,8 @@ def analyze_binding(
         position: Position on template
         strand: '+' or '-'
         params: Analysis parameters
+        matched: Precomputed per-base match flags (nonzero = match);
+            derived from the sequences when omitted
         
     Returns:
         BindingSite with full analysis
@@ -235,9 +290,13 @@ def analyze_binding(
     if len(primer) != len(target):
         raise ValueError(f"Primer ({len(primer)}bp) and target ({len(target)}bp) must be same length")
 
-    # Count matches/mismatches (IUPAC aware)
-    match_count = sum(1 for p, t in zip(primer, target) if bases_match(p, t))
-    mismatch_count = len(primer) - match_count
+    # Per-base match flags (IUPAC aware)
+    if matched is None:
+        matched = match_flags(primer, target)
+
+    # Count matches/mismatches
+    mismatch_count = matched.count(0)
+    match_count = len(primer) - mismatch_count
     match_percent = (match_count / len(primer)) * 100
 
     # Analyze 3' end (last 5bp of primer)
@@ -245,12 +304,8 @@ def analyze_binding(
     primer_3p = primer[-three_prime_len:]
     target_3p = target[-three_prime_len:]
 
-    three_prime_match = 0
-    for p, t in zip(reversed(primer), reversed(target)):
-        if bases_match(p, t):
-            three_prime_match += 1
-        else:
-            break
+    # Perfect-match run at the 3' end: everything after the last mismatch
+    three_prime_match = len(matched) - 1 - matched.rfind(0)
 
     # Calculate 3' ΔG
     three_prime_dg = calculate_three_prime_dg(
@@ -261,31 +316,21 @@ def analyze_binding(
 
     # Analyze 5' end (first 5bp of primer)
     five_prime_len = min(5, len(primer))
-    five_prime_mismatch = sum(
-        1 for p, t in zip(primer[:five_prime_len], target[:five_prime_len])
-        if not bases_match(p, t)
-    )
+    five_prime_mismatch = matched[:five_prime_len].count(0)
 
     # Calculate overall binding Tm (simplified)
     # Real implementation would use ViennaRNA
-    gc_count = sum(1 for b in primer if b in 'GC')
+    gc_count = primer.count('G') + primer.count('C')
     gc_percent = (gc_count / len(primer)) * 100
     base_tm = 64.9 + 41 * (gc_count - 16.4) / len(primer)  # Simplified
 
     # v0.3.4: Use calculate_corrected_tm for mismatch correction
-    # Calculate weighted mismatches (3' mismatches count more)
-    weighted_mismatches = 0
-    for i in range(len(primer)):
-        if not bases_match(primer[i], target[i]):
-            dist_from_3prime = len(primer) - 1 - i
-            if dist_from_3prime < 5:
-                weighted_mismatches += 2.0  # 3' mismatches count double
-            else:
-                weighted_mismatches += 1.0
+    # Calculate weighted mismatches (3' mismatches count double)
+    weighted_mismatches = mismatch_count + matched[-5:].count(0)
 
     binding_tm = calculate_corrected_tm(
         primer, target, base_tm, 
-        int(weighted_mismatches),
+        weighted_mismatches,
         correction_per_mismatch=params.get("tm_correction_per_mismatch", 2.5)
     )
     binding_tm = max(30, min(90, binding_tm))  # Clamp
@@ -331,7 +376,7 @@ def analyze_binding(
         validation_notes.append("All requirements met")
 
     # Create alignment string
-    alignment_str = ''.join('|' if bases_match(p, t) else 'x' for p, t in zip(primer, target))
+    alignment_str = matched.translate(_ALIGN_TABLE).decode('ascii')
 
     return BindingSite(
         position=position,
@@ -347,11 +392,224 @@ def analyze_binding(
         binding_tm=round(binding_tm, 1),
         binding_dg=round(binding_dg, 2),
         is_valid=is_valid,
-        validation_notes=validation_notes,
+        validation_notes=tuple(validation_notes),
         alignment_str=alignment_str
     )
 
 
+def encode_template(template: str) -> Optional[bytes]:
+    """
+    IUPAC masks of a template in either case, or None if it is not ASCII.
+
+    Pass the result to screen_binding_offsets() to share one encoding
+    between several screens of the same template.
+    """
+    if not template.isascii():
+        return None
+    return template.encode('ascii').translate(IUPAC_MASK)
+
+
+def _screen_offsets(
+    primer: str,
+    template: str,
+    masks: Optional[Tuple[bytes, bytes]],
+    min_matches: int,
+    miss_bits: Dict[int, int],
+    count: int
+) -> List[int]:
+    """
+    Offsets below count where at least min_matches primer bases match the template.
+
+    With IUPAC masks the screen is bit-parallel: bit i of an integer stands
+    for template offset i. For each primer base j, the offsets it mismatches
+    are that base's template miss bitmap shifted down by j, and a ladder of
+    saturating bitmaps (more than 0, 1, ... allowed mismatches so far)
+    absorbs them with a few AND/OR operations per base. miss_bits caches the
+    template bitmaps per primer base mask and may be shared across primers
+    on the same template.
+    """
+    primer_len = len(primer)
+
+    if masks is None:
+        return [
+            i for i in range(count)
+            if primer_len - match_flags(primer, template[i:i + primer_len]).count(0) >= min_matches
+        ]
+
+    primer_masks, template_masks = masks
+    allowed = primer_len - min_matches
+    if allowed < 0:
+        return []
+
+    # over[k]: offsets with more than k mismatches so far
+    over = [0] * (allowed + 1)
+    for j, mask in enumerate(primer_masks):
+        bits = miss_bits.get(mask)
+        if bits is None:
+            # Reversed so that template position i becomes bit i
+            bits = int(template_masks.translate(_MISS_TABLES[mask])[::-1], 2)
+            miss_bits[mask] = bits
+        miss = bits >> j
+        for k in range(allowed, 0, -1):
+            over[k] |= over[k - 1] & miss
+        over[0] |= miss
+
+    passing = ~over[allowed] & ((1 << count) - 1)
+    if not passing:
+        return []
+
+    flags = format(passing, 'b')[::-1]
+    offsets = []
+    i = flags.find('1')
+    while i >= 0:
+        offsets.append(i)
+        i = flags.find('1', i + 1)
+    return offsets
+
+
+def _screen_template(
+    searches: List[Tuple[str, Optional[bytes], int]],
+    template_seq: str,
+    template_masks: Optional[bytes],
+    miss_cache: Optional[Dict[Tuple[int, int], Dict[int, int]]] = None
+) -> List[List[int]]:
+    """
+    Screen several primers against a template, one tile at a time.
+
+    Each search is (search primer, its IUPAC masks, minimum matches). The
+    template is cut into SCREEN_TILE offsets (plus the overlap a window
+    needs) so the screen's bitmaps stay bounded and cache-sized however
+    long the template is; within a tile, the miss bitmaps are shared by
+    every primer. Given a miss_cache, each tile's bitmaps are kept there
+    under (start, stop) for later screens of the same template.
+    """
+    hits: List[List[int]] = [[] for _ in searches]
+    longest = max((len(search[0]) for search in searches), default=1)
+    template_len = len(template_seq)
+
+    for start in range(0, template_len, SCREEN_TILE):
+        stop = min(start + SCREEN_TILE + longest - 1, template_len)
+        tile_seq = template_seq[start:stop]
+        tile_masks = template_masks[start:stop] if template_masks is not None else None
+        if miss_cache is None:
+            miss_bits: Dict[int, int] = {}
+        else:
+            miss_bits = miss_cache.setdefault((start, stop), {})
+
+        for found, (search_primer, search_masks, min_matches) in zip(hits, searches):
+            count = min(SCREEN_TILE, template_len - len(search_primer) + 1 - start)
+            if count <= 0:
+                continue
+            masks = None
+            if search_masks is not None and tile_masks is not None:
+                masks = (search_masks, tile_masks)
+            offsets = _screen_offsets(
+                search_primer, tile_seq, masks, min_matches, miss_bits, count
+            )
+            found.extend(start + i for i in offsets)
+
+    return hits
+
+
+def screen_binding_offsets(
+    primer_seqs: Sequence[str],
+    template_seq: str,
+    min_matches: Sequence[int],
+    template_masks: Optional[bytes] = None,
+    miss_cache: Optional[Dict[Tuple[int, int], Dict[int, int]]] = None
+) -> List[List[int]]:
+    """
+    Template offsets where each primer matches at least its minimum number of bases.
+
+    Matching is IUPAC aware as in bases_match(). The template is encoded
+    once and all windows are screened bit-parallel, so no per-window
+    Python work is done.
+
+    Args:
+        primer_seqs: Primers to screen, as they should align to the template
+        template_seq: Template sequence
+        min_matches: Fewest matching bases to accept, one per primer
+        template_masks: encode_template(template_seq), if already computed
+        miss_cache: Dict reused across screens of this same template, so its
+            per-base mismatch bitmaps are built only once (optional)
+
+    Returns:
+        One ascending list of window start offsets per primer, in input order
+    """
+    if template_masks is None:
+        template_masks = encode_template(template_seq)
+    searches = [
+        (primer_seq, iupac_masks(primer_seq), matches)
+        for primer_seq, matches in zip(primer_seqs, min_matches, strict=True)
+    ]
+    return _screen_template(searches, template_seq, template_masks, miss_cache)
+
+
+def _search_for(primer_seq: str, strand: str, threshold: float) -> Tuple[str, Optional[bytes], int]:
+    """Search primer, its masks and the fewest matches reaching the report threshold."""
+    # For reverse strand, search for reverse complement binding
+    if strand == '-':
+        search_primer = _rc_upper(primer_seq)
+    else:
+        search_primer = primer_seq.upper()
+
+    # Fewest matching bases that still reach the report threshold
+    primer_len = len(search_primer)
+    min_matches = next(
+        (c for c in range(primer_len + 1) if (c / primer_len) * 100 >= threshold),
+        primer_len + 1
+    )
+    return search_primer, iupac_masks(search_primer), min_matches
+
+
+def _find_sites(
+    primer_seq: str,
+    template_seq: str,
+    template_masks: Optional[bytes],
+    search_masks: Optional[bytes],
+    offsets: List[int],
+    strand: str,
+    params: Dict[str, Any]
+) -> List[BindingSite]:
+    """Analyze and rank the screened binding sites of one primer."""
+    sites = []
+    primer_len = len(primer_seq)
+
+    # Sites are analyzed against primer_seq itself on either strand; reuse
+    # the template masks so each site's match row is a single AND
+    site_bits = None
+    window_masks = b""
+    if search_masks is not None and template_masks is not None:
+        site_masks = iupac_masks(primer_seq.upper()) if strand == '-' else search_masks
+        if site_masks is not None:
+            site_bits = int.from_bytes(site_masks, 'big')
+            window_masks = template_masks
+
+    for i in offsets:
+        matched = None
+        if site_bits is not None:
+            window = int.from_bytes(window_masks[i:i + primer_len], 'big')
+            matched = (site_bits & window).to_bytes(primer_len, 'big')
+
+        site = analyze_binding(
+            primer_seq=primer_seq,
+            target_seq=template_seq[i:i + primer_len].upper(),
+            position=i,
+            strand=strand,
+            params=params,
+            matched=matched
+        )
+        sites.append(site)
+
+    # Sort by quality (match%, 3' match, ΔG): stable passes from the least
+    # significant key up, so no key tuple is built per site
+    sites.sort(key=attrgetter('three_prime_dg'))
+    sites.sort(key=attrgetter('three_prime_match'), reverse=True)
+    sites.sort(key=attrgetter('match_percent'), reverse=True)
+
+    return sites
+
+
 def find_all_binding_sites(
     primer_seq: str,
     template_seq: str,
@@ -370,40 +628,50 @@ def find_all_binding_sites(
     Returns:
         List of BindingSite objects, sorted by quality
     """
-    params = params or {}
-    sites = []
-    primer_len = len(primer_seq)
-    threshold = params.get("report_threshold", 70)
-
-    # For reverse strand, search for reverse complement binding
-    if strand == '-':
-        search_primer = reverse_complement(primer_seq)
-    else:
-        search_primer = primer_seq
+    return find_all_binding_sites_batch([primer_seq], template_seq, strand, params)[0]
 
-    template_upper = template_seq.upper()
 
-    for i in range(len(template_upper) - primer_len + 1):
-        target_region = template_upper[i:i + primer_len]
+def find_all_binding_sites_batch(
+    primer_seqs: Sequence[str],
+    template_seq: str,
+    strand: str,
+    params: Optional[Dict[str, Any]] = None
+) -> List[List[BindingSite]]:
+    """
+    Find all binding sites for several primers on one template.
 
-        # Quick check - count matches
-        matches = sum(1 for p, t in zip(search_primer.upper(), target_region) if bases_match(p, t))
-        match_pct = (matches / primer_len) * 100
+    The template is mask-encoded once and screened tile by tile, with each
+    tile's per-base mismatch bitmaps shared by every primer.
 
-        if match_pct >= threshold:
-            site = analyze_binding(
-                primer_seq=primer_seq,
-                target_seq=target_region,
-                position=i,
-                strand=strand,
-                params=params
-            )
-            sites.append(site)
+    Args:
+        primer_seqs: Primer sequences (any lengths)
+        template_seq: Template sequence
+        strand: '+' or '-'
+        params: Analysis parameters
 
-    # Sort by quality (match%, 3' match, ΔG)
-    sites.sort(key=lambda s: (-s.match_percent, -s.three_prime_match, s.three_prime_dg))
+    Returns:
+        One list of BindingSite objects per primer, in input order,
+        each sorted by quality as in find_all_binding_sites
+    """
+    params = params or {}
+    threshold = params.get("report_threshold", 70)
 
-    return sites
+    # Masks are case-insensitive, so only the reported site slices are
+    # upper-cased rather than the whole template
+    template_masks = encode_template(template_seq)
+    searches = [
+        _search_for(primer_seq, strand, threshold)
+        if len(primer_seq) <= len(template_seq) else (primer_seq, None, 0)
+        for primer_seq in primer_seqs
+    ]
+    hits = _screen_template(searches, template_seq, template_masks)
+    return [
+        _find_sites(
+            primer_seq, template_seq, template_masks, search[1], offsets,
+            strand, params
+        )
+        for primer_seq, search, offsets in zip(primer_seqs, searches, hits)
+    ]
 
 
 def check_primer_dimer(
@@ -433,57 +701,61 @@ def check_primer_dimer(
     """
     fwd = forward_primer.upper()
     rev = reverse_primer.upper()
-    rev_rc = reverse_complement(reverse_primer).upper()
+    rev_rc = _rc_upper(reverse_primer)
 
     # Check Fwd 3' against Rev 5' (most problematic)
     # and Fwd against Rev reverse complement
 
+    # Slide forward primer against reverse complement of reverse primer.
+    # Row k holds the match flags of fwd[i] against rev_rc[i + offset] (0
+    # outside the overlap); all rows are laid end to end with a zero byte
+    # between them, so each nonzero run is a stretch of consecutive
+    # complementarity within a single offset.
+    fwd_len = len(fwd)
+    offsets = range(-fwd_len + 1, len(rev_rc))
+    masks = _encode_pair(fwd, rev_rc)
+
+    if masks is not None:
+        padding = bytes(fwd_len)
+        padded_rev = padding + masks[1] + padding
+        windows = b'\0'.join([padded_rev[fwd_len + offset:2 * fwd_len + offset] for offset in offsets])
+        fwd_rows = b'\0'.join([masks[0]] * len(offsets))
+        both = int.from_bytes(fwd_rows, 'big') & int.from_bytes(windows, 'big')
+        matched = both.to_bytes(len(windows), 'big')
+    else:
+        rows = []
+        for offset in offsets:
+            lo = max(0, -offset)
+            hi = min(fwd_len, len(rev_rc) - offset)
+            rows.append(bytes(lo))
+            rows.append(match_flags(fwd[lo:hi], rev_rc[lo + offset:hi + offset]))
+            rows.append(bytes(fwd_len - hi + 1))
+        matched = b''.join(rows)[:-1]
+
+    max_complementary = max(map(len, matched.split(b'\0')))
+
     dimer_regions = []
-    max_complementary = 0
-
-    # Slide forward primer against reverse complement of reverse primer
-    for offset in range(-len(fwd) + 1, len(rev_rc)):
-        complementary = 0
-        start_pos = None
-
-        for i in range(len(fwd)):
-            j = i + offset
-            if 0 <= j < len(rev_rc):
-                if bases_match(fwd[i], rev_rc[j]):
-                    if start_pos is None:
-                        start_pos = i
-                    complementary += 1
-                else:
-                    if complementary >= min_complementary:
-                        dimer_regions.append({
-                            "fwd_start": start_pos,
-                            "fwd_end": i,
-                            "length": complementary,
-                            "type": "internal"
-                        })
-                    max_complementary = max(max_complementary, complementary)
-                    complementary = 0
-                    start_pos = None
-
-        # Check remaining
-        if complementary >= min_complementary:
+    if max_complementary >= min_complementary:
+        stride = fwd_len + 1
+        long_run = rb'[^\x00]{%d,}' % max(min_complementary, 1)
+        for run in re.finditer(long_run, matched):
+            start_pos = run.start() % stride
+            complementary = run.end() - run.start()
             dimer_regions.append({
                 "fwd_start": start_pos,
                 "fwd_end": start_pos + complementary,
                 "length": complementary,
                 "type": "internal"
             })
-        max_complementary = max(max_complementary, complementary)
+            if len(dimer_regions) == 5:
+                break
 
     # Check 3' end specifically (most critical for extension)
-    three_prime_complementary = 0
     fwd_3prime = fwd[-6:]  # Last 6 bases
     rev_3prime = rev[-6:]
-    rev_3prime_rc = reverse_complement(rev_3prime).upper()
+    rev_3prime_rc = _rc_upper(rev_3prime)
 
-    for i, (f, r) in enumerate(zip(fwd_3prime, rev_3prime_rc)):
-        if bases_match(f, r):
-            three_prime_complementary += 1
+    three_prime_complementary = sum(1 for m in match_flags(fwd_3prime, rev_3prime_rc) if m)
 
     # Determine severity
     has_dimer = max_complementary >= min_complementary
@@ -6,12 +6,15 @@ Simulates primer binding and amplicon prediction.
 """
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Any
 from pathlib import Path
 
 from primerlab.core.logger import get_logger
-from primerlab.core.sequence import reverse_complement, bases_match
+from primerlab.core.sequence import iupac_masks, match_flags, reverse_complement
+from primerlab.core.insilico.binding import encode_template, screen_binding_offsets
 
 logger = get_logger()
 
@@ -45,6 +48,30 @@ DEFAULT_INSILICO_PARAMS = {
 }
 
 
+class _LazyAlignment:
+    """
+    Descriptor for PrimerBinding.alignment.
+
+    find_binding_sites only records the template bases under the primer;
+    the visual alignment is drawn from them on first read and cached.
+    """
+
+    def __get__(self, obj: Optional["PrimerBinding"], owner: Any = None) -> str:
+        if obj is None:
+            return ""  # dataclass field default
+        alignment = obj.__dict__.get("_alignment", "")
+        if not alignment and obj.target_region:
+            primer = obj.primer_seq.upper()
+            if obj.strand == '-':
+                primer = _rc_cached(primer)
+            alignment = create_alignment_string(primer, obj.target_region)
+            obj.__dict__["_alignment"] = alignment
+        return alignment
+
+    def __set__(self, obj: "PrimerBinding", value: str) -> None:
+        obj.__dict__["_alignment"] = value
+
+
 @dataclass
 class PrimerBinding:
     """Represents a primer binding site on the template."""
@@ -57,7 +84,8 @@ class PrimerBinding:
     three_prime_match: int          # perfect match bp at 3' end
     binding_tm: float               # calculated Tm at binding site
     is_valid: bool                  # meets minimum requirements
-    alignment: str = ""             # visual alignment string
+    alignment: _LazyAlignment = _LazyAlignment()  # visual alignment string
+    target_region: str = field(default="", repr=False)  # template bases under the primer
 
     def to_dict(self) -> Dict[str, Any]:
         """Export to dictionary for JSON serialization."""
@@ -139,6 +167,48 @@ class InsilicoPCRResult:
         }
 
 
+# IUPAC masks of the four unambiguous bases (A, C, G, T)
+_PLAIN_BASE_MASKS = b'\x01\x02\x04\x08'
+
+
+def _is_plain(masks: Optional[bytes]) -> bool:
+    """True if masks encode only A, C, G and T (in either case)."""
+    return masks is not None and not masks.translate(None, _PLAIN_BASE_MASKS)
+
+
+@dataclass
+class TemplateContext:
+    """Template encoded once for every binding scan run against it."""
+    sequence: str
+    masks: Optional[bytes]          # IUPAC masks (None if not ASCII)
+    plain_upper: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Screen mismatch bitmaps, shared by every primer scanned on this template
+    miss_cache: Dict[Tuple[int, int], Dict[int, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_sequence(cls, sequence: str) -> "TemplateContext":
+        """Encode a template for reuse across scans."""
+        return cls(sequence=sequence, masks=encode_template(sequence))
+
+    def exact_text(self) -> Optional[str]:
+        """
+        Upper-cased template for exact substring search, or None.
+
+        Only templates made purely of A, C, G and T qualify, since a
+        degenerate template base can match several primer bases. Built on
+        first use and kept for later scans.
+        """
+        if self.plain_upper is None:
+            self.plain_upper = self.sequence.upper() if _is_plain(self.masks) else ""
+        return self.plain_upper or None
+
+
+@lru_cache(maxsize=2048)
+def _rc_cached(seq: str) -> str:
+    """Reverse complement, memoized since the same primers are scanned repeatedly."""
+    return reverse_complement(seq)
 
 
 def calculate_match_percent(primer: str, target: str) -> Tuple[float, int, int]:
@@ -155,27 +225,71 @@ def calculate_match_percent(primer: str, target: str) -> Tuple[float, int, int]:
         target = target.ljust(max_len, 'N')
 
     # v0.2.1: IUPAC aware matching
-    matches = sum(1 for p, t in zip(primer.upper(), target.upper()) if bases_match(p, t))
-    mismatches = len(primer) - matches
-    match_percent = (matches / len(primer)) * 100
-
-    # Count 3' end perfect match (from 3' end of primer)
-    three_prime_match = 0
-    for p, t in zip(reversed(primer.upper()), reversed(target.upper())):
-        if bases_match(p, t):
-            three_prime_match += 1
-        else:
-            break
+    return _match_stats(match_flags(primer, target))
+
+
+def _match_stats(matched: bytes) -> Tuple[float, int, int]:
+    """Match percent, mismatches and 3' end matches from per-base match flags."""
+    mismatches = matched.count(0)
+    match_percent = ((len(matched) - mismatches) / len(matched)) * 100
+
+    # Count 3' end perfect match: everything after the last mismatch
+    three_prime_match = len(matched) - 1 - matched.rfind(0)
 
     return match_percent, mismatches, three_prime_match
 
 
+def _mask_stats(both: int, lanes: int, length: int) -> Tuple[float, int, int]:
+    """
+    _match_stats() for a window's ANDed IUPAC masks packed into one integer.
+
+    Each base is a byte lane (3' end lowest) holding its 4-bit mask AND.
+    Folding each lane onto its low bit leaves one bit per matching base,
+    so mismatches are a popcount and the 3' run is the lowest mismatch lane.
+    """
+    both |= both >> 2
+    both |= both >> 1
+    misses = ~both & lanes
+    mismatches = misses.bit_count()
+    match_percent = ((length - mismatches) / length) * 100
+
+    # Count 3' end perfect match: lanes below the lowest mismatch
+    three_prime_match = ((misses & -misses).bit_length() - 1) // 8 if misses else length
+
+    return match_percent, mismatches, three_prime_match
+
+
+def _scan_offsets(
+    search_seq: str,
+    segment: str,
+    masks: Optional[bytes],
+    exact_text: Optional[str],
+    min_matches: int,
+    miss_cache: Optional[Dict[Tuple[int, int], Dict[int, int]]] = None
+) -> List[int]:
+    """Offsets of the windows of a template segment with at least min_matches matches."""
+    if exact_text is None:
+        return screen_binding_offsets(
+            [search_seq], segment, [min_matches], template_masks=masks, miss_cache=miss_cache
+        )[0]
+
+    # Only perfect matches are reported and neither sequence is
+    # degenerate, so a plain substring search finds every window
+    offsets = []
+    i = exact_text.find(search_seq)
+    while i >= 0:
+        offsets.append(i)
+        i = exact_text.find(search_seq, i + 1)
+    return offsets
+
+
 def find_binding_sites(
     primer_seq: str,
     template_seq: str,
     primer_name: str,
     strand: str,
-    params: Dict[str, Any]
+    params: Dict[str, Any],
+    context: Optional[TemplateContext] = None
 ) -> List[PrimerBinding]:
     """
     Find all potential binding sites for a primer on the template.
@@ -186,6 +300,7 @@ def find_binding_sites(
         primer_name: Name of the primer
         strand: '+' for forward, '-' for reverse
         params: In-silico parameters
+        context: Encoded template_seq to reuse (encoded here if omitted)
         
     Returns:
         List of PrimerBinding objects
@@ -196,56 +311,108 @@ def find_binding_sites(
 
     # For reverse primer, we look for binding to the reverse complement
     if strand == '-':
-        search_seq = reverse_complement(primer_upper)
+        search_seq = _rc_cached(primer_upper)
     else:
         search_seq = primer_upper
 
-    template_upper = template_seq.upper()
-    template_len = len(template_upper)
-
-    # v0.2.1: Circular template support
-    is_circular = params.get("circular", False)
-    search_template = template_upper + template_upper[:primer_len-1] if is_circular else template_upper
-
-    # Slide along template looking for potential binding sites
-    for i in range(len(search_template) - primer_len + 1):
-        target_region = search_template[i:i + primer_len]
-
-        match_pct, mismatches, three_prime_match = calculate_match_percent(
-            search_seq, target_region
+    # Matching and alignment are case-insensitive, so the template is
+    # searched as given instead of copying it upper-cased on every call
+    if context is None:
+        context = TemplateContext.from_sequence(template_seq)
+
+    # Screen every window for the report threshold at once; only windows
+    # that reach it are scored and reported
+    report_threshold = params.get("report_threshold", 70)
+    min_matches = next(
+        (c for c in range(primer_len + 1) if (c / primer_len) * 100 >= report_threshold),
+        primer_len + 1
+    )
+    primer_masks = iupac_masks(search_seq)
+    exact_text = None
+    if min_matches == primer_len and _is_plain(primer_masks):
+        exact_text = context.exact_text()
+
+    # Template segments to scan: (position of the segment on the template,
+    # sequence, IUPAC masks, upper-cased text for exact search, bitmap cache)
+    segments: List[Tuple[
+        int, str, Optional[bytes], Optional[str], Optional[Dict[Tuple[int, int], Dict[int, int]]]
+    ]] = [(0, template_seq, context.masks, exact_text, context.miss_cache)]
+
+    # v0.2.1: Circular template support. Windows that wrap past the end all
+    # start in the last primer_len-1 bases, so only that tail plus the
+    # first primer_len-1 bases is scanned again, not a doubled template
+    if params.get("circular", False):
+        wrap = max(len(template_seq) - primer_len + 1, 0)
+        junction = template_seq[wrap:] + template_seq[:primer_len-1]
+        junction_masks = None
+        if context.masks is not None:
+            junction_masks = context.masks[wrap:] + context.masks[:primer_len-1]
+        junction_text = junction.upper() if exact_text is not None else None
+        segments.append((wrap, junction, junction_masks, junction_text, None))
+
+    positions = []
+    regions = []
+    region_masks = []
+    for start, segment, masks, text, miss_cache in segments:
+        for i in _scan_offsets(search_seq, segment, masks, text, min_matches, miss_cache):
+            positions.append(start + i)
+            regions.append(segment[i:i + primer_len])
+            if masks is not None:
+                region_masks.append(masks[i:i + primer_len])
+
+    # Score the screened windows into parallel columns, then order window
+    # indices by match quality (best first) with stable passes from the
+    # least significant key up; PrimerBinding objects are only built once,
+    # in their final order
+    if primer_masks is not None and context.masks is not None:
+        primer_bits = int.from_bytes(primer_masks, 'big')
+        lanes = int.from_bytes(b'\x01' * primer_len, 'big')
+        scores = [
+            _mask_stats(primer_bits & int.from_bytes(masks, 'big'), lanes, primer_len)
+            for masks in region_masks
+        ]
+    else:
+        scores = [_match_stats(match_flags(search_seq, region)) for region in regions]
+    match_pcts, mismatch_counts, three_prime_matches = (
+        tuple(zip(*scores)) if scores else ((), (), ())
+    )
+    order = list(range(len(positions)))
+    order.sort(key=three_prime_matches.__getitem__, reverse=True)
+    order.sort(key=match_pcts.__getitem__, reverse=True)
+
+    # Binding requirements, read once rather than per binding
+    min_total_match = params.get("min_total_match_percent", 80)
+    min_3prime_match = params.get("min_3prime_match", 3)
+    max_mismatches = primer_len - min_3prime_match + params.get("max_5prime_mismatch", 2)
+
+    for k in order:
+        match_pct = match_pcts[k]
+        mismatches = mismatch_counts[k]
+        three_prime_match = three_prime_matches[k]
+
+        # Validate against binding requirements
+        is_valid = (
+            match_pct >= min_total_match and
+            three_prime_match >= min_3prime_match and
+            mismatches <= max_mismatches
         )
 
-        # Check if this site meets minimum threshold for reporting
-        if match_pct >= params.get("report_threshold", 70):
-            # Validate against binding requirements
-            is_valid = (
-                match_pct >= params.get("min_total_match_percent", 80) and
-                three_prime_match >= params.get("min_3prime_match", 3) and
-                mismatches <= primer_len - params.get("min_3prime_match", 3) + params.get("max_5prime_mismatch", 2)
-            )
-
-            # TODO: Calculate binding Tm using ViennaRNA
-            binding_tm = 60.0  # Placeholder
-
-            # Create alignment string
-            alignment = create_alignment_string(search_seq, target_region)
-
-            binding = PrimerBinding(
-                primer_name=primer_name,
-                primer_seq=primer_seq,
-                strand=strand,
-                position=i,
-                match_percent=match_pct,
-                mismatches=mismatches,
-                three_prime_match=three_prime_match,
-                binding_tm=binding_tm,
-                is_valid=is_valid,
-                alignment=alignment
-            )
-            bindings.append(binding)
-
-    # Sort by match quality (best first)
-    bindings.sort(key=lambda b: (-b.match_percent, -b.three_prime_match))
+        # TODO: Calculate binding Tm using ViennaRNA
+        binding_tm = 60.0  # Placeholder
+
+        binding = PrimerBinding(
+            primer_name=primer_name,
+            primer_seq=primer_seq,
+            strand=strand,
+            position=positions[k],
+            match_percent=match_pct,
+            mismatches=mismatches,
+            three_prime_match=three_prime_match,
+            binding_tm=binding_tm,
+            is_valid=is_valid,
+            target_region=regions[k]
+        )
+        bindings.append(binding)
 
     return bindings
 
@@ -276,71 +443,72 @@ def predict_products(
     - Reverse primer downstream of forward primer
     - Product size within range
     """
-    products = []
-
     min_size = params.get("product_size_min", 50)
     max_size = params.get("product_size_max", 10000)
     max_products = params.get("max_products", 10)
-
-    for fwd in forward_bindings:
-        if not fwd.is_valid:
-            continue
-
-        for rev in reverse_bindings:
-            if not rev.is_valid:
-                continue
-
-            # Calculate product size
-            # Forward primer starts at fwd.position
-            # Reverse primer's 3' end is at rev.position (on the reverse strand)
-            # Product includes both primers
-            fwd_start = fwd.position
-            rev_end = rev.position + len(rev.primer_seq)
-
-            product_size = rev_end - fwd_start
-
-            # Skip if wrong orientation or size
-            if product_size < min_size or product_size > max_size:
-                continue
-
-            # Extract product sequence
-            product_seq = template_seq[fwd_start:rev_end]
-
-            # Calculate likelihood score (average of binding qualities)
-            # v0.2.1: Weighted likelihood - penalize 3' mismatches more
-            fwd_score = (fwd.match_percent * 0.7) + (min(10, fwd.three_prime_match) * 3)
-            rev_score = (rev.match_percent * 0.7) + (min(10, rev.three_prime_match) * 3)
-            likelihood = (fwd_score + rev_score) / 2
-
+    max_extension = params.get("max_amplicon_for_extension", 3000)
+
+    forward = [fwd for fwd in forward_bindings if fwd.is_valid]
+    reverse = [rev for rev in reverse_bindings if rev.is_valid]
+
+    # Calculate likelihood score (average of binding qualities)
+    # v0.2.1: Weighted likelihood - penalize 3' mismatches more
+    fwd_scores = [(fwd.match_percent * 0.7) + (min(10, fwd.three_prime_match) * 3) for fwd in forward]
+    rev_scores = [(rev.match_percent * 0.7) + (min(10, rev.three_prime_match) * 3) for rev in reverse]
+
+    # Calculate product size
+    # Forward primer starts at fwd.position
+    # Reverse primer's 3' end is at rev.position (on the reverse strand)
+    # Product includes both primers
+    rev_ends = [rev.position + len(rev.primer_seq) for rev in reverse]
+
+    # Reverse bindings by 3' end, so each forward binding only visits the
+    # ends that give a product size within range
+    by_end = sorted(range(len(reverse)), key=rev_ends.__getitem__)
+    sorted_ends = [rev_ends[j] for j in by_end]
+
+    # Candidate pairs as (-likelihood, fwd index, rev index): sorting them
+    # orders by likelihood (best first), ties in forward-then-reverse order
+    candidates = []
+    for i, fwd in enumerate(forward):
+        fwd_start = fwd.position
+        lo = bisect_left(sorted_ends, fwd_start + min_size)
+        hi = bisect_right(sorted_ends, fwd_start + max_size)
+        for j in by_end[lo:hi]:
             # Normalize to 0-100 (roughly)
-            likelihood = min(100.0, likelihood)
-
-            # Check for warnings
-            warnings = []
-            if product_size > params.get("max_amplicon_for_extension", 3000):
-                warnings.append(f"Long amplicon ({product_size}bp) may need extended extension time")
-
-            product = AmpliconPrediction(
-                forward_binding=fwd,
-                reverse_binding=rev,
-                product_size=product_size,
-                product_sequence=product_seq,
-                start_position=fwd_start,
-                end_position=rev_end,
-                likelihood_score=likelihood,
-                warnings=warnings
-            )
-            products.append(product)
+            likelihood = min(100.0, (fwd_scores[i] + rev_scores[j]) / 2)
+            candidates.append((-likelihood, i, j))
+    candidates.sort()
+
+    # Build products only for the pairs that are kept
+    products = []
+    for neg_likelihood, i, j in candidates[:max_products]:
+        fwd_start = forward[i].position
+        rev_end = rev_ends[j]
+        product_size = rev_end - fwd_start
 
-    # Sort by likelihood (best first)
-    products.sort(key=lambda p: -p.likelihood_score)
+        # Check for warnings
+        warnings = []
+        if product_size > max_extension:
+            warnings.append(f"Long amplicon ({product_size}bp) may need extended extension time")
+
+        product = AmpliconPrediction(
+            forward_binding=forward[i],
+            reverse_binding=reverse[j],
+            product_size=product_size,
+            product_sequence=template_seq[fwd_start:rev_end],
+            start_position=fwd_start,
+            end_position=rev_end,
+            likelihood_score=-neg_likelihood,
+            warnings=warnings
+        )
+        products.append(product)
 
     # Mark primary product
     if products:
         products[0].is_primary = True
 
-    # Limit to max products
-    return products[:max_products]
+    return products
 
 
 class InsilicoPCR:
@@ -371,7 +539,8 @@ class InsilicoPCR:
         template: str,
         forward_primer: str,
         reverse_primer: str,
-        template_name: str = "template"
+        template_name: str = "template",
+        context: Optional[TemplateContext] = None
     ) -> InsilicoPCRResult:
         """
         Run in-silico PCR simulation.
@@ -381,11 +550,12 @@ class InsilicoPCR:
             forward_primer: Forward primer sequence (5' to 3')
             reverse_primer: Reverse primer sequence (5' to 3')
             template_name: Name for the template
+            context: Encoded template to reuse (encoded here if omitted)
             
         Returns:
             InsilicoPCRResult with all predictions
         """
-        logger.info(f"Running in-silico PCR on {template_name}")
+        logger.info("Running in-silico PCR on %s", template_name)
 
         warnings = []
         errors = []
@@ -393,6 +563,20 @@ class InsilicoPCR:
         # Validate inputs
         if len(template) < 50:
             errors.append("Template sequence too short (< 50bp)")
+        else:
+            # Cases that cannot yield meaningful bindings fail before the
+            # template is scanned
+            longest_primer = max(len(forward_primer), len(reverse_primer))
+            if not self.params.get("circular", False) and longest_primer > len(template):
+                errors.append("Primer longer than template")
+            for label, primer in (("Forward", forward_primer), ("Reverse", reverse_primer)):
+                if not primer:
+                    errors.append(f"{label} primer is empty")
+                elif not primer.upper().strip("N"):
+                    errors.append(f"{label} primer contains only N bases")
+
+
+        if errors:
             return InsilicoPCRResult(
                 success=False,
                 template_name=template_name,
@@ -406,6 +590,13 @@ class InsilicoPCR:
                 errors=errors
             )
 
+        if forward_primer.upper() == reverse_primer.upper():
+            warnings.append("Forward and reverse primers are identical - only single-primer products possible")
+
+        # Encode the template once for both primer scans
+        if context is None:
+            context = TemplateContext.from_sequence(template)
+
         # Find forward primer binding sites (+ strand)
         logger.debug("Finding forward primer binding sites...")
         forward_bindings = find_binding_sites(
@@ -413,14 +604,15 @@ class InsilicoPCR:
             template_seq=template,
             primer_name="Forward",
             strand='+',
-            params=self.params
+            params=self.params,
+            context=context
         )
 
         if not forward_bindings:
             warnings.append("No forward primer binding sites found")
         else:
             valid_fwd = sum(1 for b in forward_bindings if b.is_valid)
-            logger.info(f"Found {len(forward_bindings)} forward binding sites ({valid_fwd} valid)")
+            logger.info("Found %d forward binding sites (%d valid)", len(forward_bindings), valid_fwd)
 
         # Find reverse primer binding sites (- strand)
         logger.debug("Finding reverse primer binding sites...")
@@ -429,14 +621,15 @@ class InsilicoPCR:
             template_seq=template,
             primer_name="Reverse",
             strand='-',
-            params=self.params
+            params=self.params,
+            context=context
         )
 
         if not reverse_bindings:
             warnings.append("No reverse primer binding sites found")
         else:
             valid_rev = sum(1 for b in reverse_bindings if b.is_valid)
-            logger.info(f"Found {len(reverse_bindings)} reverse binding sites ({valid_rev} valid)")
+            logger.info("Found %d reverse binding sites (%d valid)", len(reverse_bindings), valid_rev)
 
         # Predict products
         products = predict_products(
@@ -460,7 +653,7 @@ class InsilicoPCR:
         if not products:
             warnings.append("No valid products predicted")
         else:
-            logger.info(f"Predicted {len(products)} products")
+            logger.info("Predicted %d products", len(products))
             if len(products) > 1:
                 warnings.append(f"Multiple products ({len(products)}) - potential non-specific amplification")
 
@@ -481,6 +674,32 @@ class InsilicoPCR:
             primer_dimer=primer_dimer_result
         )
 
+    def run_batch(
+        self,
+        template: str,
+        primer_pairs: List[Tuple[str, str]],
+        template_name: str = "template"
+    ) -> List[InsilicoPCRResult]:
+        """
+        Run in-silico PCR for several primer pairs on one template.
+
+        The template is encoded once and shared by every run, as are the
+        engine parameters.
+
+        Args:
+            template: Template sequence (DNA)
+            primer_pairs: (forward, reverse) primer sequences (5' to 3')
+            template_name: Name for the template
+
+        Returns:
+            One InsilicoPCRResult per primer pair, in input order
+        """
+        context = TemplateContext.from_sequence(template)
+        return [
+            self.run(template, forward_primer, reverse_primer, template_name, context=context)
+            for forward_primer, reverse_primer in primer_pairs
+        ]
+
 
 def run_insilico_pcr(
     template: str,
@@ -504,3 +723,25 @@ def run_insilico_pcr(
     """
     engine = InsilicoPCR(params)
     return engine.run(template, forward_primer, reverse_primer, template_name)
+
+
+def run_insilico_pcr_batch(
+    template: str,
+    primer_pairs: List[Tuple[str, str]],
+    template_name: str = "template",
+    params: Optional[Dict[str, Any]] = None
+) -> List[InsilicoPCRResult]:
+    """
+    Convenience function to screen many primer pairs against one template.
+    
+    Args:
+        template: Template sequence
+        primer_pairs: (forward, reverse) primer sequences (5' to 3')
+        template_name: Name for template
+        params: Optional custom parameters, shared by every pair
+        
+    Returns:
+        List of InsilicoPCRResult, one per primer pair
+    """
+    engine = InsilicoPCR(params)
+    return engine.run_batch(template, primer_pairs, template_name)
@@ -4,12 +4,17 @@ In-silico PCR Report Generator (v0.2.2)
 Generates human-readable reports from in-silico PCR results.
 """
 
+import io
+import re
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 from primerlab.core.insilico.engine import InsilicoPCRResult, AmpliconPrediction, PrimerBinding
 
+# One FASTA line (60 bases); findall wraps a whole sequence in the regex engine
+_FASTA_LINE = re.compile(r'.{1,60}', re.DOTALL)
+
 
 def generate_markdown_report(result: InsilicoPCRResult, output_dir: Optional[Path] = None) -> str:
     """
@@ -22,128 +27,131 @@ def generate_markdown_report(result: InsilicoPCRResult, output_dir: Optional[Pat
     Returns:
         Markdown string
     """
-    lines = []
+    buf = io.StringIO()
 
     # Header
-    lines.append("# In-silico PCR Report")
-    lines.append("")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
+    buf.write(
+        "# In-silico PCR Report\n"
+        "\n"
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        "\n"
+    )
 
     # Summary
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"| Parameter | Value |")
-    lines.append("|-----------|-------|")
-    lines.append(f"| Template | {result.template_name} |")
-    lines.append(f"| Template Length | {result.template_length:,} bp |")
-    lines.append(f"| Forward Primer | `{result.forward_primer}` |")
-    lines.append(f"| Reverse Primer | `{result.reverse_primer}` |")
-    lines.append(f"| Products Found | {len(result.products)} |")
-    lines.append(f"| Success | {'✅ Yes' if result.success else '❌ No'} |")
-    lines.append("")
+    buf.write(
+        "## Summary\n"
+        "\n"
+        "| Parameter | Value |\n"
+        "|-----------|-------|\n"
+        f"| Template | {result.template_name} |\n"
+        f"| Template Length | {result.template_length:,} bp |\n"
+        f"| Forward Primer | `{result.forward_primer}` |\n"
+        f"| Reverse Primer | `{result.reverse_primer}` |\n"
+        f"| Products Found | {len(result.products)} |\n"
+        f"| Success | {'✅ Yes' if result.success else '❌ No'} |\n"
+        "\n"
+    )
 
     # Binding Sites Summary
-    lines.append("## Binding Sites")
-    lines.append("")
-    lines.append(f"- **Forward primer bindings:** {len(result.all_forward_bindings)}")
-    lines.append(f"- **Reverse primer bindings:** {len(result.all_reverse_bindings)}")
-    lines.append("")
+    buf.write(
+        "## Binding Sites\n"
+        "\n"
+        f"- **Forward primer bindings:** {len(result.all_forward_bindings)}\n"
+        f"- **Reverse primer bindings:** {len(result.all_reverse_bindings)}\n"
+        "\n"
+    )
 
     # Products
     if result.products:
-        lines.append("## Predicted Products")
-        lines.append("")
+        buf.write("## Predicted Products\n\n")
 
         for i, product in enumerate(result.products, 1):
             primary_badge = " 🏆 **PRIMARY**" if product.is_primary else ""
-            lines.append(f"### Product {i}{primary_badge}")
-            lines.append("")
-            lines.append(f"| Property | Value |")
-            lines.append("|----------|-------|")
-            lines.append(f"| Size | **{product.product_size} bp** |")
-            lines.append(f"| Position | {product.start_position} - {product.end_position} |")
-            lines.append(f"| Likelihood | {product.likelihood_score:.1f}% |")
+            buf.write(
+                f"### Product {i}{primary_badge}\n"
+                "\n"
+                "| Property | Value |\n"
+                "|----------|-------|\n"
+                f"| Size | **{product.product_size} bp** |\n"
+                f"| Position | {product.start_position} - {product.end_position} |\n"
+                f"| Likelihood | {product.likelihood_score:.1f}% |\n"
+            )
             if product.extension_time_sec > 0:
-                lines.append(f"| Extension Time | {product.extension_time_sec:.1f}s (~{product.extension_time_sec/60:.1f} min) |")
-            lines.append("")
-
-            # Binding details
-            lines.append("**Forward Binding:**")
-            lines.append(_format_binding(product.forward_binding))
-            lines.append("")
-
-            lines.append("**Reverse Binding:**")
-            lines.append(_format_binding(product.reverse_binding))
-            lines.append("")
-
-            # Alignment visualization
-            lines.append("**Alignment:**")
-            lines.append("```")
-            lines.append(_generate_alignment_view(product, result.forward_primer, result.reverse_primer))
-            lines.append("```")
-            lines.append("")
+                buf.write(f"| Extension Time | {product.extension_time_sec:.1f}s (~{product.extension_time_sec/60:.1f} min) |\n")
+
+            # Binding details and alignment visualization
+            buf.write(
+                "\n"
+                "**Forward Binding:**\n"
+                f"{_format_binding(product.forward_binding)}\n"
+                "\n"
+                "**Reverse Binding:**\n"
+                f"{_format_binding(product.reverse_binding)}\n"
+                "\n"
+                "**Alignment:**\n"
+                "```\n"
+                f"{_generate_alignment_view(product, result.forward_primer, result.reverse_primer)}\n"
+                "```\n"
+                "\n"
+            )
 
             # Product sequence (truncated)
             seq = product.product_sequence
             if len(seq) > 100:
-                lines.append(f"**Sequence Preview:** `{seq[:50]}...{seq[-50:]}`")
+                buf.write(f"**Sequence Preview:** `{seq[:50]}...{seq[-50:]}`\n\n")
             else:
-                lines.append(f"**Sequence:** `{seq}`")
-            lines.append("")
+                buf.write(f"**Sequence:** `{seq}`\n\n")
 
             if product.warnings:
-                lines.append("⚠️ **Warnings:**")
+                buf.write("⚠️ **Warnings:**\n")
                 for w in product.warnings:
-                    lines.append(f"- {w}")
-                lines.append("")
+                    buf.write(f"- {w}\n")
+                buf.write("\n")
     else:
-        lines.append("## Predicted Products")
-        lines.append("")
-        lines.append("**No products predicted.** Check primer binding or adjust parameters.")
-        lines.append("")
+        buf.write(
+            "## Predicted Products\n"
+            "\n"
+            "**No products predicted.** Check primer binding or adjust parameters.\n"
+            "\n"
+        )
 
     # Warnings & Errors
     if result.warnings:
-        lines.append("## ⚠️ Warnings")
-        lines.append("")
+        buf.write("## ⚠️ Warnings\n\n")
         for w in result.warnings:
-            lines.append(f"- {w}")
-        lines.append("")
+            buf.write(f"- {w}\n")
+        buf.write("\n")
 
     if result.errors:
-        lines.append("## ❌ Errors")
-        lines.append("")
+        buf.write("## ❌ Errors\n\n")
         for e in result.errors:
-            lines.append(f"- {e}")
-        lines.append("")
+            buf.write(f"- {e}\n")
+        buf.write("\n")
 
     # v0.2.5: Primer-dimer analysis
     if result.primer_dimer:
         dimer = result.primer_dimer
         if dimer.get("severity") != "none":
-            lines.append("## ⚗️ Primer-Dimer Analysis")
-            lines.append("")
-            lines.append(f"| Metric | Value |")
-            lines.append("|--------|-------|")
-            lines.append(f"| Severity | **{dimer['severity'].upper()}** |")
-            lines.append(f"| Max Complementary | {dimer['max_complementary']} bp |")
-            lines.append(f"| 3' Complementary | {dimer['three_prime_complementary']} bp |")
-            lines.append("")
+            buf.write(
+                "## ⚗️ Primer-Dimer Analysis\n"
+                "\n"
+                "| Metric | Value |\n"
+                "|--------|-------|\n"
+                f"| Severity | **{dimer['severity'].upper()}** |\n"
+                f"| Max Complementary | {dimer['max_complementary']} bp |\n"
+                f"| 3' Complementary | {dimer['three_prime_complementary']} bp |\n"
+                "\n"
+            )
             if dimer.get("warning"):
-                lines.append(f"> ⚠️ {dimer['warning']}")
-                lines.append("")
+                buf.write(f"> ⚠️ {dimer['warning']}\n\n")
 
     # Parameters
-    lines.append("## Parameters Used")
-    lines.append("")
-    lines.append("```yaml")
+    buf.write("## Parameters Used\n\n```yaml\n")
     for k, v in result.parameters.items():
-        lines.append(f"{k}: {v}")
-    lines.append("```")
-    lines.append("")
+        buf.write(f"{k}: {v}\n")
+    buf.write("```\n")
 
-    report = "\n".join(lines)
+    report = buf.getvalue()
 
     # Save if output_dir provided
     if output_dir:
@@ -220,9 +228,7 @@ def generate_amplicon_fasta(result: InsilicoPCRResult, output_dir: Optional[Path
         lines.append(header)
 
         # Wrap sequence at 60 chars
-        seq = product.product_sequence
-        for j in range(0, len(seq), 60):
-            lines.append(seq[j:j+60])
+        lines += _FASTA_LINE.findall(product.product_sequence)
 
     fasta = "\n".join(lines)
 
@@ -244,61 +250,73 @@ def format_console_alignment(result: InsilicoPCRResult) -> str:
     Returns:
         Formatted string for console output
     """
-    lines = []
-
-    lines.append("")
-    lines.append("=" * 60)
-    lines.append("  IN-SILICO PCR RESULTS")
-    lines.append("=" * 60)
-    lines.append("")
+    buf = io.StringIO()
+
+    rule = "=" * 60
+    buf.write(
+        "\n"
+        f"{rule}\n"
+        "  IN-SILICO PCR RESULTS\n"
+        f"{rule}\n"
+        "\n"
+    )
 
     # Summary
-    lines.append(f"Template: {result.template_name} ({result.template_length:,} bp)")
-    lines.append(f"Forward:  {result.forward_primer}")
-    lines.append(f"Reverse:  {result.reverse_primer}")
-    lines.append("")
+    buf.write(
+        f"Template: {result.template_name} ({result.template_length:,} bp)\n"
+        f"Forward:  {result.forward_primer}\n"
+        f"Reverse:  {result.reverse_primer}\n"
+        "\n"
+    )
 
     # Binding summary
-    lines.append(f"Forward bindings: {len(result.all_forward_bindings)}")
-    lines.append(f"Reverse bindings: {len(result.all_reverse_bindings)}")
-    lines.append("")
+    buf.write(
+        f"Forward bindings: {len(result.all_forward_bindings)}\n"
+        f"Reverse bindings: {len(result.all_reverse_bindings)}\n"
+        "\n"
+    )
 
     if result.products:
-        lines.append("-" * 60)
-        lines.append(f"  PREDICTED PRODUCTS: {len(result.products)}")
-        lines.append("-" * 60)
+        divider = "-" * 60
+        buf.write(
+            f"{divider}\n"
+            f"  PREDICTED PRODUCTS: {len(result.products)}\n"
+            f"{divider}\n"
+        )
 
         for i, product in enumerate(result.products, 1):
             primary = " ★" if product.is_primary else ""
-            lines.append("")
-            lines.append(f"Product {i}{primary}:")
-            lines.append(f"  Size:       {product.product_size} bp")
-            lines.append(f"  Position:   {product.start_position} → {product.end_position}")
-            lines.append(f"  Likelihood: {product.likelihood_score:.1f}%")
 
             # Compact alignment
             fwd = product.forward_binding
             rev = product.reverse_binding
-            lines.append(f"  FWD bind:   pos {fwd.position}, {fwd.match_percent:.0f}% match, 3'={fwd.three_prime_match}bp")
-            lines.append(f"  REV bind:   pos {rev.position}, {rev.match_percent:.0f}% match, 3'={rev.three_prime_match}bp")
+            buf.write(
+                "\n"
+                f"Product {i}{primary}:\n"
+                f"  Size:       {product.product_size} bp\n"
+                f"  Position:   {product.start_position} → {product.end_position}\n"
+                f"  Likelihood: {product.likelihood_score:.1f}%\n"
+                f"  FWD bind:   pos {fwd.position}, {fwd.match_percent:.0f}% match, 3'={fwd.three_prime_match}bp\n"
+                f"  REV bind:   pos {rev.position}, {rev.match_percent:.0f}% match, 3'={rev.three_prime_match}bp\n"
+            )
 
             if product.warnings:
                 for w in product.warnings:
-                    lines.append(f"  ⚠️ {w}")
+                    buf.write(f"  ⚠️ {w}\n")
     else:
-        lines.append("No products predicted.")
+        buf.write("No products predicted.\n")
 
-    lines.append("")
-    lines.append("=" * 60)
+    # Lines from here on are newline-separated, not terminated
+    buf.write(f"\n{rule}")
 
     if result.warnings:
-        lines.append("Warnings:")
+        buf.write("\nWarnings:")
         for w in result.warnings:
-            lines.append(f"  ⚠️ {w}")
+            buf.write(f"\n  ⚠️ {w}")
 
     if result.errors:
-        lines.append("Errors:")
+        buf.write("\nErrors:")
         for e in result.errors:
-            lines.append(f"  ❌ {e}")
+            buf.write(f"\n  ❌ {e}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
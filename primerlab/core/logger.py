@@ -5,16 +5,36 @@ Per blueprint-logging-system.md:
 - Format: [YYYY-MM-DD HH:MM:SS][LEVEL] message
 - Supports workflow context prefix: [PCR], [qPCR], [CRISPR]
 - Two-phase initialization (buffer before output dir known)
+
+Log with %-style arguments, e.g. logger.debug("%d bindings found", n),
+rather than f-strings: the message is then only built if a handler
+actually emits the record.
 """
 
 import logging
+import time
 from pathlib import Path
-from typing import Optional
-from rich.logging import RichHandler
-from rich.console import Console
+from typing import Optional, Tuple
+
+# Global console for rich output, created by the first setup_logger call;
+# modules that only call get_logger never import rich
+_console = None
+
+
+def _get_console():
+    """Return the shared rich Console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 
-# Global console for rich output
-console = Console()
+def __getattr__(name):
+    # The console used to be created at import time as logger.console
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Current workflow context (set by workflows)
 _workflow_context: Optional[str] = None
@@ -32,6 +52,20 @@ def clear_workflow_context():
     _workflow_context = None
 
 
+# Last (second, formatted timestamp) pair; records arrive in bursts, so
+# strftime runs at most once per second
+_timestamp_cache: Tuple[Optional[int], str] = (None, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a record's creation time as YYYY-MM-DD HH:MM:SS."""
+    global _timestamp_cache
+    second = int(created)
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _timestamp_cache[1]
+
+
 class WorkflowContextFormatter(logging.Formatter):
     """
     Custom formatter that includes workflow context.
@@ -45,7 +79,7 @@ class WorkflowContextFormatter(logging.Formatter):
         context = f"[{_workflow_context}] " if _workflow_context else ""
 
         # Format timestamp per spec
-        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
+        timestamp = _format_timestamp(record.created)
         level = record.levelname
 
         return f"[{timestamp}][{level}] {context}{record.getMessage()}"
@@ -60,7 +94,7 @@ class FileFormatter(logging.Formatter):
 
     def format(self, record):
         context = f"[{_workflow_context}] " if _workflow_context else ""
-        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
+        timestamp = _format_timestamp(record.created)
         level = record.levelname
         return f"[{timestamp}][{level}] {context}{record.getMessage()}"
 
@@ -80,7 +114,8 @@ def setup_logger(name="primerlab", log_file=None, level=logging.INFO):
     logger.handlers = []
 
     # Console Handler (Rich)
-    rich_handler = RichHandler(console=console, show_time=True, show_path=False)
+    from rich.logging import RichHandler
+    rich_handler = RichHandler(console=_get_console(), show_time=True, show_path=False)
     rich_handler.setLevel(level)
     formatter = logging.Formatter("%(message)s")
     rich_handler.setFormatter(formatter)
@@ -10,12 +10,38 @@ Features:
 - Support N-masking detection
 """
 
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
 from typing import List, Tuple, Optional, Dict, Any
 from pathlib import Path
 from primerlab.core.logger import get_logger
 
 logger = get_logger()
 
+# Byte translation tables flagging the characters of a mask type with 1
+_LOWER_FLAGS = bytes(1 if ord('a') <= i <= ord('z') else 0 for i in range(256))
+_N_FLAGS = bytes(1 if chr(i) in 'Nn' else 0 for i in range(256))
+
+
+def _find_runs(flags: bytes, min_length: int, reason: str) -> List["RegionMask"]:
+    """
+    Masks for the maximal runs of 1 in flags that are at least min_length long.
+
+    Each run is located with bytes.find (memchr-speed C scans): the first
+    min_length ones after the previous run start a new run, and the next
+    0 ends it, so short runs are skipped without any Python work.
+    """
+    masks = []
+    run = b'\x01' * max(min_length, 1)
+    start = flags.find(run)
+    while start >= 0:
+        end = flags.find(0, start)
+        if end < 0:
+            end = len(flags)
+        masks.append(RegionMask(start, end, reason))
+        start = flags.find(run, end)
+    return masks
+
 
 class RegionMask:
     """
@@ -27,6 +53,9 @@ class RegionMask:
         reason: Why this region is masked (e.g., "repeat", "low_complexity", "user")
     """
 
+    # Genome-scale mask lists hold millions of these; no per-instance dict
+    __slots__ = ("start", "end", "reason")
+
     def __init__(self, start: int, end: int, reason: str = "masked"):
         self.start = start
         self.end = end
@@ -57,6 +86,11 @@ class RegionMasker:
 
     def __init__(self):
         self.masks: List[RegionMask] = []
+        # Masks detected by the last analyze_sequence call
+        self._detected: List[RegionMask] = []
+        # query() index: merged masks with their starts and ends, rebuilt
+        # lazily after the masks change
+        self._index: Optional[Tuple[List[RegionMask], List[int], List[int]]] = None
 
     def detect_lowercase_masks(self, sequence: str, min_length: int = 5) -> List[RegionMask]:
         """
@@ -69,31 +103,14 @@ class RegionMasker:
         Returns:
             List of RegionMask objects
         """
-        masks = []
-        in_mask = False
-        mask_start = 0
-
-        for i, char in enumerate(sequence):
-            is_lower = char.islower()
-
-            if is_lower and not in_mask:
-                # Start of masked region
-                in_mask = True
-                mask_start = i
-            elif not is_lower and in_mask:
-                # End of masked region
-                in_mask = False
-                length = i - mask_start
-                if length >= min_length:
-                    masks.append(RegionMask(mask_start, i, "repeat"))
-
-        # Handle case where sequence ends with masked region
-        if in_mask:
-            length = len(sequence) - mask_start
-            if length >= min_length:
-                masks.append(RegionMask(mask_start, len(sequence), "repeat"))
-
-        logger.debug(f"Detected {len(masks)} lowercase masked regions")
+        if sequence.isascii():
+            # a-z are the only lowercase ASCII characters
+            flags = sequence.encode('ascii').translate(_LOWER_FLAGS)
+        else:
+            flags = bytes(map(str.islower, sequence))
+        masks = _find_runs(flags, min_length, "repeat")
+
+        logger.debug("Detected %d lowercase masked regions", len(masks))
         return masks
 
     def detect_n_masks(self, sequence: str, min_length: int = 3) -> List[RegionMask]:
@@ -107,29 +124,14 @@ class RegionMasker:
         Returns:
             List of RegionMask objects
         """
-        masks = []
-        in_mask = False
-        mask_start = 0
-        seq_upper = sequence.upper()
-
-        for i, char in enumerate(seq_upper):
-            is_n = (char == 'N')
-
-            if is_n and not in_mask:
-                in_mask = True
-                mask_start = i
-            elif not is_n and in_mask:
-                in_mask = False
-                length = i - mask_start
-                if length >= min_length:
-                    masks.append(RegionMask(mask_start, i, "n_masked"))
-
-        if in_mask:
-            length = len(sequence) - mask_start
-            if length >= min_length:
-                masks.append(RegionMask(mask_start, len(sequence), "n_masked"))
-
-        logger.debug(f"Detected {len(masks)} N-masked regions")
+        if sequence.isascii():
+            # The flag table marks 'n' too, so no upper-cased copy is needed
+            flags = sequence.encode('ascii').translate(_N_FLAGS)
+        else:
+            flags = bytes(map('N'.__eq__, sequence.upper()))
+        masks = _find_runs(flags, min_length, "n_masked")
+
+        logger.debug("Detected %d N-masked regions", len(masks))
         return masks
 
     def parse_bed_file(self, bed_path: str, seq_name: Optional[str] = None) -> List[RegionMask]:
@@ -151,27 +153,32 @@ class RegionMasker:
             return masks
 
         try:
+            # One bulk read; the text-mode newline translation is the same
+            # as iterating the file
             with open(path) as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line or line.startswith("#") or line.startswith("track"):
-                        continue
+                lines = f.read().split("\n")
 
-                    parts = line.split("\t")
-                    if len(parts) < 3:
-                        logger.warning(f"Invalid BED line {line_num}: {line}")
-                        continue
+            for line_num, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line or line[0] == "#" or line.startswith("track"):
+                    continue
 
-                    chrom = parts[0]
-                    start = int(parts[1])
-                    end = int(parts[2])
-                    reason = parts[3] if len(parts) > 3 else "bed_region"
+                # Only the first four columns are used; BED6/BED12 extras stay unsplit
+                parts = line.split("\t", 4)
+                if len(parts) < 3:
+                    logger.warning(f"Invalid BED line {line_num}: {line}")
+                    continue
 
-                    # Filter by sequence name if provided
-                    if seq_name and chrom != seq_name:
-                        continue
+                chrom = parts[0]
+                start = int(parts[1])
+                end = int(parts[2])
+                reason = parts[3] if len(parts) > 3 else "bed_region"
 
-                    masks.append(RegionMask(start, end, reason))
+                # Filter by sequence name if provided
+                if seq_name and chrom != seq_name:
+                    continue
+
+                masks.append(RegionMask(start, end, reason))
 
             logger.info(f"Loaded {len(masks)} regions from BED file: {bed_path}")
         except Exception as e:
@@ -182,6 +189,7 @@ class RegionMasker:
     def add_manual_region(self, start: int, end: int, reason: str = "user") -> None:
         """Add a manually specified excluded region."""
         self.masks.append(RegionMask(start, end, reason))
+        self._index = None
 
     def analyze_sequence(
         self, 
@@ -202,41 +210,80 @@ class RegionMasker:
         Returns:
             Combined list of all detected masks
         """
-        all_masks = list(self.masks)  # Start with manual masks
-
-        if detect_lowercase:
-            all_masks.extend(self.detect_lowercase_masks(sequence, min_length))
-
-        if detect_n:
-            all_masks.extend(self.detect_n_masks(sequence, min_length))
-
-        # Merge overlapping regions
-        merged = self._merge_overlapping(all_masks)
+        detected: List[RegionMask] = []
+
+        if sequence.isascii():
+            # Both scans share one encoded buffer; N runs are flagged in
+            # either case, so no upper-cased copy is made
+            encoded = sequence.encode('ascii')
+            if detect_lowercase:
+                detected.extend(_find_runs(encoded.translate(_LOWER_FLAGS), min_length, "repeat"))
+            if detect_n:
+                detected.extend(_find_runs(encoded.translate(_N_FLAGS), min_length, "n_masked"))
+        else:
+            if detect_lowercase:
+                detected.extend(self.detect_lowercase_masks(sequence, min_length))
+
+            if detect_n:
+                detected.extend(self.detect_n_masks(sequence, min_length))
+
+        # Merge overlapping regions, manual masks first
+        merged = self._merge_overlapping(self.masks + detected)
+        self._detected = detected
+        self._index = self._build_index(merged)
 
         logger.info(f"Total masked regions: {len(merged)} ({self._total_masked_bp(merged)} bp)")
         return merged
 
+    def query(self, start: int, end: int) -> List[RegionMask]:
+        """
+        Merged masks overlapping [start, end).
+
+        Covers the manual regions (added with add_manual_region) and the
+        masks detected by the last analyze_sequence call, so before any
+        analysis only manual regions are returned. Merged masks are
+        disjoint and sorted, so their ends are sorted too and the
+        overlapping run is found by bisection in O(log n + m).
+        """
+        if self._index is None:
+            self._index = self._build_index(
+                self._merge_overlapping(self.masks + self._detected)
+            )
+        merged, starts, ends = self._index
+        first = bisect_right(ends, start)
+        last = bisect_left(starts, end)
+        return merged[first:last]
+
+    @staticmethod
+    def _build_index(merged: List[RegionMask]) -> Tuple[List[RegionMask], List[int], List[int]]:
+        """query() index of merged masks: (masks, starts, ends)."""
+        return merged, [m.start for m in merged], [m.end for m in merged]
+
     def _merge_overlapping(self, masks: List[RegionMask]) -> List[RegionMask]:
         """Merge overlapping or adjacent masked regions."""
         if not masks:
             return []
 
-        # Sort by start position
-        sorted_masks = sorted(masks, key=lambda m: m.start)
-        merged = [sorted_masks[0]]
+        # Sort by start position, then sweep the groups of overlapping or
+        # adjacent regions; only groups of several regions need a new mask
+        sorted_masks = sorted(masks, key=attrgetter('start'))
+        merged = []
+        first = sorted_masks[0]
+        end = first.end
+        grouped = False
 
         for mask in sorted_masks[1:]:
-            last = merged[-1]
-            if mask.start <= last.end:
-                # Overlapping or adjacent - extend the last region
-                merged[-1] = RegionMask(
-                    last.start, 
-                    max(last.end, mask.end),
-                    "merged"
-                )
+            if mask.start <= end:
+                if mask.end > end:
+                    end = mask.end
+                grouped = True
             else:
-                merged.append(mask)
+                merged.append(RegionMask(first.start, end, "merged") if grouped else first)
+                first = mask
+                end = mask.end
+                grouped = False
 
+        merged.append(RegionMask(first.start, end, "merged") if grouped else first)
         return merged
 
     def _total_masked_bp(self, masks: List[RegionMask]) -> int:
@@ -259,13 +306,15 @@ class RegionMasker:
         Returns:
             Dict with mask statistics
         """
-        total_masked = self._total_masked_bp(masks)
-        percent_masked = (total_masked / sequence_length * 100) if sequence_length > 0 else 0
-
+        # Total and per-reason counts in a single pass
+        total_masked = 0
         by_reason = {}
         for mask in masks:
+            total_masked += mask.end - mask.start
             by_reason[mask.reason] = by_reason.get(mask.reason, 0) + 1
 
+        percent_masked = (total_masked / sequence_length * 100) if sequence_length > 0 else 0
+
         return {
             "total_regions": len(masks),
             "total_masked_bp": total_masked,
@@ -293,6 +342,13 @@ def apply_masks_to_config(config: Dict[str, Any], masks: List[RegionMask]) -> Di
     if "parameters" not in config:
         config["parameters"] = {}
 
+    # Regions outside the included window cannot affect the design
+    window = config["parameters"].get("included_region")
+    if isinstance(window, dict) and "start" in window and "length" in window:
+        window_start = window["start"]
+        window_end = window_start + window["length"]
+        masks = [m for m in masks if m.start < window_end and m.end > window_start]
+
     # Convert masks to Primer3 format
     excluded = [(m.start, m.length) for m in masks]
 
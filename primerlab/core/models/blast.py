@@ -124,8 +124,9 @@ class BlastResult:
         if not self.hits:
             return 100.0  # No hits = specific (or no database)
 
-        on_target = self.on_target_hit
-        off_targets = [h for h in self.significant_hits if not h.is_on_target]
+        # One pass over the hits, testing significance only for off-target
+        # ones. Not cached: hits are flagged on-target after construction.
+        off_targets = [h for h in self.hits if not h.is_on_target and h.is_significant()]
 
         if not off_targets:
             return 100.0
@@ -1,4 +1,5 @@
 import os
+from operator import and_
 from typing import Union, Tuple, Optional, List
 from primerlab.core.exceptions import SequenceError
 from primerlab.core.logger import get_logger
@@ -209,13 +210,15 @@ class SequenceLoader:
         }
 
 
-def reverse_complement(seq: str) -> str:
-    """
-    Return reverse complement of DNA sequence including IUPAC codes.
-    
-    v0.2.1: Centralized and supports all IUPAC codes.
-    """
-    complement = {
+class _ComplementTable(dict):
+    """str.translate table of IUPAC complements; other characters become N."""
+
+    def __missing__(self, key: int) -> str:
+        return 'N'
+
+
+_COMPLEMENT = _ComplementTable(
+    (ord(base), comp) for base, comp in {
         'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G',
         'R': 'Y', 'Y': 'R', 'S': 'S', 'W': 'W',
         'K': 'M', 'M': 'K', 'B': 'V', 'V': 'B',
@@ -224,8 +227,17 @@ def reverse_complement(seq: str) -> str:
         'r': 'y', 'y': 'r', 's': 's', 'w': 'w',
         'k': 'm', 'm': 'k', 'b': 'v', 'v': 'b',
         'd': 'h', 'h': 'd', 'n': 'n'
-    }
-    return ''.join(complement.get(base, 'N') for base in reversed(seq))
+    }.items()
+)
+
+
+def reverse_complement(seq: str) -> str:
+    """
+    Return reverse complement of DNA sequence including IUPAC codes.
+    
+    v0.2.1: Centralized and supports all IUPAC codes.
+    """
+    return seq[::-1].translate(_COMPLEMENT)
 
 
 def bases_match(b1: str, b2: str) -> bool:
@@ -239,16 +251,72 @@ def bases_match(b1: str, b2: str) -> bool:
     if b1_up == b2_up:
         return True
 
-    # IUPAC logic
-    iupac = {
-        'A': {'A'}, 'C': {'C'}, 'G': {'G'}, 'T': {'T'},
-        'R': {'A', 'G'}, 'Y': {'C', 'T'}, 'S': {'G', 'C'}, 'W': {'A', 'T'},
-        'K': {'G', 'T'}, 'M': {'A', 'C'}, 'B': {'C', 'G', 'T'},
-        'D': {'A', 'G', 'T'}, 'H': {'A', 'C', 'T'}, 'V': {'A', 'C', 'G'},
-        'N': {'A', 'C', 'G', 'T'}
-    }
+    # IUPAC logic: other symbols only ever match themselves
+    return bool(_IUPAC_BITS.get(b1_up, 0) & _IUPAC_BITS.get(b2_up, 0))
+
+
+def _build_iupac_mask() -> bytes:
+    """Build the ASCII -> 4-bit IUPAC mask table (A=1, C=2, G=4, T=8)."""
+    bits = {'A': 1, 'C': 2, 'G': 4, 'T': 8}
+    table = bytearray(256)
+    for code, bases in SequenceLoader.get_iupac_map().items():
+        mask = sum(bits[b] for b in bases)
+        table[ord(code)] = table[ord(code.lower())] = mask
+    return bytes(table)
 
-    s1 = iupac.get(b1_up, {b1_up})
-    s2 = iupac.get(b2_up, {b2_up})
 
-    return bool(s1 & s2)
+# IUPAC base masks indexed by ASCII code (either case); anything else maps to 0.
+# Two IUPAC bases match exactly when their masks share a bit.
+IUPAC_MASK = _build_iupac_mask()
+
+# Upper-case IUPAC code -> mask, for bases_match()
+_IUPAC_BITS = {code: IUPAC_MASK[ord(code)] for code in SequenceLoader.get_iupac_map()}
+
+
+def iupac_masks(seq: str) -> Optional[bytes]:
+    """
+    Encode a sequence as IUPAC masks, one byte per base.
+
+    Returns None if the sequence contains anything other than IUPAC codes.
+    Mask AND agrees with bases_match() whenever one side is pure IUPAC.
+    """
+    if not seq.isascii():
+        return None
+    masks = seq.encode('ascii').translate(IUPAC_MASK)
+    return None if 0 in masks else masks
+
+
+def match_flags(seq1: str, seq2: str) -> bytes:
+    """
+    Per-base match flags of two sequences (nonzero = match, IUPAC aware).
+
+    Agrees with bases_match() base by base, pairing bases as zip() does.
+    Pure IUPAC sequences are compared as mask strings in one integer AND;
+    other ASCII sequences also flag case-insensitive equality bytewise.
+    """
+    if not (seq1.isascii() and seq2.isascii()):
+        return bytes(map(bases_match, seq1, seq2))
+    raw1 = seq1.encode('ascii')
+    raw2 = seq2.encode('ascii')
+    masks1 = raw1.translate(IUPAC_MASK)
+    masks2 = raw2.translate(IUPAC_MASK)
+
+    if 0 not in masks1:
+        if len(masks1) != len(masks2):
+            return bytes(map(and_, masks1, masks2))
+        both = int.from_bytes(masks1, 'big') & int.from_bytes(masks2, 'big')
+        return both.to_bytes(len(masks1), 'big')
+
+    # Symbols outside IUPAC only match themselves. XOR of the upper-cased
+    # bytes is 0 exactly where they are equal, and adding 0x7F to each
+    # (ASCII, so carry-free) byte sets its high bit unless it was 0
+    length = min(len(raw1), len(raw2))
+    both = (
+        int.from_bytes(masks1[:length], 'big') & int.from_bytes(masks2[:length], 'big')
+    )
+    diff = (
+        int.from_bytes(raw1[:length].upper(), 'big') ^ int.from_bytes(raw2[:length].upper(), 'big')
+    )
+    high = int.from_bytes(b'\x80' * length, 'big')
+    same = ((diff + int.from_bytes(b'\x7f' * length, 'big')) & high) ^ high
+    return (both | same).to_bytes(length, 'big')
@@ -81,6 +81,30 @@ class TestBlastModels:
         
         # Only on-target hit = 100% specific
         assert result.get_specificity_score() == 100.0
+
+    def test_specificity_score_follows_hit_flags(self):
+        """Hits flagged on-target after construction are no longer penalized."""
+        hit = BlastHit(
+            subject_id="target",
+            subject_title="",
+            query_start=1, query_end=20,
+            subject_start=1, subject_end=20,
+            identity_percent=100.0,
+            alignment_length=20,
+            mismatches=0, gaps=0,
+            evalue=1e-15, bit_score=50.0
+        )
+
+        result = BlastResult(
+            query_id="primer",
+            query_seq="ATGCATGCATGCATGCATGC",
+            query_length=20,
+            hits=[hit]
+        )
+
+        assert result.get_specificity_score() == 80.0
+        hit.is_on_target = True
+        assert result.get_specificity_score() == 100.0
     
     def test_specificity_result_combined(self):
         """SpecificityResult should combine forward and reverse."""
@@ -0,0 +1,193 @@
+"""
+Tests for offtarget/primers section validation in config_validator.py.
+"""
+from primerlab.core.config_validator import validate_config
+
+
+def _paths(items):
+    return [e.path for e in items]
+
+
+def test_offtarget_valid_section():
+    """A well-formed offtarget section produces no errors."""
+    config = {
+        "sequence": "ATCG",
+        "offtarget": {"mode": "blast", "evalue": 10.0, "identity": 80},
+    }
+    result = validate_config(config)
+    assert result.valid
+    assert result.errors == []
+
+
+def test_offtarget_invalid_mode():
+    result = validate_config({"sequence": "ATCG", "offtarget": {"mode": "fast"}})
+    assert not result.valid
+    assert result.errors[0].path == "offtarget.mode"
+    assert result.errors[0].message == "Invalid mode: fast"
+
+
+def test_offtarget_evalue_type():
+    result = validate_config({"sequence": "ATCG", "offtarget": {"evalue": "ten"}})
+    assert _paths(result.errors) == ["offtarget.evalue"]
+
+
+def test_offtarget_identity_range():
+    for bad in (-1, 101, "80"):
+        result = validate_config({"sequence": "ATCG", "offtarget": {"identity": bad}})
+        assert _paths(result.errors) == ["offtarget.identity"]
+
+
+def test_offtarget_enabled_without_database():
+    result = validate_config({
+        "sequence": "ATCG",
+        "offtarget": {"enabled": True, "mode": "bad"},
+    })
+    # Semantic database check runs before the structural checks
+    assert _paths(result.errors) == ["offtarget.database", "offtarget.mode"]
+
+
+def test_primers_product_size_missing_keys():
+    result = validate_config({
+        "sequence": "ATCG",
+        "primers": {"product_size": {"opt": 200}},
+    })
+    assert result.valid
+    assert _paths(result.warnings) == [
+        "primers.product_size.min",
+        "primers.product_size.max",
+    ]
+
+
+def test_primers_tm_range():
+    result = validate_config({
+        "sequence": "ATCG",
+        "primers": {"tm_min": 65, "tm_max": 55},
+    })
+    assert _paths(result.errors) == ["primers.tm_min/tm_max"]
+
+
+def test_validate_config_cached_result():
+    """Identical configs hit the cache; callers get independent copies."""
+    from primerlab.core.config_validator import _CACHE, clear_validation_cache
+
+    clear_validation_cache()
+    config = {"sequence": "ATCG", "offtarget": {"mode": "fast"}}
+    first = validate_config(config)
+    second = validate_config(dict(config))
+    assert len(_CACHE) == 1
+    assert second == first and second is not first
+
+    first.errors.append(first.errors[0])
+    second.errors[0].message = "changed"
+    third = validate_config(config)
+    assert _paths(third.errors) == ["offtarget.mode"]
+    assert third.errors[0].message == "Invalid mode: fast"
+
+    other = validate_config({"sequence": "ATCG", "offtarget": {"mode": "auto"}})
+    assert other.valid
+
+
+def test_validate_config_concurrent_eviction(monkeypatch):
+    """Threads filling a full cache evict entries without errors."""
+    from concurrent.futures import ThreadPoolExecutor
+    from primerlab.core import config_validator
+
+    monkeypatch.setattr(config_validator, "VALIDATION_CACHE_SIZE", 2)
+    config_validator.clear_validation_cache()
+
+    def run(worker):
+        for i in range(200):
+            validate_config({"sequence": "ATCG", "primers": {"tm_opt": worker * 1000 + i}})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(run, range(8)))
+    assert len(config_validator._CACHE) <= 2
+
+
+def test_validate_config_unhashable_config():
+
+    """Configs the cache key cannot encode are still validated."""
+    from primerlab.core.config_validator import ConfigValidator
+
+    config = {"sequence": "ATCG", "primers": {1: "a", "x": 2}}
+    assert validate_config(config) == ConfigValidator().validate(config)
+
+
+def test_validate_config_cache_tracks_database(tmp_path):
+    """Creating the off-target database invalidates the cached warning."""
+    from primerlab.core.config_validator import clear_validation_cache
+
+    clear_validation_cache()
+    db = tmp_path / "genome.fasta"
+    config = {"sequence": "ATCG", "offtarget": {"enabled": True, "database": str(db)}}
+
+    assert _paths(validate_config(config).warnings) == ["offtarget.database"]
+    db.write_text(">chr1\nATCG\n")
+    assert validate_config(config).warnings == []
+
+
+def test_validation_error_to_dict_is_fresh():
+    """to_dict() reflects the current fields and returns a new dict."""
+    from primerlab.core.config_validator import ValidationError
+
+    err = ValidationError(path="offtarget.mode", message="Invalid mode: x")
+    err.to_dict()["message"] = "changed"
+    assert err.to_dict()["message"] == "Invalid mode: x"
+
+    err.message = "Invalid mode: y"
+    assert err.to_dict() == {
+        "path": "offtarget.mode", "message": "Invalid mode: y", "suggestion": None
+    }
+
+
+def test_validation_result_to_json():
+    import json
+
+    result = validate_config({"sequence": "ATCG", "offtarget": {"evalue": "x"}})
+    data = json.loads(result.to_json())
+
+    assert data == result.to_dict()
+    assert data["valid"] is False
+
+
+def test_offtarget_unhashable_mode():
+    result = validate_config({"sequence": "ATCG", "offtarget": {"mode": ["blast"]}})
+    assert _paths(result.errors) == ["offtarget.mode"]
+
+
+def test_format_validation_errors_matches_lines():
+    from primerlab.core.config_validator import (
+        format_validation_errors, iter_validation_lines
+    )
+
+    result = validate_config({
+        "sequence": "ATCG",
+        "offtarget": {"mode": "fast"},
+        "primers": {"product_size": {"opt": 200}},
+    })
+    lines = list(iter_validation_lines(result))
+
+    assert lines[0] == "❌ Configuration Errors:"
+    assert "   • offtarget.mode: Invalid mode: fast" in lines
+    assert "\n⚠️  Warnings:" in lines
+    assert format_validation_errors(result) == "\n".join(lines)
+
+
+def test_validate_config_reuses_validator_per_thread():
+    """Reusing the thread's validator must not leak errors between calls."""
+    import threading
+    from primerlab.core.config_validator import _get_validator, clear_validation_cache
+
+    clear_validation_cache()
+    bad = validate_config({"sequence": "ATCG", "offtarget": {"mode": "fast"}})
+    good = validate_config({"sequence": "ATCG"})
+
+    assert _get_validator() is _get_validator()
+    assert len(bad.errors) == 1
+    assert good.errors == []
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(_get_validator()))
+    thread.start()
+    thread.join()
+    assert other[0] is not _get_validator()
@@ -50,6 +50,23 @@ class TestLogger:
         logger = get_logger()
         assert logger is not None
 
+    def test_file_formatter_timestamp(self):
+        """Cached timestamps should match logging's own formatTime."""
+        import logging
+        from primerlab.core.logger import FileFormatter
+        formatter = FileFormatter()
+        for created in (0.5, 0.9, 86400.25):
+            record = logging.LogRecord("t", logging.INFO, __file__, 1, "%d sites", (3,), None)
+            record.created = created
+            expected = formatter.formatTime(record, "%Y-%m-%d %H:%M:%S")
+            assert formatter.format(record) == f"[{expected}][INFO] 3 sites"
+
+    def test_console_shared_with_rich_handler(self):
+        """The lazily created console is the one setup_logger hands to rich."""
+        from primerlab.core import logger as logger_module
+        log = logger_module.setup_logger("primerlab.test_console")
+        assert log.handlers[0].console is logger_module.console
+
 
 class TestExceptions:
     """Tests for core/exceptions.py."""
@@ -5,6 +5,21 @@ import json
 from pathlib import Path
 
 
+# designs table as written before created_at/config migrations
+LEGACY_DESIGNS_TABLE_SQL = """
+    CREATE TABLE designs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        created_at TEXT NOT NULL, gene_name TEXT, workflow TEXT NOT NULL,
+        fwd_sequence TEXT, fwd_tm REAL, fwd_gc REAL, fwd_length INTEGER,
+        rev_sequence TEXT, rev_tm REAL, rev_gc REAL, rev_length INTEGER,
+        probe_sequence TEXT, probe_tm REAL,
+        amplicon_length INTEGER, amplicon_gc REAL,
+        quality_score REAL, quality_category TEXT,
+        config_json TEXT, result_json TEXT, notes TEXT
+    )
+"""
+
+
 class TestPrimerDatabase:
     """Tests for PrimerDatabase class."""
     
@@ -36,6 +51,53 @@ class TestPrimerDatabase:
         """Test database file is created."""
         assert temp_db.db_path.exists()
     
+    def test_connection_pragmas(self, temp_db):
+        """Test WAL journaling and relaxed sync are enabled on open."""
+        cursor = temp_db.conn.cursor()
+        assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL == 1
+        assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_integrity_check_skipped_when_unchanged(self, temp_db, monkeypatch):
+        """Test reopening an unchanged database skips the integrity scan."""
+        from primerlab.core.database import PrimerDatabase
+
+        calls = []
+        original = PrimerDatabase._check_integrity
+
+        def counting_check(self):
+            calls.append(1)
+            return original(self)
+
+        monkeypatch.setattr(PrimerDatabase, "_check_integrity", counting_check)
+        monkeypatch.delenv("PRIMERLAB_DB_CHECK", raising=False)
+
+        PrimerDatabase(str(temp_db.db_path)).close()
+        assert calls == []
+
+        monkeypatch.setenv("PRIMERLAB_DB_CHECK", "1")
+        PrimerDatabase(str(temp_db.db_path)).close()
+        assert calls == [1]
+
+    def test_recent_by_gene_index(self, temp_db):
+        """Test gene-filtered newest-first queries use the composite index."""
+        plan = temp_db.conn.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT * FROM designs WHERE gene_name = ? ORDER BY created_at DESC
+        """, ("GAPDH",)).fetchall()
+        details = " ".join(row[-1] for row in plan)
+
+        assert "idx_gene_created" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_check_integrity_quick_and_full(self, temp_db, monkeypatch):
+        """Test both the quick and the full integrity checks pass on a fresh DB."""
+        monkeypatch.delenv("PRIMERLAB_FULL_CHECK", raising=False)
+        assert temp_db._check_integrity() is True
+
+        monkeypatch.setenv("PRIMERLAB_FULL_CHECK", "1")
+        assert temp_db._check_integrity() is True
+
     def test_save_design(self, temp_db, sample_result):
         """Test saving a primer design."""
         record_id = temp_db.save_design(sample_result)
@@ -54,6 +116,160 @@ class TestPrimerDatabase:
         assert retrieved["fwd_sequence"] == "ATGGTGAAGGTCGGAGTCAA"
         assert retrieved["quality_score"] == 85.5
     
+    def test_get_by_id_decodes_payloads(self, temp_db, sample_result):
+        """Test stored config/result payloads round-trip."""
+        config = {"parameters": {"tm": {"min": 58, "max": 62}}}
+        record_id = temp_db.save_design(sample_result, config)
+
+        retrieved = temp_db.get_by_id(record_id)
+
+        assert retrieved["result_json"] == sample_result
+        assert retrieved["config_json"] == config
+
+    def test_listings_are_json_serializable(self, temp_db, sample_result):
+        """Test listed rows hold TEXT payloads, never bytes."""
+        record_id = temp_db.save_design(sample_result, {"tm": 60})
+        # A row written as BLOB before payloads were stored as TEXT
+        temp_db.save_design(sample_result)
+        temp_db.conn.execute(
+            "UPDATE designs SET result_json = CAST(result_json AS BLOB) WHERE id = ?",
+            (record_id + 1,)
+        )
+
+        stored = temp_db.conn.execute(
+            "SELECT typeof(result_json) FROM designs WHERE id = ?", (record_id,)
+        ).fetchone()[0]
+        assert stored == "text"
+        rows = temp_db.search()
+        assert json.loads(json.dumps(rows))[0]["gene_name"] == "GAPDH_test"
+        assert all(isinstance(row["result_json"], str) for row in rows)
+        by_id = {row["id"]: row for row in rows}
+        assert json.loads(by_id[record_id]["config_json"]) == {"tm": 60}
+
+        json.dumps(temp_db.get_recent())
+
+    def test_search_includes_config_json(self, temp_db, sample_result):
+
+        """Test search rows carry the stored config payload again."""
+        config = {"parameters": {"tm": {"opt": 60.0}}}
+        with_config = temp_db.save_design(sample_result, config)
+        without_config = temp_db.save_design(sample_result)
+
+        configs = {row["id"]: row["config_json"] for row in temp_db.search(gene="GAPDH")}
+
+        assert configs[without_config] is None
+        assert json.loads(configs[with_config]) == config
+
+
+    def test_identical_configs_stored_once(self, temp_db, sample_result):
+
+        """Test designs sharing a config reference a single configs row."""
+        config = {"parameters": {"tm": {"min": 58, "max": 62}}}
+        first = temp_db.save_design(sample_result, config)
+        ids = temp_db.save_designs([(sample_result, config, None, None)] * 2)
+        temp_db.save_design(sample_result, {"parameters": {}})
+
+        count = temp_db.conn.execute("SELECT COUNT(*) FROM configs").fetchone()[0]
+        assert count == 2
+        assert temp_db.get_by_id(ids[1])["config_json"] == config
+        assert temp_db.get_by_id(first)["config_hash"] == temp_db.get_by_id(ids[0])["config_hash"]
+
+    def test_get_by_id_reads_legacy_text_payload(self, temp_db, sample_result):
+        """Test rows written with json.dumps TEXT payloads still decode."""
+        record_id = temp_db.save_design(sample_result)
+        temp_db.conn.execute(
+            "UPDATE designs SET result_json = ? WHERE id = ?",
+            (json.dumps(sample_result), record_id)
+        )
+
+        assert temp_db.get_by_id(record_id)["result_json"] == sample_result
+
+    def test_created_at_stored_as_unix_time(self, temp_db, sample_result):
+        """Test created_at is stored as REAL unix time and listed as ISO text."""
+        import time
+        from datetime import datetime
+
+        before = time.time()
+        record_id = temp_db.save_design(sample_result)
+
+        created_at = temp_db.conn.execute(
+            "SELECT created_at FROM designs WHERE id = ?", (record_id,)
+        ).fetchone()[0]
+        assert isinstance(created_at, float)
+        assert before <= created_at <= time.time()
+
+        iso = datetime.fromtimestamp(created_at).isoformat()
+        assert temp_db.get_by_id(record_id)["created_at"] == iso
+        assert temp_db.search()[0]["created_at"] == iso
+        assert temp_db.get_recent()[0]["created_at"] == iso
+
+    def test_migrates_legacy_iso_timestamps(self, sample_result):
+        """Test a pre-migration database with ISO text timestamps is upgraded."""
+        import sqlite3
+        from primerlab.core.database import PrimerDatabase
+
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "legacy.db"
+            conn = sqlite3.connect(str(db_path))
+            conn.execute(LEGACY_DESIGNS_TABLE_SQL)
+            conn.execute(
+                "INSERT INTO designs (created_at, gene_name, workflow, config_json, result_json) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ("2025-12-18T10:30:00", "GAPDH", "pcr", json.dumps({"tm": 60}),
+                 json.dumps(sample_result))
+            )
+            conn.commit()
+            conn.close()
+
+            db = PrimerDatabase(str(db_path))
+            design = db.get_by_id(1)
+            db.save_design(sample_result)
+            designs = db.search()
+            db.close()
+
+            assert design["created_at"] == "2025-12-18T10:30:00"
+
+            assert design["result_json"] == sample_result
+            assert design["config_json"] == {"tm": 60}
+            assert [d["id"] for d in designs] == [2, 1]
+
+    def test_migration_keeps_autoincrement_counter(self, sample_result):
+        """Test ids of deleted legacy rows are not reused after the table rebuild."""
+        import sqlite3
+        from primerlab.core.database import PrimerDatabase
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "legacy.db"
+            conn = sqlite3.connect(str(db_path))
+            conn.execute(LEGACY_DESIGNS_TABLE_SQL)
+            conn.executemany(
+                "INSERT INTO designs (created_at, gene_name, workflow) VALUES (?, ?, ?)",
+                [("2025-12-18T10:30:00", f"GENE_{i}", "pcr") for i in range(3)]
+            )
+            conn.execute("DELETE FROM designs WHERE id = 3")
+            conn.commit()
+            conn.close()
+
+            db = PrimerDatabase(str(db_path))
+            new_id = db.save_design(sample_result)
+            db.close()
+
+            assert new_id == 4
+
+
+    def test_save_design_sparse_result(self, temp_db):
+        """Test missing or null result sections fall back to defaults."""
+        from primerlab.core import database
+
+        record_id = temp_db.save_design({"primers": {"forward": None}, "qc": None})
+        design = temp_db.get_by_id(record_id)
+
+        assert design["gene_name"] == "unknown"
+        assert design["fwd_sequence"] == ""
+        assert design["quality_category"] == "N/A"
+        assert database._EMPTY == {}
+
     def test_get_nonexistent_id(self, temp_db):
         """Test retrieving non-existent ID returns None."""
         result = temp_db.get_by_id(99999)
@@ -97,6 +313,17 @@ class TestPrimerDatabase:
         
         assert len(results) == 1
     
+    def test_search_combined_filters_reuse_sql(self, temp_db, sample_result):
+        """Test combined filters and SQL reuse for the same filter shape."""
+        temp_db.save_design(sample_result)
+
+        assert len(temp_db.search(gene="GAPDH", workflow="pcr", min_quality=80)) == 1
+        assert len(temp_db.search(gene="ACTB", workflow="pcr", min_quality=80)) == 0
+        assert len(temp_db._search_stmt_cache) == 1
+
+        temp_db.search()
+        assert len(temp_db._search_stmt_cache) == 2
+
     def test_delete(self, temp_db, sample_result):
         """Test deleting a design."""
         record_id = temp_db.save_design(sample_result)
@@ -128,6 +355,68 @@ class TestPrimerDatabase:
         
         assert len(recent) == 3
     
+    def test_search_returns_dicts(self, temp_db, sample_result):
+        """Test search/get_recent return plain dicts usable by the table formatter."""
+        from primerlab.core.database import format_history_table
+
+        temp_db.save_design(sample_result)
+        rows = temp_db.search()
+
+        assert type(rows[0]) is dict
+        assert type(temp_db.get_recent()[0]) is dict
+        assert rows[0]["gene_name"] == "GAPDH_test"
+
+        assert "GAPDH_test" in format_history_table(rows)
+        assert "GAPDH_test" in format_history_table(temp_db.get_recent())
+
+    def test_iter_search_streams_rows(self, temp_db, sample_result):
+        """Test iter_search/iter_recent are lazy and feed format_history_table."""
+        import types
+        from primerlab.core.database import format_history_table
+
+        for _ in range(3):
+            temp_db.save_design(sample_result)
+
+        rows = temp_db.iter_search(gene="GAPDH")
+        assert isinstance(rows, types.GeneratorType)
+        assert "Total: 3 designs" in format_history_table(rows)
+        assert "Total: 2 designs" in format_history_table(temp_db.iter_recent(2))
+        assert format_history_table(temp_db.iter_search(gene="ACTB")) == "No designs found."
+
+    def test_save_designs_batch(self, temp_db, sample_result):
+        """Test saving several designs in one transaction."""
+        first = temp_db.save_design(sample_result)
+        items = []
+        for i in range(3):
+            result = sample_result.copy()
+            result["metadata"] = {"sequence_name": f"GENE_{i}"}
+            items.append((result, None, None, f"note {i}"))
+
+        ids = temp_db.save_designs(items)
+
+        assert ids == [first + 1, first + 2, first + 3]
+        assert temp_db.get_by_id(ids[2])["gene_name"] == "GENE_2"
+        assert temp_db.get_by_id(ids[0])["notes"] == "note 0"
+        assert temp_db.save_designs([]) == []
+
+    def test_create_backup_prunes_oldest(self, temp_db):
+        """Test only the newest MAX_BACKUPS backups are kept."""
+        import os
+        from primerlab.core.database import MAX_BACKUPS
+
+        parent = temp_db.db_path.parent
+        for i in range(7):
+            old = parent / f"{temp_db.db_path.stem}.backup_2020010{i}_000000.db"
+            old.write_bytes(b"")
+            os.utime(old, (1_000_000 + i, 1_000_000 + i))
+
+        temp_db._create_backup()
+
+        remaining = sorted(p.name for p in parent.glob(f"{temp_db.db_path.stem}.backup_*.db"))
+        assert len(remaining) == MAX_BACKUPS
+        assert "test_history.backup_20200100_000000.db" not in remaining
+        assert "test_history.backup_20200106_000000.db" in remaining
+
     def test_get_stats(self, temp_db, sample_result):
         """Test getting database statistics."""
         temp_db.save_design(sample_result)
@@ -153,6 +442,42 @@ class TestPrimerDatabase:
             assert "GAPDH" in content
             assert "ATGGTGAAGGTCGGAGTCAA" in content
 
+    def test_export_csv_rows(self, temp_db, sample_result):
+        """Test every design is exported as one CSV row."""
+        import csv
+
+        for i in range(3):
+            result = sample_result.copy()
+            result["metadata"] = {"sequence_name": f"GENE_{i}"}
+            temp_db.save_design(result)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = Path(tmpdir) / "export.csv"
+            temp_db.export_csv(str(csv_path))
+
+            with open(csv_path, newline='') as f:
+                rows = list(csv.reader(f))
+
+        assert rows[0][:3] == ["ID", "Date", "Gene"]
+        assert sorted(r[2] for r in rows[1:]) == ["GENE_0", "GENE_1", "GENE_2"]
+
+    def test_close_refreshes_planner_stats(self, sample_result):
+        """Test close() gathers statistics for tables queried while open."""
+        import sqlite3
+        from primerlab.core.database import PrimerDatabase
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "stats.db"
+            db = PrimerDatabase(str(db_path))
+            db.save_designs([(sample_result, None, f"GENE_{i % 5}", None) for i in range(100)])
+            assert len(db.search(workflow="pcr", min_quality=80)) == 50
+            db.close()
+
+            conn = sqlite3.connect(str(db_path))
+            stats = conn.execute("SELECT tbl FROM sqlite_stat1").fetchall()
+            conn.close()
+            assert ("designs",) in stats
+
 
 class TestFormatHistoryTable:
     """Tests for format_history_table function."""
@@ -164,6 +489,22 @@ class TestFormatHistoryTable:
         result = format_history_table([])
         assert "No designs found" in result
     
+    def test_format_unix_timestamp(self):
+        """Test formatting rows with unix-time created_at."""
+        from datetime import datetime
+        from primerlab.core.database import format_history_table
+
+        designs = [{
+            "id": 7,
+            "created_at": datetime(2026, 1, 2, 3, 4, 5).timestamp(),
+            "gene_name": "ACTB",
+            "workflow": "qpcr",
+            "fwd_sequence": "ATGGTGAAGGTCGGAGTCAA",
+            "quality_score": 70.0
+        }]
+
+        assert "2026-01-02" in format_history_table(designs)
+
     def test_format_with_data(self):
         """Test formatting with data."""
         from primerlab.core.database import format_history_table
@@ -402,6 +402,49 @@ class TestHTMLExport:
             assert "<style>" in content, "Should have embedded CSS"
             assert "</style>" in content, "Should close style tag"
 
+    def test_html_escapes_primer_fields(self, sample_result):
+        """Primer IDs and rationale text should be HTML-escaped."""
+        from primerlab.core.html_report import generate_html_report
+
+        sample_result.primers["forward"].id = "F1<b>"
+        sample_result.rationale = {"selection_reasons": ["Tm < 62 & balanced"]}
+        html = generate_html_report(sample_result)
+
+        assert "F1&lt;b&gt;" in html
+        assert "<li>Tm &lt; 62 &amp; balanced</li>" in html
+        assert html.count("<tr>") == 2 + 3  # header + primer row, QC rows
+
+    def test_html_range_classes(self, sample_result):
+        """Tm/GC cells should be classed by the good-range bounds."""
+        from primerlab.core.html_report import generate_html_report
+
+        primer = sample_result.primers["forward"]
+        html = generate_html_report(sample_result)
+        assert '<td class="good">60.0°C</td>' in html
+        assert '<td class="good">60.0%</td>' in html
+
+        primer.tm, primer.gc = 62.5, 39.9
+        html = generate_html_report(sample_result)
+        assert '<td class="warn">62.5°C</td>' in html
+        assert '<td class="warn">39.9%</td>' in html
+
+    def test_html_page_placeholders_filled(self, sample_result):
+        """The page template should leave no unfilled placeholders."""
+        from primerlab.core.html_report import generate_html_report
+
+        html = generate_html_report(sample_result)
+
+        assert "$" not in html
+        assert "<title>PrimerLab Report - PCR</title>" in html
+        assert "box-sizing: border-box;" in html
+
+    def test_html_embeds_style_constant(self, sample_result):
+        """The stylesheet should be embedded verbatim, with single braces."""
+        from primerlab.core.html_report import _STYLE, generate_html_report
+
+        assert "{{" not in _STYLE
+        assert _STYLE in generate_html_report(sample_result)
+
 
 class TestIDTBulkExport:
     """Tests for IDT Bulk Order export functionality (v0.1.4)."""
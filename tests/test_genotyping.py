@@ -98,6 +98,134 @@ class TestAlleleScoring:
         assert result.is_discriminating == True
 
 
+class TestGenotypingCaches:
+    """Test memoized scoring and Tm results."""
+
+    def test_score_results_are_independent(self):
+        """Test cached scoring does not share mutable lists between results."""
+        from primerlab.core.genotyping import clear_caches
+        from primerlab.core.genotyping.allele_scoring import _score_core
+
+        clear_caches()
+        first = score_allele_discrimination("ATGCGATCGATCGATCGA", 8, "A", "G")
+        second = score_allele_discrimination("TTGCGATCGATCGATCGA", 8, "a", "g")
+
+        assert _score_core.cache_info().hits == 1
+        assert first.warnings == second.warnings
+        first.warnings.append("extra")
+        assert "extra" not in second.warnings
+
+    def test_clear_caches(self):
+        """Test clear_caches empties the Tm memo."""
+        from primerlab.core.genotyping import clear_caches
+
+        calculate_discrimination_tm("ATGCGATCGATCGATCGA", 17, "A", "T")
+        assert calculate_discrimination_tm.cache_info().currsize > 0
+        clear_caches()
+        assert calculate_discrimination_tm.cache_info().currsize == 0
+
+
+class TestPrimerView:
+    """Test the shared primer view."""
+
+    def test_primer_view(self):
+        from primerlab.core.genotyping import primer_view
+        from primerlab.core.genotyping._canonical import ENCODE
+
+        primer = primer_view("atgN")
+        assert primer.seq == "ATGN"
+        assert primer.data == b"ATGN"
+        assert primer.length == 4
+        assert primer.data.translate(ENCODE) == bytes([0, 3, 2, 4])
+
+    def test_view_entry_points_match_string_api(self):
+        """Test the *_view functions agree with the string-based API."""
+        from primerlab.core.genotyping import (
+            analyze_snp_context_view,
+            calculate_discrimination_tm_view,
+            primer_view,
+            score_allele_discrimination_view,
+        )
+
+        seq = "atgcgatcgatcgatcga"
+        view = primer_view(seq)
+
+        assert score_allele_discrimination_view(view, 1, "g", "t").to_dict() == \
+            score_allele_discrimination(seq, 1, "g", "t").to_dict()
+        assert analyze_snp_context_view(view, 16).to_dict() == analyze_snp_context(seq, 16).to_dict()
+        assert calculate_discrimination_tm_view(view, 16, "G", "T") == \
+            calculate_discrimination_tm(seq, 16, "G", "T")
+
+
+class TestMismatchTables:
+    """Test flattened (ref, alt) mismatch tables."""
+
+    def test_pair_tables_match_dicts(self):
+        from primerlab.core.genotyping.allele_scoring import MISMATCH_SCORES, _get_mismatch_score
+        from primerlab.core.genotyping._canonical import pair_index
+
+        for (ref, alt), value in MISMATCH_SCORES.items():
+            assert _get_mismatch_score(ref, alt) == value
+        assert _get_mismatch_score("A", "A") == 0.5
+        assert _get_mismatch_score("N", "T") == 0.5
+        assert pair_index("AT", "G") == -1
+        assert pair_index("é", "G") == -1
+
+
+class TestPositionWeights:
+    """Test the precomputed position weight table."""
+
+    def test_lut_matches_formula(self):
+        from primerlab.core.genotyping.allele_scoring import (
+            POSITION_WEIGHTS, POSITION_WEIGHT_LUT, _get_position_weight,
+        )
+
+        for pos in range(-2, 100):
+            expected = POSITION_WEIGHTS.get(pos, max(0.05, 0.2 - (pos - 3) * 0.05))
+            assert _get_position_weight(pos) == pytest.approx(expected)
+        assert POSITION_WEIGHT_LUT[0] == 1.0
+
+
+class TestScoreGrade:
+    """Test the score to letter grade table."""
+
+    def test_grade_boundaries(self):
+        from primerlab.core.genotyping.allele_scoring import _score_to_grade
+
+        cases = {
+            -5.0: "F", 0: "F", 59.99: "F", 60.0: "D", 69.9: "D", 70: "C",
+            79.99: "C", 80: "B", 89.99: "B", 90.0: "A", 100.0: "A", 150: "A",
+            float("nan"): "F", float("-inf"): "F", float("inf"): "A",
+        }
+        for score, grade in cases.items():
+            assert _score_to_grade(score) == grade
+
+
+class TestScoreBatch:
+    """Test batch allele scoring."""
+
+    def test_matches_single_scoring(self):
+        from primerlab.core.genotyping import score_batch
+
+        primers = ["ATGCGATCGATCGATCGA", "ATGCGATCGATCGATCGA", "GCGC"]
+        positions = [0, 5, 9]
+        refs, alts = ["A", "c", "G"], ["T", "t", "A"]
+
+        scores = score_batch(primers, positions, refs, alts)
+
+        for args, (combined, position, mismatch) in zip(zip(primers, positions, refs, alts), scores):
+            single = score_allele_discrimination(*args)
+            assert (combined, position, mismatch) == (
+                single.combined_score, single.position_score, single.mismatch_score
+            )
+
+    def test_length_mismatch(self):
+        from primerlab.core.genotyping import score_batch
+
+        with pytest.raises(ValueError):
+            score_batch(["ATGC"], [0, 1], ["A"], ["T"])
+
+
 class TestSnpPosition:
     """Test SNP position validation."""
     
@@ -131,6 +259,26 @@ class TestSnpPosition:
         assert result.is_acceptable == False
         assert len(result.warnings) > 0
 
+    def test_distance_warnings_cached(self):
+        """Test distance warnings are formatted once per distance."""
+        first = analyze_snp_context("ATGCGATCGATCGATCGA", 8).warnings[0]
+        second = analyze_snp_context("TTGCGATCGATCGATCGA", 8).warnings[0]
+
+        assert first == "SNP is 9 bases from 3' end - poor discrimination"
+        assert first is second
+        assert analyze_snp_context("ATGCGATCGATCGATCGA", 16).warnings == []
+
+    def test_analyze_snp_context_poly_runs(self):
+        """Test poly-run warnings only fire for runs through the SNP window."""
+        gc_warning = "Poly-G/C run near SNP may cause secondary structure"
+        at_warning = "Poly-A/T run near SNP may reduce specificity"
+
+        assert gc_warning in analyze_snp_context("ATCGGGGA", 5).warnings
+        assert at_warning in analyze_snp_context("GCTTTTAC", 3).warnings
+        # Run exists in the primer but not around the SNP
+        assert analyze_snp_context("GGGGATCGAC", 9).warnings == []
+        assert analyze_snp_context("ANNNNA", 2).warnings == ["SNP at position -3 from 3' - marginal discrimination"]
+
 
 class TestDiscriminationTm:
     """Test Tm discrimination calculations."""
@@ -166,6 +314,93 @@ class TestDiscriminationTm:
         
         assert delta_3prime > delta_internal
     
+    def test_basic_tm_nn_table(self):
+        """Test table-driven NN sums match a direct dinucleotide loop."""
+        from primerlab.core.genotyping.discrimination_tm import (
+            NN_PARAMS, _calculate_basic_tm,
+        )
+
+        def reference(seq):
+            seq = seq.upper()
+            nn = [NN_PARAMS[seq[i:i+2]] for i in range(len(seq) - 1) if seq[i:i+2] in NN_PARAMS]
+            dh = sum(v * 8 for v in nn) - 0.2
+            ds = sum(v * 22 for v in nn) - 5.7
+            tm = (dh * 1000) / (ds + 1.987 * 2.303 * (-4.26)) + 16.6 * (0.434 * 0.05 ** 0.5)
+            if tm < 30 or tm > 100:
+                tm = 2 * sum(seq.count(b) for b in "AT") + 4 * sum(seq.count(b) for b in "GC")
+            return tm
+
+        for seq in ("ATGCGATCGATCGATCGA", "gcgcNNatatRYgc", "GGGGCCCCGGGGCCCCGG", "A"):
+            assert _calculate_basic_tm(seq) == pytest.approx(reference(seq) if len(seq) > 1 else 0.0)
+
+    def test_mismatched_primer_splice(self):
+        """Test the alt allele is spliced in only for in-range positions."""
+        from primerlab.core.genotyping.discrimination_tm import _calculate_basic_tm
+
+        primer = "ATGCGATCGATCGATCGA"
+        tm_m, tm_mm, delta = calculate_discrimination_tm(primer, 17, "A", "C")
+        expected_mm = _calculate_basic_tm(primer[:17] + "C") - 1.2 * 3.0 * 2
+        assert tm_mm == round(expected_mm, 1)
+
+        # Out of range: no splice, only the type/position penalty applies
+        assert calculate_discrimination_tm(primer, 18, "A", "T")[2] == 3.0
+
+    def test_basic_tm_wallace_fallback(self):
+        """Test out-of-range Tm falls back to 2*AT + 4*GC, ignoring other bases."""
+        from primerlab.core.genotyping.discrimination_tm import _calculate_basic_tm
+
+        assert _calculate_basic_tm("ATAT") == 8
+        assert _calculate_basic_tm("gcgc") == 16
+        assert _calculate_basic_tm("ATGCNNAT") == 16
+
+    def test_position_factors(self):
+        """Test the penalty multiplier by distance from the 3' end."""
+        primer = "ATGCGATCGATCGATCGA"
+        # ref == alt leaves the sequence unchanged, isolating the penalty (0.7 default)
+        deltas = [
+            calculate_discrimination_tm(primer, pos, primer[pos], primer[pos])[2]
+            for pos in (17, 16, 15, 14)
+        ]
+        assert deltas == [4.2, 2.8, 2.1, 1.4]
+
+    def test_nn_sum_single_pass(self):
+        """Test _nn_sum adds one table entry per known dinucleotide."""
+        from primerlab.core.genotyping.discrimination_tm import _nn_sum
+
+        assert _nn_sum(b"AC") == pytest.approx(-1.44)
+        assert _nn_sum(b"ACN") == _nn_sum(b"AC")
+        assert _nn_sum(b"A") == 0
+
+    def test_nn_substitution_delta(self):
+        """Test the O(1) substitution update matches a full rescan."""
+        from primerlab.core.genotyping.discrimination_tm import (
+            _nn_substitution_delta, _nn_sum,
+        )
+
+        data = b"ATGCGATCGNTCGATCGA"
+        for pos in range(len(data)):
+            for base in b"ACGTN":
+                swapped = data[:pos] + bytes([base]) + data[pos + 1:]
+                updated = _nn_sum(data) + _nn_substitution_delta(data, pos, base)
+                assert updated == pytest.approx(_nn_sum(swapped))
+
+    def test_discrimination_tm_batch(self):
+        """Test batch rows match single calls, reusing each primer's matched Tm."""
+        from primerlab.core.genotyping import discrimination_tm_batch
+
+        primers = ["ATGCGATCGATCGATCGA"] * 3 + ["gcgcatatgcgcatatgc"]
+        positions = [17, 17, 8, 0]
+        refs, alts = ["A", "A", "A", "G"], ["T", "c", "G", "AT"]
+
+        rows = discrimination_tm_batch(primers, positions, refs, alts)
+
+        assert rows == [
+            calculate_discrimination_tm(*args)
+            for args in zip(primers, positions, refs, alts)
+        ]
+        with pytest.raises(ValueError):
+            discrimination_tm_batch(primers, positions, refs, alts[:2])
+
     def test_estimate_specificity_excellent(self):
         """Test excellent specificity classification."""
         result = estimate_allele_specificity(delta_tm=10.0)
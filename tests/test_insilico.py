@@ -125,6 +125,86 @@ class TestFindBindingSites:
         # Should find at least one binding
         assert len(bindings) >= 1
 
+    def test_report_threshold_matches_full_scan(self):
+        """Screened bindings are exactly the windows reaching report_threshold."""
+        primer = "ATGAGTAAAGGAGNAGAAC"
+        for threshold in (50, 70, 100):
+            params = {**DEFAULT_INSILICO_PARAMS, "report_threshold": threshold}
+            bindings = find_binding_sites(primer, TEMPLATE_SEQ, "Forward", '+', params)
+            expected = [
+                i for i in range(len(TEMPLATE_SEQ) - len(primer) + 1)
+                if calculate_match_percent(primer, TEMPLATE_SEQ[i:i + len(primer)])[0] >= threshold
+            ]
+            assert sorted(b.position for b in bindings) == expected
+            for b in bindings:
+                target = TEMPLATE_SEQ[b.position:b.position + len(primer)]
+                assert (b.match_percent, b.mismatches, b.three_prime_match) == (
+                    calculate_match_percent(primer, target)
+                )
+
+    def test_shared_template_context(self):
+        """A prebuilt TemplateContext gives the same bindings on both strands."""
+        from primerlab.core.insilico.engine import TemplateContext
+
+        context = TemplateContext.from_sequence(TEMPLATE_SEQ)
+        for primer, strand in ((FORWARD_PRIMER, '+'), (REVERSE_PRIMER, '-')):
+            for circular in (False, True):
+                params = {**DEFAULT_INSILICO_PARAMS, "circular": circular}
+                shared = find_binding_sites(primer, TEMPLATE_SEQ, "P", strand, params, context=context)
+                assert shared == find_binding_sites(primer, TEMPLATE_SEQ, "P", strand, params)
+
+    def test_shared_context_across_primer_lengths(self, monkeypatch):
+        """Cached screen bitmaps stay correct for primers of other lengths."""
+        from primerlab.core.insilico import binding
+        from primerlab.core.insilico.engine import TemplateContext
+
+        monkeypatch.setattr(binding, "SCREEN_TILE", 64)
+        context = TemplateContext.from_sequence(TEMPLATE_SEQ)
+        for length in (12, 30, 18):
+            primer = TEMPLATE_SEQ[100:100 + length]
+            shared = find_binding_sites(primer, TEMPLATE_SEQ, "P", '+', DEFAULT_INSILICO_PARAMS, context=context)
+            assert shared == find_binding_sites(primer, TEMPLATE_SEQ, "P", '+', DEFAULT_INSILICO_PARAMS)
+            assert 100 in [b.position for b in shared]
+        assert context.miss_cache
+
+    def test_exact_only_search(self):
+        """A 100% report threshold finds the same sites via substring search."""
+        from primerlab.core.insilico.engine import TemplateContext
+
+        params = {**DEFAULT_INSILICO_PARAMS, "report_threshold": 100}
+        template = TEMPLATE_SEQ.lower() + TEMPLATE_SEQ[:30]
+        context = TemplateContext.from_sequence(template)
+        sites = find_binding_sites(FORWARD_PRIMER, template, "P", '+', params, context=context)
+        assert [b.position for b in sites] == [0, len(TEMPLATE_SEQ)]
+        assert context.exact_text() == template.upper()
+
+        # A degenerate template base still matches, so the screen is used
+        degenerate = "N" + TEMPLATE_SEQ[1:]
+        sites = find_binding_sites(FORWARD_PRIMER, degenerate, "P", '+', params)
+        assert [b.position for b in sites] == [0]
+        assert TemplateContext.from_sequence(degenerate).exact_text() is None
+
+    def test_alignment_built_on_demand(self):
+        """Alignments are drawn from the recorded target region on first read."""
+        from primerlab.core.insilico.engine import create_alignment_string
+
+        template = TEMPLATE_SEQ[:60].lower()
+        for primer, strand in ((template[10:30].upper(), '+'), (reverse_complement(template[30:50]), '-')):
+            binding = find_binding_sites(primer, template, "P", strand, DEFAULT_INSILICO_PARAMS)[0]
+            assert vars(binding)["_alignment"] == ""  # not drawn yet
+            assert binding.alignment == "|" * 20
+            assert vars(binding)["_alignment"] == "|" * 20
+            assert binding.to_dict()["alignment"] == "|" * 20
+
+        assert create_alignment_string("ACGT", "acga") == "|||x"
+
+    def test_screen_binding_offsets(self):
+        """Offsets are screened per primer, each with its own minimum."""
+        from primerlab.core.insilico.binding import screen_binding_offsets
+
+        offsets = screen_binding_offsets(["ACGT", "ACGN", "TTTTT"], "ACGTACGAAC", [4, 4, 5])
+        assert offsets == [[0], [0, 4], []]
+
 
 class TestInsilicoPCR:
     """Tests for complete in-silico PCR simulation."""
@@ -185,6 +265,18 @@ class TestInsilicoPCR:
         assert result.success == False
         assert len(result.warnings) > 0
 
+    def test_batch_matches_single_runs(self):
+        """Batch runs share one template encoding but give the same results."""
+        from primerlab.core.insilico import run_insilico_pcr_batch
+
+        pairs = [(FORWARD_PRIMER, REVERSE_PRIMER), ("X" * 20, REVERSE_PRIMER), (FORWARD_PRIMER, FORWARD_PRIMER)]
+        params = {"report_threshold": 100}
+        results = run_insilico_pcr_batch(TEMPLATE_SEQ, pairs, "GFP", params)
+        assert len(results) == len(pairs)
+        for (fwd, rev), result in zip(pairs, results):
+            assert result.to_dict() == run_insilico_pcr(TEMPLATE_SEQ, fwd, rev, "GFP", params).to_dict()
+        assert results[0].success
+
 
 class TestBindingAnalysis:
     """Tests for binding.py module."""
@@ -220,13 +312,40 @@ class TestBindingAnalysis:
         
         assert site.mismatch_count == 2
         assert site.match_percent == 80.0
-    
+
+    def test_analyze_binding_notes_tuple(self):
+        """Validation notes are an immutable tuple, exported as a list."""
+        site = analyze_binding("ATGAGTAAAG", "ATGAGTTTAG", 0, '+')
+        assert isinstance(site.validation_notes, tuple)
+        assert site.validation_notes
+        assert site.to_dict()["validation_notes"] == list(site.validation_notes)
+
     def test_three_prime_dg_calculation(self):
         """ΔG should be calculated."""
         dg = calculate_three_prime_dg("ATGCA", "ATGCA")
         assert isinstance(dg, float)
         assert dg < 0  # Should be negative (stable)
     
+    def test_three_prime_dg_lut_matches_table(self):
+        """Each matched dinucleotide step adds its NN_DG value."""
+        from primerlab.core.insilico.binding import NN_DG
+
+        for dinuc, dg in NN_DG.items():
+            assert calculate_three_prime_dg(dinuc, dinuc) == round(dg, 2)
+        assert calculate_three_prime_dg("AN", "AN") == -1.0
+        assert calculate_three_prime_dg("gc", "GC") == -2.4
+
+    def test_three_prime_dg_cached(self):
+        """Repeated 3' pentamers are served from the cache."""
+        from primerlab.core.insilico import clear_caches
+
+        clear_caches()
+        first = calculate_three_prime_dg("ATGCA", "ATGCA")
+        assert calculate_three_prime_dg("ATGCA", "ATGCA") == first
+        assert calculate_three_prime_dg.cache_info().hits == 1
+        clear_caches()
+        assert calculate_three_prime_dg.cache_info().currsize == 0
+
     def test_find_all_binding_sites(self):
         """Should find all sites above threshold."""
         sites = find_all_binding_sites(
@@ -237,6 +356,76 @@ class TestBindingAnalysis:
         assert len(sites) >= 1
         assert all(isinstance(s, BindingSite) for s in sites)
 
+    def test_find_all_binding_sites_threshold_boundary(self):
+        """Sites exactly at the report threshold are kept."""
+        template = "TTTTATGCATGCAATTTTATGCATGCATTTTT"
+        sites = find_all_binding_sites(
+            primer_seq="ATGCATGCAT",
+            template_seq=template,
+            strand='+',
+            params={"report_threshold": 90}
+        )
+        assert sorted(s.position for s in sites) == [4, 18]
+        assert {s.match_count for s in sites} == {9, 10}
+
+    def test_find_all_binding_sites_reverse_strand(self):
+        """Reverse-strand search matches the primer's reverse complement."""
+        sites = find_all_binding_sites(
+            primer_seq=REVERSE_PRIMER.lower(),
+            template_seq=TEMPLATE_SEQ,
+            strand='-',
+            params={"report_threshold": 100}
+        )
+        assert [s.position for s in sites] == [TEMPLATE_SEQ.index(reverse_complement(REVERSE_PRIMER))]
+
+    def test_find_all_binding_sites_reuses_screen_masks(self):
+        """Sites built from the screen's match rows equal a fresh analysis."""
+        for strand in ('+', '-'):
+            sites = find_all_binding_sites(
+                FORWARD_PRIMER, TEMPLATE_SEQ, strand, {"report_threshold": 40}
+            )
+            assert sites
+            for site in sites:
+                fresh = analyze_binding(FORWARD_PRIMER, site.target_seq, site.position, strand)
+                assert site == fresh
+
+    def test_find_all_binding_sites_batch(self):
+        """Batch search returns the per-primer results in input order."""
+        from primerlab.core.insilico.binding import find_all_binding_sites_batch
+
+        primers = [FORWARD_PRIMER, REVERSE_PRIMER, "ACGTRYACGT"]
+        for strand in ('+', '-'):
+            batch = find_all_binding_sites_batch(primers, TEMPLATE_SEQ, strand)
+            assert batch == [
+                find_all_binding_sites(p, TEMPLATE_SEQ, strand) for p in primers
+            ]
+
+    def test_find_all_binding_sites_lowercase_template(self):
+        """Lower-case templates give the same sites with upper-case targets."""
+        for strand in ('+', '-'):
+            lower = find_all_binding_sites(FORWARD_PRIMER, TEMPLATE_SEQ.lower(), strand)
+            assert lower == find_all_binding_sites(FORWARD_PRIMER, TEMPLATE_SEQ, strand)
+            assert all(site.target_seq.isupper() for site in lower)
+
+    def test_find_all_binding_sites_tiled_screen(self, monkeypatch):
+        """Screening in small tiles finds the same sites as a single tile."""
+        from primerlab.core.insilico import binding
+        from primerlab.core.insilico.binding import find_all_binding_sites_batch
+
+        primers = [FORWARD_PRIMER, REVERSE_PRIMER, "ACGTRYACGT"]
+        params = {"report_threshold": 50}
+        expected = find_all_binding_sites_batch(primers, TEMPLATE_SEQ, '+', params)
+        for tile in (1, 7, 64):
+            monkeypatch.setattr(binding, "SCREEN_TILE", tile)
+            assert find_all_binding_sites_batch(primers, TEMPLATE_SEQ, '+', params) == expected
+
+    def test_find_all_binding_sites_long_primer(self):
+        """Primers longer than 255 bp are screened like short ones."""
+        template = ("ACGTTGCA" * 40) + "GGGG"
+        primer = template[:300]
+        sites = find_all_binding_sites(primer, template, '+', {"report_threshold": 100})
+        assert [s.position for s in sites] == [0, 8, 16]
+
 
 class TestProductPrediction:
     """Tests for product prediction."""
@@ -277,6 +466,24 @@ class TestProductPrediction:
         if products:
             assert products[0].product_size == 196  # 206 - 10
 
+    def test_products_ranked_and_limited(self):
+        """Only in-range pairs are kept, best first, ties in input order."""
+        def binding(position, match_percent, is_valid=True):
+            return PrimerBinding(
+                primer_name="P", primer_seq="ATGCAT", strand='+', position=position,
+                match_percent=match_percent, mismatches=0, three_prime_match=6,
+                binding_tm=60, is_valid=is_valid
+            )
+
+        forward = [binding(10, 90), binding(20, 100), binding(30, 100, is_valid=False)]
+        reverse = [binding(300, 100), binding(100, 100), binding(5000, 100)]
+        params = {**DEFAULT_INSILICO_PARAMS, "product_size_max": 1000, "max_products": 2}
+
+        products = predict_products(forward, reverse, TEMPLATE_SEQ, params)
+
+        assert [(p.start_position, p.end_position) for p in products] == [(20, 306), (20, 106)]
+        assert [p.is_primary for p in products] == [True, False]
+
 
 class TestEdgeCases:
     """Tests for edge cases."""
@@ -299,6 +506,10 @@ class TestEdgeCases:
             reverse_primer=REVERSE_PRIMER.lower()
         )
         assert isinstance(result, InsilicoPCRResult)
+        upper = run_insilico_pcr(TEMPLATE_SEQ, FORWARD_PRIMER.lower(), REVERSE_PRIMER.lower())
+        assert [b.to_dict() for b in result.all_forward_bindings] == [
+            b.to_dict() for b in upper.all_forward_bindings
+        ]
     
     def test_n_in_sequence(self):
         """Should handle N bases in sequence."""
@@ -309,3 +520,32 @@ class TestEdgeCases:
             reverse_primer=REVERSE_PRIMER
         )
         assert isinstance(result, InsilicoPCRResult)
+
+
+    def test_degenerate_primer_pairs_fail_early(self):
+        """Primers longer than the template or made only of N are rejected."""
+        template = TEMPLATE_SEQ[:60]
+        result = run_insilico_pcr(template, template + "ACGT", REVERSE_PRIMER)
+        assert not result.success
+        assert result.errors == ["Primer longer than template"]
+
+        result = run_insilico_pcr(TEMPLATE_SEQ, "nnnnnnnnnnnnnnnnnnnn", REVERSE_PRIMER)
+        assert result.errors == ["Forward primer contains only N bases"]
+        assert result.all_forward_bindings == []
+
+    def test_empty_primers_fail_early(self):
+        """Empty primers are reported instead of raising."""
+        result = run_insilico_pcr(TEMPLATE_SEQ, "", REVERSE_PRIMER)
+        assert not result.success
+        assert result.errors == ["Forward primer is empty"]
+
+        result = run_insilico_pcr(TEMPLATE_SEQ, "", "")
+        assert result.errors == ["Forward primer is empty", "Reverse primer is empty"]
+
+
+    def test_identical_primers_warn(self):
+        """Identical primers are still scanned, with a warning."""
+        result = run_insilico_pcr(TEMPLATE_SEQ, FORWARD_PRIMER, FORWARD_PRIMER.lower())
+        assert not result.errors
+        assert result.all_forward_bindings
+        assert any("identical" in w for w in result.warnings)
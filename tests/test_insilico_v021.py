@@ -36,6 +36,46 @@ def test_bases_match():
     assert bases_match('S', 'G') is True
     assert bases_match('S', 'C') is True
 
+def test_iupac_masks_agree_with_bases_match():
+    """Mask AND reproduces bases_match for every IUPAC pair."""
+    from primerlab.core.sequence import IUPAC_MASK, iupac_masks
+
+    codes = "ACGTRYSWKMBDHVNacgtn"
+    for b1 in codes:
+        for b2 in codes + "-X":
+            expected = bases_match(b1, b2)
+            assert bool(IUPAC_MASK[ord(b1)] & IUPAC_MASK[ord(b2)]) is expected
+
+    assert iupac_masks("ACGTN") == bytes([1, 2, 4, 8, 15])
+    assert iupac_masks("AC-T") is None
+    assert iupac_masks("ACGÜ") is None
+
+def test_match_flags_agree_with_bases_match():
+    """match_flags gives one bases_match flag per base pair."""
+    from primerlab.core.sequence import match_flags
+
+    for seq1, seq2 in [("ACGTRN", "acgtaa"), ("AC-X", "ACGx"), ("ACGT", "AC")]:
+        expected = [bases_match(b1, b2) for b1, b2 in zip(seq1, seq2)]
+        assert [bool(f) for f in match_flags(seq1, seq2)] == expected
+
+    # Every ASCII pair, through the bytewise equality path
+    codes = [chr(i) for i in range(128)]
+    seq1 = "".join(b1 for b1 in codes for _ in codes)
+    seq2 = "".join(codes) * len(codes)
+    expected = [bases_match(b1, b2) for b1, b2 in zip(seq1, seq2)]
+    assert [bool(f) for f in match_flags(seq1, seq2)] == expected
+
+def test_calculate_match_percent_non_iupac():
+    """Non-IUPAC characters match only themselves, ignoring case."""
+    assert calculate_match_percent("AC-X", "ac-x") == (100.0, 0, 4)
+    assert calculate_match_percent("ACGT", "ACG-") == (75.0, 1, 0)
+
+def test_analyze_binding_non_iupac_characters():
+    """Non-IUPAC characters still match only themselves."""
+    site = analyze_binding("AC-GT", "AC-GA", position=0, strand='+')
+    assert site.alignment_str == "||||x"
+    assert site.match_count == 4
+
 def test_calculate_match_percent_iupac():
     """Verify IUPAC aware match calculation."""
     # R (A/G) vs A -> Match
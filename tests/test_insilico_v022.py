@@ -96,6 +96,14 @@ class TestAmpliconFasta:
             assert "size=" in fasta
             assert "pos=" in fasta
             assert "likelihood=" in fasta
+
+    def test_fasta_wraps_at_60(self, insilico_result):
+        """Sequences should be wrapped into 60-base lines."""
+        for product in insilico_result.products:
+            product.product_sequence = "ACGT" * 40
+        fasta = generate_amplicon_fasta(insilico_result)
+        for record in fasta.split(">")[1:]:
+            assert record.split("\n")[1:] == ["ACGT" * 15, "ACGT" * 15, "ACGT" * 10]
     
     def test_fasta_saves_to_file(self, insilico_result):
         """Should save to file when output_dir provided."""
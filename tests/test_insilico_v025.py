@@ -44,6 +44,20 @@ class TestPrimerDimerCheck:
         if result["severity"] != "none":
             assert result["warning"] is not None
 
+    def test_check_primer_dimer_regions(self):
+        """Regions report each complementary run by its forward-primer span."""
+        # Reverse complement of "TTTTT" -> "AAAAA", aligned with fwd[3:8]
+        result = check_primer_dimer("GCGAAAAAGCG", "TTTTT", min_complementary=5)
+        assert result["max_complementary"] == 5
+        assert result["dimer_regions"] == [
+            {"fwd_start": 3, "fwd_end": 8, "length": 5, "type": "internal"}
+        ]
+
+    def test_check_primer_dimer_non_iupac(self):
+        """Non-IUPAC characters fall back to per-base matching."""
+        result = check_primer_dimer("GC-AAAAAGC", "TTTTT", min_complementary=5)
+        assert result["dimer_regions"][0]["fwd_start"] == 3
+        assert result["max_complementary"] == 5
 
 class TestExtensionTime:
     """Tests for extension time calculation."""
@@ -73,6 +73,17 @@ class TestRegionMasker:
         
         assert len(masks) == 0
     
+    def test_lowercase_run_boundaries(self, masker):
+        """Short runs are skipped and a run may end the sequence."""
+        sequence = "acGTacgtacGTacg"
+
+        masks = masker.detect_lowercase_masks(sequence, min_length=3)
+        assert [(m.start, m.end) for m in masks] == [(4, 10), (12, 15)]
+
+        # Non-ASCII input keeps str.islower semantics
+        masks = masker.detect_lowercase_masks("ATéacgT", min_length=3)
+        assert [(m.start, m.end) for m in masks] == [(2, 6)]
+
     def test_detect_n_masks(self, masker):
         """Test N-masked region detection."""
         sequence = "ATGCATGCNNNNNNNNNNNATGCATGC"
@@ -110,6 +121,17 @@ class TestRegionMasker:
         )
         
         assert len(masks) >= 1  # May merge overlapping
+
+    def test_analyze_sequence_matches_detectors(self, masker):
+        """The shared-buffer scan finds what the separate detectors find."""
+        sequence = "ACGTacgtaCGTNNnnNACGTnnnACGTACGTggcc"
+
+        masks = masker.analyze_sequence(sequence, detect_lowercase=False, min_length=3)
+        assert [(m.start, m.end) for m in masks] == [(12, 17), (21, 24)]
+
+        masks = masker.analyze_sequence(sequence, detect_n=False, min_length=3)
+        expected = masker.detect_lowercase_masks(sequence, min_length=3)
+        assert [(m.start, m.end) for m in masks] == [(m.start, m.end) for m in expected]
     
     def test_merge_overlapping(self, masker):
         """Test overlapping region merging."""
@@ -127,6 +149,27 @@ class TestRegionMasker:
         assert merged[0].start == 10
         assert merged[0].end == 40  # Extended
     
+    def test_query_overlapping_masks(self, masker):
+        """query() returns the analyzed masks overlapping a window."""
+        sequence = "ACGTacgtacGTACNNNNNACGTACGTacgtac"
+        masker.analyze_sequence(sequence, min_length=3)
+
+        assert [(m.start, m.end) for m in masker.query(0, 40)] == [(4, 10), (14, 19), (27, 33)]
+        assert [(m.start, m.end) for m in masker.query(9, 15)] == [(4, 10), (14, 19)]
+        assert masker.query(10, 14) == []
+        assert masker.query(19, 27) == []
+
+    def test_query_tracks_manual_regions(self, masker):
+        """query() sees manual regions before and after analysis."""
+        masker.add_manual_region(100, 150, "user")
+        assert [(m.start, m.end) for m in masker.query(0, 200)] == [(100, 150)]
+
+        masker.analyze_sequence("ACGTacgtacGT", min_length=3)
+        masker.add_manual_region(8, 20, "user")
+        assert [(m.start, m.end, m.reason) for m in masker.query(0, 200)] == [
+            (4, 20, "merged"), (100, 150, "user")
+        ]
+
     def test_add_manual_region(self, masker):
         """Test adding manual excluded region."""
         masker.add_manual_region(100, 150, "user_excluded")
@@ -212,6 +255,21 @@ class TestApplyMasksToConfig:
         
         assert len(result["parameters"]["excluded_regions"]) == 2
     
+    def test_apply_prunes_outside_included_region(self):
+        """Masks outside the included region are not passed on."""
+        from primerlab.core.masking import apply_masks_to_config, RegionMask
+
+        config = {"parameters": {"included_region": {"start": 40, "length": 40}}}
+        masks = [
+            RegionMask(10, 30, "repeat"),
+            RegionMask(30, 50, "repeat"),
+            RegionMask(80, 90, "n_masked")
+        ]
+
+        result = apply_masks_to_config(config, masks)
+
+        assert result["parameters"]["excluded_regions"] == [(30, 20)]
+
     def test_apply_empty_masks(self):
         """Test applying empty masks list."""
         from primerlab.core.masking import apply_masks_to_config
@@ -103,6 +103,7 @@ class TestInsilicoModelSerialization:
         assert result["position"] == 50
         assert result["match_percent"] == 100.0
         assert result["is_valid"] is True
+        assert not hasattr(site, "__dict__")
 
     def test_primer_binding_to_dict(self):
         """Test PrimerBinding.to_dict() method."""